@@ -0,0 +1,186 @@
+# coding=utf-8
+"""
+A headless entry point for Pi-MFD that runs a scripted, repeatable benchmark across the major pages using fixture data
+instead of network services. Results are printed as JSON and optionally written to a file so they can be compared across
+commits and machines.
+"""
+import argparse
+import json
+import os
+import tempfile
+import traceback
+
+# This must happen before pygame initializes the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from PiMFD.Applications.Navigation.MapContexts import MapZooms
+from PiMFD.Benchmarking import BenchmarkRunner, benchmark_overlays, benchmark_map_parsing, write_map_fixture, \
+    benchmark_projection, SlowMapSource, FixtureMapSource
+from PiMFD.Controller import MFDController
+from PiMFD.Options import MFDAppOptions
+from PiMFD.UI import Keycodes
+from PiMFD.UI.DisplayManager import DisplayManager
+
+
+__author__ = 'Matt Eland'
+
+
+def run_benchmark(args):
+    """
+    Boots the controller headlessly and runs the benchmark
+    :param args: The parsed command line arguments
+    :return: The benchmark results
+    """
+
+    # Use default options rather than settings.ini so results don't depend on the local configuration
+    app_options = MFDAppOptions()
+
+    display = DisplayManager(args.width, args.height)
+    BenchmarkRunner.prepare(display, app_options)
+
+    display.options = app_options
+    display.init_graphics(app_options)
+
+    controller = MFDController(display, app_options)
+
+    runner = BenchmarkRunner(controller)
+    runner.frames_per_page = args.frames
+    runner.use_fixtures()
+
+    try:
+        return runner.run(pages=args.pages)
+    finally:
+        controller.shutdown()
+
+
+def run_panning_benchmark(args):
+    """
+    Measures how long the map takes to catch up after panning with map data that arrives as slowly as it would from a
+    map server
+    :param args: The parsed command line arguments
+    :return: The benchmark results
+    """
+
+    app_options = MFDAppOptions()
+
+    display = DisplayManager(args.width, args.height)
+    BenchmarkRunner.prepare(display, app_options)
+
+    display.options = app_options
+    display.init_graphics(app_options)
+
+    controller = MFDController(display, app_options)
+    controller.nav_app.data_provider.map_context.map_zoom = MapZooms.large
+
+    map_source = SlowMapSource(FixtureMapSource(), args.latency, args.bandwidth * 1024)
+
+    runner = BenchmarkRunner(controller)
+    runner.use_fixtures(map_source)
+
+    # Around a block and back again
+    keys = [Keycodes.KEY_RIGHT, Keycodes.KEY_RIGHT, Keycodes.KEY_DOWN, Keycodes.KEY_LEFT, Keycodes.KEY_LEFT,
+            Keycodes.KEY_UP] * args.pans
+
+    try:
+        results = runner.run_panning(keys, map_source)
+        results['latency_ms'] = args.latency * 1000
+        results['bandwidth_kb'] = args.bandwidth
+        return {'panning': results}
+    finally:
+        controller.shutdown()
+
+
+def run_overlay_benchmark(args):
+    """
+    Measures overlay rendering on its own at several resolutions. No controller is needed for this.
+    :param args: The parsed command line arguments
+    :return: The benchmark results
+    """
+
+    results = []
+
+    for resolution in args.resolutions:
+        width, height = [int(value) for value in resolution.split('x')]
+
+        app_options = MFDAppOptions()
+
+        display = DisplayManager(width, height)
+        BenchmarkRunner.prepare(display, app_options)
+
+        display.options = app_options
+        display.init_graphics(app_options)
+
+        results.append(benchmark_overlays(display, args.frames))
+
+    return {'overlays': results}
+
+
+def run_map_parsing_benchmark(args):
+    """
+    Compares map parsers on saved map data. A fixture covering the largest zoom level is generated if no files are given.
+    :param args: The parsed command line arguments
+    :return: The benchmark results
+    """
+
+    if args.map_files:
+        return benchmark_map_parsing(args.map_files)
+
+    app_options = MFDAppOptions()
+    filename = os.path.join(tempfile.gettempdir(), 'pimfd_benchmark_map_data.xml')
+    write_map_fixture(filename, app_options.lat, app_options.lng, MapZooms.large)
+
+    try:
+        return benchmark_map_parsing([filename])
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Benchmarks Pi-MFD pages headlessly')
+    parser.add_argument('--frames', type=int, default=120, help='Frames to measure on each page')
+    parser.add_argument('--width', type=int, default=800, help='Display width')
+    parser.add_argument('--height', type=int, default=480, help='Display height')
+    parser.add_argument('--pages', nargs='*', help='Names of pages to benchmark (default is all)')
+    parser.add_argument('--output', help='A file to write JSON results to')
+    parser.add_argument('--overlays', action='store_true', help='Benchmark overlay rendering instead of pages')
+    parser.add_argument('--resolutions', nargs='*', default=['800x480', '1920x1080'],
+                        help='Resolutions to benchmark overlays at, as WIDTHxHEIGHT')
+    parser.add_argument('--map-parsing', action='store_true', help='Benchmark map parsing instead of pages')
+    parser.add_argument('--map-files', nargs='*', help='Saved map data to parse, such as map_data.xml')
+    parser.add_argument('--projection', action='store_true', help='Benchmark map projection instead of pages')
+    parser.add_argument('--vertices', nargs='*', type=int, default=[10000, 100000, 1000000],
+                        help='Numbers of line points to project')
+    parser.add_argument('--panning', action='store_true', help='Benchmark how long the map takes to load after panning')
+    parser.add_argument('--pans', type=int, default=2, help='Times to pan around a block')
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds the map server takes to answer')
+    parser.add_argument('--bandwidth', type=int, default=1024, help='Map download speed in KB per second')
+    args = parser.parse_args()
+
+    try:
+        if args.overlays:
+            results = run_overlay_benchmark(args)
+        elif args.map_parsing:
+            results = run_map_parsing_benchmark(args)
+        elif args.projection:
+            results = benchmark_projection(args.vertices)
+        elif args.panning:
+            results = run_panning_benchmark(args)
+        else:
+            results = run_benchmark(args)
+
+        output = json.dumps(results, indent=2, sort_keys=True)
+        print(output)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(output)
+
+    except:
+        print("Unhandled error {0}\n".format(str(traceback.format_exc())))
+        raise
+
+    finally:
+        import pygame
+        pygame.quit()
@@ -19,6 +19,9 @@ try:
     app_options.save_to_settings()
     app_options.save_map_to_disk = False
 
+    # Only push changed regions of the screen to the framebuffer
+    app_options.enable_dirty_rects = True
+
     # We really need to conserve space here
     app_options.font_scaling = 7
     app_options.min_font_size = 8
@@ -4,9 +4,7 @@
 This file contains a definition for the ANI application
 """
 from PiMFD.Applications.ANI.ANIDataProvider import ANIDataProvider
-from PiMFD.Applications.ANI.DataCategoriesPage import DataCategoriesPage
-from PiMFD.Applications.Application import MFDApplication
-from PiMFD.Applications.PlaceholderPage import SimpleMessagePage
+from PiMFD.Applications.Application import MFDApplication, LazyPage
 
 __author__ = 'Matt Eland'
 
@@ -23,8 +21,8 @@ class ANIApplication(MFDApplication):
         
         self.data_provider = ANIDataProvider("ANI Data Provider")
 
-        self.data_page = DataCategoriesPage(controller, self)
-        self.options_page = SimpleMessagePage(controller, self, "OPTS")
+        self.data_page = LazyPage(self, "DATA", 'PiMFD.Applications.ANI.DataCategoriesPage', 'DataCategoriesPage')
+        self.options_page = LazyPage(self, "OPTS", 'PiMFD.Applications.PlaceholderPage', 'SimpleMessagePage', "OPTS")
 
     def handle_reselected(self):
         super(ANIApplication, self).handle_reselected()
@@ -40,7 +38,7 @@ class ANIApplication(MFDApplication):
 
     def get_buttons(self):
         
-        if self.active_page in [self.data_page, self.options_page, None] or not self.active_page:
+        if self.active_page in [self.data_page.page, self.options_page.page, None] or not self.active_page:
             return [self.data_page.get_button(), self.options_page.get_button()]
         else:
             return self.active_page.get_lower_buttons()
@@ -16,8 +16,5 @@ class ANIDataProvider(DataProvider):
     def __init__(self, name):
         super(ANIDataProvider, self).__init__(name)
 
-    def get_dashboard_widgets(self, display, page):
-        return None
-
     def update(self, now):
         super(ANIDataProvider, self).update(now)
\ No newline at end of file
@@ -6,6 +6,7 @@ This file contains a definition for the data categories page
 from PiMFD.Applications.MFDPage import MFDPage
 from PiMFD.UI.Panels import StackPanel
 from PiMFD.UI.Widgets.MenuItem import TextMenuItem
+from PiMFD.UI.Widgets.VirtualList import VirtualListPanel
 
 __author__ = 'Matt Eland'
 
@@ -17,6 +18,7 @@ class DataPage(MFDPage):
         self.data_page_provider = data_page_provider
         self.lbl_header = self.get_header_label(data_page_provider.name)
         self.pnl_data = StackPanel(controller.display, self)
+        self.lst_data = VirtualListPanel(controller.display, self, list())
 
         self.refresh_children()
 
@@ -40,6 +42,21 @@ class DataPage(MFDPage):
         if len(self.pnl_data.children) > 0:
             self.set_focus(self.pnl_data.children[0])
 
+    def show_rows(self, rows, get_text):
+        """
+        Displays a potentially very large set of rows in a virtualized list instead of using a widget per row
+        :param rows: The rows to display
+        :param get_text: A function that takes a row and returns the text to display for it
+        """
+
+        self.lst_data.source = rows
+        self.lst_data.get_text = get_text
+        self.pnl_data.children = [self.lst_data]
+
+        if rows:
+            self.set_focus(self.lst_data)
+            self.lst_data.select(0)
+
 
 
 class DataCategoriesPage(MFDPage):
@@ -2,11 +2,65 @@
 """
 Contains core application definition and placeholders.
 """
+from importlib import import_module
+
+from PiMFD.Startup import startup_profiler
 from PiMFD.UI.Button import MFDButton
 
 __author__ = 'Matt Eland'
 
 
+class LazyPage(object):
+    """
+    Stands in for a page until the page is first selected so applications don't need to build all of their pages when
+    they start. The module defining the page isn't imported until then either, which keeps the libraries it depends on
+    out of startup.
+    :type application: MFDApplication The application the page belongs to
+    :param button_text: The text to show on the page's button until the page is built
+    :param module_name: The full name of the module defining the page
+    :param class_name: The name of the page class. It will be built with the controller, the application and args.
+    """
+    page = None
+    button = None
+
+    def __init__(self, application, button_text, module_name, class_name, *args):
+        super(LazyPage, self).__init__()
+
+        self.application = application
+        self.button_text = button_text
+        self.module_name = module_name
+        self.class_name = class_name
+        self.args = args
+
+    def get_page(self):
+        """
+        Gets the page, building it the first time this is called
+        :rtype: PiMFD.Applications.MFDPage.MFDPage
+        """
+
+        if self.page is None:
+            with startup_profiler.measure('page', self.class_name):
+                page_class = getattr(import_module(self.module_name), self.class_name)
+                self.page = page_class(self.application.controller, self.application, *self.args)
+
+        return self.page
+
+    def get_button(self):
+        """
+        Gets the page's button without building the page
+        :return: The page's button
+        """
+
+        if self.page is not None:
+            return self.page.get_button()
+
+        # A page that hasn't been built can't be the active page
+        if not self.button:
+            self.button = MFDButton(self.button_text)
+
+        return self.button
+
+
 class MFDApplication(object):
     """
     An abstract class representing the base of all applications.
@@ -18,6 +72,7 @@ class MFDApplication(object):
     controller = None
     display = None
     always_render_background = True
+    app_button = None
 
     def __init__(self, controller):
         """
@@ -26,21 +81,123 @@ class MFDApplication(object):
         self.controller = controller
         self.display = controller.display
         self.pages = list()
+        self.page_cache_versions = dict()
 
     def initialize(self):
         pass
 
+    def add_boot_steps(self, boot):
+        """
+        Adds the work needed to start the application to the staged boot. By default the application is initialized on
+        the main thread after the first frame.
+        :type boot: PiMFD.Booting.BootSequence
+        """
+        boot.add_step(self.get_button_text(), self.initialize)
+
     def get_buttons(self):
         """
         Gets the page buttons associated with the application.
         :return: the page buttons associated with the application.
         """
-        buttons = list()
-        for page in self.pages[0:self.controller.max_page_buttons]:  # TODO: Support paging for > max_page_buttons pages
-            button = MFDButton(page.get_button_text(), selected=(self.active_page is page))
-            buttons.append(button)
+        # TODO: Support paging for > max_page_buttons pages
+        return [page.get_button() for page in self.pages[0:self.controller.max_page_buttons]]
 
-        return buttons
+    def get_app_button(self):
+        """
+        Gets the button representing the application in the top row, updated for the application's current state.
+        :return: the button representing the application
+        """
+        # Construct Button as needed
+        if not self.app_button:
+            self.app_button = MFDButton(self.get_button_text())
+        else:
+            self.app_button.text = self.get_button_text()
+
+        self.app_button.selected = self.controller.active_app is self
+
+        return self.app_button
+
+    def get_data_providers(self):
+        """
+        Gets the data providers the application's pages display data from
+        :return: A list of data providers
+        """
+        provider = getattr(self, 'data_provider', None)
+        if provider:
+            return [provider]
+
+        return []
+
+    def render_cached_page(self, page):
+        """
+        Shows the last rendering of a page at its current scroll position if nothing the page depends on has changed
+        since. This lets switching to a recently viewed page show something immediately while the page is arranged and
+        rendered live on the next frame.
+        :type page: PiMFD.Applications.MFDPage.MFDPage
+        :return: True if a cached rendering was shown; otherwise False
+        """
+
+        key = page, page.page_y
+        if self.page_cache_versions.get(key) != page.get_cache_version():
+            return False
+
+        surface = self.display.page_cache.get(key)
+        if surface is None:
+            return False
+
+        self.display.surface.blit(surface, (0, 0))
+        self.display.track_draw(self.display.surface, surface.get_rect(), 'page', id(page), page.page_y,
+                                page.get_cache_version())
+        return True
+
+    def cache_page(self, page, render_time):
+        """
+        Keeps a copy of a page that was just rendered unless an up to date copy is already cached. This should be
+        called after the page renders and before anything else is drawn over it. Pages that render faster than a copy
+        could be shown aren't cached.
+        :type page: PiMFD.Applications.MFDPage.MFDPage
+        :param render_time: The seconds it took to arrange and render the page
+        """
+
+        cache = self.display.page_cache
+        if cache.max_bytes <= 0:
+            return
+
+        key = page, page.page_y
+
+        if render_time * 1000 < self.controller.options.page_cache_min_render_ms:
+            self.page_cache_versions.pop(key, None)
+            return
+        version = page.get_cache_version()
+        surface = cache.peek(key)
+        if surface is not None and self.page_cache_versions.get(key) == version:
+            return
+
+        # Reuse the out of date copy's surface rather than allocating a new one
+        if surface is not None and surface.get_size() == self.display.surface.get_size():
+            surface.blit(self.display.surface, (0, 0))
+        else:
+            surface = self.display.surface.copy()
+
+        cache.add(key, surface)
+        self.page_cache_versions[key] = version
+
+        # Forget versions of renderings that have been evicted so old pages can be collected
+        for old_key in [k for k in self.page_cache_versions if not cache.contains(k)]:
+            del self.page_cache_versions[old_key]
+
+    @staticmethod
+    def get_page(page):
+        """
+        Gets a page, building it first if it is a LazyPage that hasn't been selected before
+        :type page: PiMFD.Applications.MFDPage.MFDPage or LazyPage or None
+        :rtype: PiMFD.Applications.MFDPage.MFDPage or None
+        """
+
+        if isinstance(page, LazyPage):
+            return page.get_page()
+
+        return page
 
     def get_default_page(self):
         """
@@ -100,9 +257,11 @@ class MFDApplication(object):
     def select_page(self, page):
         """
         Selects the specified page
-        :type page: PiMFD.Applications.MFDPage.MFDPage or None
+        :type page: PiMFD.Applications.MFDPage.MFDPage or LazyPage or None
         """
 
+        page = self.get_page(page)
+
         # Don't allow switching to a "none" page
         if page is None:
             return
@@ -1,10 +1,7 @@
 # coding=utf-8
-from PiMFD.Applications.Application import MFDApplication
+from PiMFD.Applications.Application import MFDApplication, LazyPage
 from PiMFD.Applications.Core.CoreDataProvider import CoreDataProvider
-from PiMFD.Applications.Core.CorePages import SysExitPage
 from PiMFD.Applications.Core.DashboardPages import DashboardPage
-from PiMFD.Applications.Core.SettingsPage import SettingsPage
-from PiMFD.Applications.Core.SystemInfoPage import SysInfoPage
 
 __author__ = 'Matt Eland'
 
@@ -27,9 +24,9 @@ class CoreApplication(MFDApplication):
         self.data_provider = CoreDataProvider(self)
 
         self.dash_page = DashboardPage(controller, self, self.data_provider)
-        self.sys_info_page = SysInfoPage(controller, self)
-        self.opts_page = SettingsPage(controller, self)
-        self.exit_page = SysExitPage(controller, self)
+        self.sys_info_page = LazyPage(self, 'INFO', 'PiMFD.Applications.Core.SystemInfoPage', 'SysInfoPage')
+        self.opts_page = LazyPage(self, 'OPTS', 'PiMFD.Applications.Core.SettingsPage', 'SettingsPage')
+        self.exit_page = LazyPage(self, 'EXIT', 'PiMFD.Applications.Core.CorePages', 'SysExitPage')
 
         self.pages = list([self.dash_page, self.sys_info_page, self.opts_page, self.exit_page])
 
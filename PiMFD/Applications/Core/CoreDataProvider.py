@@ -37,7 +37,15 @@ class CoreDataProvider(DataProvider):
 
         self.system_time = strftime(self.time_format)
 
-    def get_dashboard_widgets(self, display, page):
+        # Only publish when something shown on the dashboard has changed. Pygame only recalculates FPS every few ticks.
+        if self.dashboard and (self.system_time != self.time_widget.value or
+                               self.dashboard_display.clock.get_fps() != self.fps_widget.value):
+            self.update_dashboard()
+
+    def update_dashboard(self):
+
+        display = self.dashboard_display
+        page = self.dashboard_page
 
         if not self.time_widget:
             # Build out the widget
@@ -67,14 +75,19 @@ class CoreDataProvider(DataProvider):
         else:
             self.fps_widget.value = fps
             
-        # Calculate Status of FPS. Keep in mind that we can target 30 or 60 FPS depending on platform
+        # Calculate Status of FPS. Keep in mind that we can target 30 or 60 FPS depending on platform and will drop to a
+        # much lower rate while idle. A target of 0 means we're running as fast as we can.
+        target_fps = display.frame_scheduler.target_frames_per_second
         if fps <= 0:
             self.fps_widget.status = DashboardStatus.Inactive
-        elif fps <= (display.frames_per_second * 0.5):
+        elif target_fps <= 0:
+            self.fps_widget.status = DashboardStatus.Passive
+        elif fps <= (target_fps * 0.5):
             self.fps_widget.status = DashboardStatus.Critical
-        elif fps <= (display.frames_per_second - 5):
+        elif fps <= (target_fps - 5):
             self.fps_widget.status = DashboardStatus.Caution
         else:
             self.fps_widget.status = DashboardStatus.Passive
-        
-        return [self.time_widget, self.fps_widget]
\ No newline at end of file
+
+        self.dashboard.show(self.time_widget)
+        self.dashboard.show(self.fps_widget)
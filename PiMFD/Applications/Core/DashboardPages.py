@@ -4,6 +4,7 @@
 This file contains dashboard pages
 """
 from PiMFD.Applications.MFDPage import MFDPage
+from PiMFD.DashboardModel import DashboardModel
 from PiMFD.UI.Panels import WrapPanel
 
 __author__ = 'Matt Eland'
@@ -21,6 +22,12 @@ class DashboardPage(MFDPage):
 
         self.time_data_provider = time_data_provider
 
+        # Providers publish their tiles to the model as their data changes
+        self.model = DashboardModel()
+        self.model.subscribe(self.handle_dashboard_event)
+        self.attached_providers = list()
+        self.changed_widgets = dict()
+
         self.panel.children = [self.pnl_alerts]
 
     def get_button_text(self):
@@ -30,16 +37,52 @@ class DashboardPage(MFDPage):
         """
         return "HOME"
 
+    def get_data_providers(self):
+        return self.controller.data_providers
+
+    def attach_providers(self):
+        """
+        Attaches the dashboard to any data providers that have been registered since the last check
+        """
+
+        if len(self.attached_providers) == len(self.controller.data_providers):
+            return
+
+        for provider in self.controller.data_providers:
+            if provider not in self.attached_providers:
+                self.attached_providers.append(provider)
+                provider.attach_dashboard(self.model, self.display, self)
+
+    def handle_dashboard_event(self, event, widget):
+        """
+        Responds to a tile being shown, hidden, moved or changed
+        :param event: The type of event from DashboardModel
+        :type widget: PiMFD.UI.Widgets.DashboardWidget.DashboardWidget
+        """
+
+        self.invalidate_cache()
+
+        # Newly shown tiles may have changed while they were hidden
+        if event in (DashboardModel.added, DashboardModel.changed):
+            self.changed_widgets[id(widget)] = widget
+
+        if event != DashboardModel.changed:
+            self.pnl_alerts.children = list(self.model.get_widgets())
+
     def arrange(self):
 
-        # Get the widgets from the data provider
-        self.pnl_alerts.children = []
-        if self.controller.data_providers:
-            for provider in self.controller.data_providers:
-                widgets = provider.get_dashboard_widgets(self.display, self)
-                if widgets:
-                    for widget in widgets:
-                        if widget:
-                            self.pnl_alerts.children.append(widget)
-
-        return super(DashboardPage, self).arrange()
\ No newline at end of file
+        self.attach_providers()
+
+        # Changed tiles are arranged on their own. The panel only needs to arrange again if a tile's size changed.
+        if self.changed_widgets:
+            for widget in self.changed_widgets.values():
+                size = widget.desired_size
+                widget.invalidate_layout()
+                widget.arrange()
+
+                if widget.desired_size != size:
+                    self.pnl_alerts.invalidate_layout()
+
+            self.changed_widgets.clear()
+
+        return super(DashboardPage, self).arrange()
@@ -110,7 +110,7 @@ class SettingsPage(MFDPage):
             
         elif widget is self.ddl_color_scheme:
             opts.color_scheme = str(widget.value)
-            self.display.color_scheme = widget.value
+            self.display.set_color_scheme(widget.value)
 
         # Persist to disk
         opts.save_to_settings()
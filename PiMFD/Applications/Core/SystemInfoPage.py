@@ -3,6 +3,7 @@
 import platform
 
 from PiMFD.Applications.MFDPage import MFDPage
+from PiMFD.UI.Panels import StackPanel
 from PiMFD.UI.Text import SpacerLine
 
 
@@ -25,6 +26,8 @@ class SysInfoPage(MFDPage):
         self.lbl_sys_net_id = self.get_list_label("Net ID: {}")
         self.lbl_sys_display = self.get_list_label("  Disp: {}x{}")
         self.lbl_sys_python = self.get_list_label("Python: {} {} {}")
+        self.lbl_providers_header = self.get_header_label("Data Providers")
+        self.pnl_providers = StackPanel(self.display, self)
 
         self.panel.children = (
             self.lbl_app_header,
@@ -35,7 +38,10 @@ class SysInfoPage(MFDPage):
             self.lbl_sys_name,
             self.lbl_sys_net_id,
             self.lbl_sys_display,
-            self.lbl_sys_python
+            self.lbl_sys_python,
+            SpacerLine(self.display, self),
+            self.lbl_providers_header,
+            self.pnl_providers
         )
 
     def get_button_text(self):
@@ -57,4 +63,13 @@ class SysInfoPage(MFDPage):
         self.lbl_sys_display.text_data = self.display.bounds.right, self.display.bounds.bottom
         self.lbl_sys_python.text_data = platform.python_version(), platform.python_implementation(), platform.python_compiler()
 
+        # Show how expensive each provider's background refresh is, worst offenders first
+        stats = self.controller.provider_scheduler.get_stats()
+        while len(self.pnl_providers.children) < len(stats):
+            self.pnl_providers.children.append(self.get_list_label("{}"))
+
+        self.pnl_providers.children = self.pnl_providers.children[:len(stats)]
+        for label, provider_stats in zip(self.pnl_providers.children, stats):
+            label.text_data = str(provider_stats)
+
         return super(SysInfoPage, self).arrange()
@@ -39,6 +39,8 @@ class MFDPage(UIPage):
     max_y = 500
     page_size_y = 400
 
+    cache_version = 0  # Incremented when something other than provider data changes how the page looks
+
     def __init__(self, controller, application, auto_scroll=True):
         """
 
@@ -71,6 +73,26 @@ class MFDPage(UIPage):
             
         return self.page_button
 
+    def get_data_providers(self):
+        """
+        Gets the data providers whose updates change how the page looks
+        :return: A list of data providers
+        """
+        return self.application.get_data_providers()
+
+    def get_cache_version(self):
+        """
+        Gets a value that changes whenever a cached rendering of the page would be out of date
+        :rtype: tuple
+        """
+        return (self.cache_version,) + tuple([provider.data_version for provider in self.get_data_providers()])
+
+    def invalidate_cache(self):
+        """
+        Flags any cached rendering of the page as out of date
+        """
+        self.cache_version += 1
+
     def handle_lower_button(self, index):
         return False
 
@@ -222,6 +244,12 @@ class MFDPage(UIPage):
 
     def handle_key(self, key):
 
+        is_paging_key = key in (Keycodes.KEY_PAGEDOWN, Keycodes.KEY_KP3, Keycodes.KEY_PAGEUP, Keycodes.KEY_KP9)
+
+        # Let lists page through their own rows so their selection moves with the page
+        if is_paging_key and self.focus and self.focus.handle_key(key):
+            return True
+
         if key in (Keycodes.KEY_PAGEDOWN, Keycodes.KEY_KP3):
             if self.num_pages_y > self.page_y:
                 self.page_y += 1
@@ -243,23 +271,29 @@ class MFDPage(UIPage):
             
         if widget:
             
-            y = widget.pos[1]
-            
             # Ensure we can see the widget
-            if y < self.min_y:
-                while y < self.min_y:
-                    self.page_y -= 1
-                    y += self.page_size_y
-            else:
-                while y > self.max_y:
-                    self.page_y += 1
-                    y -= self.page_size_y
-                
-            # Ensure we didn't somehow get lost
-            self.constrain_pages()
+            self.scroll_to(widget.pos[1])
             
         return super(MFDPage, self).set_focus(widget)
 
+    def scroll_to(self, y):
+        """
+        Pages up or down as needed so that content at the specified y coordinate is visible
+        :param y: The y coordinate as of the last arrange
+        """
+
+        if y < self.min_y:
+            while y < self.min_y:
+                self.page_y -= 1
+                y += self.page_size_y
+        else:
+            while y > self.max_y:
+                self.page_y += 1
+                y -= self.page_size_y
+
+        # Ensure we didn't somehow get lost
+        self.constrain_pages()
+
     def center_text(self, text, color=None):
         if not color:
             color = self.display.color_scheme.highlight
@@ -0,0 +1,181 @@
+# coding=utf-8
+
+"""
+Contains an on-disk cache of parsed map areas so revisited areas load without the network
+"""
+import cPickle
+import os
+import time
+import traceback
+
+__author__ = 'Matt Eland'
+
+
+class CachedMapArea(object):
+    """
+    A parsed map area loaded from the map cache
+    :param fetched: When the area was downloaded, in seconds since the epoch
+    :type store: PiMFD.Applications.Navigation.MapStorage.MapStore
+    :param shapes: The map's shapes
+    """
+
+    def __init__(self, fetched, store, shapes):
+        super(CachedMapArea, self).__init__()
+
+        self.fetched = fetched
+        self.store = store
+        self.shapes = shapes
+
+    def get_age(self):
+        """
+        :return: The number of seconds since the area was downloaded
+        """
+        return time.time() - self.fetched
+
+
+class MapCache(object):
+    """
+    Keeps parsed map areas on disk, one file per area. Areas older than the time to live are still returned so there's
+    something to show while they're downloaded again. When the files take up more than the size limit the least
+    recently used ones are removed.
+    :param directory: The directory to keep cached areas in
+    :param ttl: The number of seconds an area is fresh for
+    :param max_bytes: The most disk space cached areas can take up
+    :param grid_size: Area bounds are rounded to a multiple of this many degrees to build keys
+    """
+
+    version = 1  # Increase this when the cached format changes so old files are ignored
+
+    def __init__(self, directory, ttl, max_bytes, grid_size):
+        super(MapCache, self).__init__()
+
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.grid_size = grid_size
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_key(self, bounds):
+        """
+        Builds the key for an area. The bounds are rounded to the grid so the same area always gets the same key.
+        :param bounds: min lng, min lat, max lng, max lat
+        :return: A string suitable for use in a filename
+        """
+        return 'map_{}_{}_{}_{}'.format(*[int(round(value / self.grid_size)) for value in bounds])
+
+    def get_filename(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def is_stale(self, area):
+        """
+        :type area: CachedMapArea
+        :return: True if the area should be downloaded again
+        """
+        return area.get_age() > self.ttl
+
+    def load(self, key):
+        """
+        Loads a cached area and marks it as recently used
+        :param key: The area's key
+        :rtype: CachedMapArea or None if it isn't cached
+        """
+
+        filename = self.get_filename(key)
+        if not os.path.exists(filename):
+            self.misses += 1
+            return None
+
+        try:
+            with open(filename, 'rb') as f:
+                data = cPickle.load(f)
+
+            if data.get('version') != self.version:
+                self.misses += 1
+                return None
+
+            # The modification time tracks when each area was last used so the least recently used can be evicted
+            os.utime(filename, None)
+
+        except:
+            error_message = "Unhandled error reading cached map {0}\n".format(str(traceback.format_exc()))
+            print(error_message)
+            self.misses += 1
+            return None
+
+        area = CachedMapArea(data['fetched'], data['store'], data['shapes'])
+
+        if self.is_stale(area):
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+
+        return area
+
+    def save(self, key, store, shapes):
+        """
+        Saves a parsed area and removes old areas if the cache is over its size limit
+        :param key: The area's key
+        :type store: PiMFD.Applications.Navigation.MapStorage.MapStore
+        :param shapes: The map's shapes. These should be saved before they're projected so screen data isn't saved.
+        """
+
+        filename = self.get_filename(key)
+        temp_filename = filename + '.tmp'
+
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+
+            # Write somewhere else first so a half written file is never read
+            with open(temp_filename, 'wb') as f:
+                cPickle.dump({'version': self.version, 'fetched': time.time(), 'store': store, 'shapes': shapes}, f,
+                             cPickle.HIGHEST_PROTOCOL)
+
+            if os.path.exists(filename):
+                os.remove(filename)
+            os.rename(temp_filename, filename)
+
+        except:
+            error_message = "Unhandled error saving map to cache {0}\n".format(str(traceback.format_exc()))
+            print(error_message)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used areas until the cache fits within its size limit
+        """
+
+        try:
+            files = []
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    path = os.path.join(self.directory, name)
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum([size for used, size, path in files])
+
+            for used, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+
+        except:
+            error_message = "Unhandled error cleaning up map cache {0}\n".format(str(traceback.format_exc()))
+            print(error_message)
+
+    def get_stats_text(self):
+        """
+        :return: A line of text describing the cache's effectiveness
+        """
+        return 'Map Cache: {} hits, {} stale, {} misses, {} evicted'.format(self.hits, self.stale_hits, self.misses,
+                                                                            self.evictions)
@@ -6,7 +6,6 @@ This file contains a data page provider for map information
 from PiMFD.Applications.ANI.DataCategoriesPage import DataPage
 from PiMFD.Applications.ANI.DataPageProvider import DataPageProvider
 from PiMFD.UI.Button import MFDButton
-from PiMFD.UI.Widgets.MenuItem import TextMenuItem
 
 __author__ = 'Matt Eland'
 
@@ -50,19 +49,10 @@ class MapNodesDataPage(DataPage):
 
     def refresh_children(self):
 
-        self.pnl_data.children = []
+        data_source = self.data_page_provider.data_source
+        nodes = [data_source[node_key] for node_key in data_source]
 
-        for node_key in self.data_page_provider.data_source:
-            node = self.data_page_provider.data_source[node_key]
-
-            title = node.get_menu_name()
-            menu_item = TextMenuItem(self.display, self, title)
-            menu_item.font = self.controller.display.fonts.list
-            menu_item.data_context = node
-            self.pnl_data.children.append(menu_item)
-
-        if len(self.pnl_data.children) > 0:
-            self.set_focus(self.pnl_data.children[0])
+        self.show_rows(nodes, lambda node: node.get_menu_name())
 
     def handle_control_state_changed(self, widget):
 
@@ -22,6 +22,7 @@ class MapEntity(object):
     points = None
     x = 0
     y = 0
+    screen_bounds = None
     color = None
 
     def __init__(self, lat, lng):
@@ -16,16 +16,67 @@ class MapLine(MapSymbol):
     Renders map paths to the screen with added contextual styling support
     """
 
-    points = list()
-
-    def __init__(self, lat=0, lng=0):  # We don't typically know lat / lng until we have points
+    store = None  # The MapStore holding this line's points, if they're stored there
+    offset = 0
+    length = 0
+
+    def __init__(self, lat=0, lng=0, store=None, offset=0, length=0):
+        """
+        We don't typically know lat / lng until we have points
+        :type store: PiMFD.Applications.Navigation.MapStorage.MapStore
+        :param offset: Where the line's points start in the store
+        :param length: The number of points in the line
+        """
         super(MapLine, self).__init__(lat, lng)
 
-        self.points = list()
+        self.point_list = list()
+        self.store = store
+        self.offset = offset
+        self.length = length
         self.screen_points = None
+        self.screen_bounds = None  # The left, top, right and bottom of the line's screen points
 
         # Points are manually copied during the transpose process
 
+    @property
+    def points(self):
+        """
+        Gets the line's points as a list of (lat, lng) tuples. Lines backed by a MapStore build this list on request.
+        """
+        if self.store is not None:
+            return self.store.get_points(self.offset, self.length)
+
+        return self.point_list
+
+    @points.setter
+    def points(self, value):
+        self.store = None
+        self.point_list = value
+
+    @property
+    def point_count(self):
+        """
+        :return: The number of points in the line before any simplification
+        """
+        if self.store is not None:
+            return self.length
+
+        return len(self.point_list)
+
+    def calculate_lat_lng_from_points(self):
+
+        if self.store is None:
+            super(MapLine, self).calculate_lat_lng_from_points()
+            return
+
+        if self.length < 1:
+            return
+
+        min_lat, min_lng, max_lat, max_lng = self.store.get_bounds(self.offset, self.length)
+
+        self.lat = min_lat + ((max_lat - min_lat) / 2.0)
+        self.lng = min_lng + ((max_lng - min_lng) / 2.0)
+
     def get_line_width(self):
 
         building = self.get_tag_value('building')
@@ -62,15 +113,18 @@ class MapLine(MapSymbol):
     def render(self, display, map_context):
 
         # Render out the lines
-        if self.screen_points and len(self.screen_points) > 1 and map_context.should_show_lines(self):
+        if self.screen_points is not None and len(self.screen_points) > 1 and map_context.should_show_lines(self):
 
             self.has_lines = True
             color = self.get_color(display.color_scheme, map_context)
             width = self.get_line_width()
 
             if width <= 0:
-                pygame.draw.polygon(display.surface, color, self.screen_points, width)
+                rect = pygame.draw.polygon(display.surface, color, self.screen_points, width)
             else:
-                pygame.draw.lines(display.surface, color, False, self.screen_points, width)
+                rect = pygame.draw.lines(display.surface, color, False, self.screen_points, width)
+
+            display.track_draw(display.surface, rect, 'map_line', id(self), id(self.screen_points), color, width,
+                               tuple(rect))
 
         super(MapLine, self).render(display, map_context)
\ No newline at end of file
@@ -4,11 +4,14 @@ from __future__ import print_function
 import cProfile
 from datetime import datetime
 import pstats
-from threading import Thread
+from threading import Lock
 import traceback
+from xml.etree.cElementTree import ParseError
 
-from PiMFD.Applications.Navigation.MapLines import MapLine
-from PiMFD.Applications.Navigation.MapSymbols import MapSymbol
+from PiMFD.Applications.Navigation.MapParsing import OsmStreamParser, open_map_data
+from PiMFD.Applications.Navigation.MapProjection import MapProjector, ProjectionBatch
+from PiMFD.Applications.Navigation.MapTiles import MapTile, get_tile_keys, get_tile_bounds, merge_tiles
+from PiMFD.WorkerPool import WorkerPool
 
 
 """
@@ -16,108 +19,139 @@ Contains code related to rendering maps to the screen
 """
 from math import floor
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
-try:
-    import xmltodict
-except ImportError:
-    xmltodict = None
+from PiMFD.Startup import import_optional
 
 __author__ = 'Multiple'
 
 
-class MapLoadThread(Thread):
+class MapTileLoader(object):
+    """
+    Loads one tile of the map on a worker thread, from the cache if it can and from the network if it has to
+    """
 
-    def __init__(self, map_loader, bounds, group=None, target=None, name=None, args=(), kwargs=None, verbose=None):
-        super(MapLoadThread, self).__init__(group, target, name, args, kwargs, verbose)
+    def __init__(self, map_loader, key, bounds):
+        """
+        :type map_loader: Maps
+        :param key: The column and row of the tile
+        :param bounds: The tile's min lng, min lat, max lng, max lat
+        """
+        super(MapTileLoader, self).__init__()
 
         self.map_loader = map_loader
+        self.key = key
         self.bounds = bounds
 
     def request_map_data(self, bounds, map):
 
-        map.height = (bounds[2] - bounds[0]) / 2
-        map.width = (bounds[3] - bounds[1]) / 2
-        map.bounds = bounds
-        map.origin = (
-            bounds[1] + map.height,
-            bounds[0] + map.width
-        )
         url = "http://www.openstreetmap.org/api/0.6/map?bbox=%f,%f,%f,%f" % (
             bounds[0],
             bounds[1],
             bounds[2],
             bounds[3]
         )
-        # Store Lat / Lng so invokers can have context of what center point is
-        map.lat = bounds[0] + (bounds[2] - bounds[0]) / 2.0
-        map.lng = bounds[1] + (bounds[3] - bounds[1]) / 2.0
-        # Clear out old data
-        map.has_data = False
-        map.nodes = {}
-        map.shapes = []
         print("Fetching maps " + url)
 
-        # Get the data from the web.
+        # Get the data from the web or from whatever source we've been configured to use instead. Responses are
+        # streamed to the parser rather than read into memory all at once.
         try:
-            response = requests.get(url)
-            data = response.text.encode('UTF-8')
+            if map.data_source:
+                data = map.data_source(bounds)
+            else:
+                requests = import_optional('requests')
+                response = requests.get(url, stream=True)
+                response.raw.decode_content = True
+                data = response.raw
 
         except:
             error_message = "Error Getting Map Data: {0}\n".format(str(traceback.format_exc()))
             print(error_message)
             map.status_text = error_message
-            map.has_data = False
             data = None
 
         return data
 
     def run(self):
-        super(MapLoadThread, self).run()
-
-        if self.map_loader.profile:
-            pr = cProfile.Profile()
-            pr.enable()
-            self.load_data()
-            pr.disable()
-            stream = open('map_load.txt', 'w')
-            stats = pstats.Stats(pr, stream=stream)
-            stats.sort_stats('time').print_stats()
-            stream.close()
-        else:
-            self.load_data()
+
+        try:
+            if self.map_loader.profile:
+                pr = cProfile.Profile()
+                pr.enable()
+                self.load_data()
+                pr.disable()
+                stream = open('map_load.txt', 'w')
+                stats = pstats.Stats(pr, stream=stream)
+                stats.sort_stats('time').print_stats()
+                stream.close()
+            else:
+                self.load_data()
+        finally:
+            self.map_loader.finish_tile(self.key)
 
     def load_data(self):
-        self.map_loader.status_text = 'Requesting Data...'
+        map = self.map_loader
+        bounds = self.bounds
 
-        data = self.request_map_data(self.bounds, self.map_loader)
+        # The map may have moved somewhere else while this tile waited its turn
+        if not map.is_tile_wanted(self.key):
+            return
+
+        # Show what we have on disk right away. Anything that has outlived its time to live stays up while it's
+        # downloaded again.
+        cache = map.cache
+        cached = None
+        if cache:
+            cache_key = cache.get_key(bounds)
+            cached = cache.load(cache_key)
+
+            if cached:
+                if not cache.is_stale(cached):
+                    map.add_tile(MapTile(self.key, bounds, cached.store, cached.shapes, 'CACHE'))
+                    return
+
+                map.add_tile(MapTile(self.key, bounds, cached.store, cached.shapes, 'CACHE - UPDATING'))
 
-        self.map_loader.status_text = 'Interpreting Map...'
+        data = self.request_map_data(bounds, map)
+
+        # Dump to disk for diagnostics as the data is read. Tiles load side by side so only one gets to at a time.
+        output_file = None
+        is_saving = map.application.controller.options.save_map_to_disk and map.output_lock.acquire(False)
+        if is_saving:
+            output_file = map.output_file
 
         # Interpret results. We may get a no data result if we were too greedy or too isolated.
-        if not data or len(data) <= 0:
-            # Ensure we don't do anything on no data
-            self.map_loader.status_text = 'No Data Received'
-            self.map_loader.has_data = False
-            return
+        parser = None
+        try:
+            if data is None:
+                map.status_text = 'No Data Received'
+            else:
+                parser = map.parse_map_data(data, output_file)
+        finally:
+            if is_saving:
+                map.output_lock.release()
+            if hasattr(data, 'close'):
+                data.close()
+
+        if parser is None:
+
+            # Keep showing the old copy rather than nothing
+            if cached:
+                map.add_tile(MapTile(self.key, bounds, cached.store, cached.shapes, 'CACHE - OFFLINE'))
 
-        self.map_loader.last_data_received = datetime.now()
+            return
 
-        # Dump to disk for diagnostics
-        if self.map_loader.application.controller.options.save_map_to_disk:
-            self.map_loader.save_map_data(data)
+        # Save before the tile is shown so that nothing from the screen gets saved with it
+        if cache:
+            cache.save(cache_key, parser.store, parser.shapes)
 
-        self.map_loader.load_map_from_data(data)
+        map.add_tile(MapTile(self.key, bounds, parser.store, parser.shapes, 'NETWORK'))
 
 
 class Maps(object):
     """
-    A class used for requesting and managing Open Street Maps (OSM) map data
+    A class used for requesting and managing Open Street Maps (OSM) map data. The map is divided into tiles that are
+    fetched side by side and kept as the map moves so only the tiles that come into view need to be fetched.
     """
-    nodes = {}
+    projector = None
     locations = []
     waypoints = []
     annotations = None
@@ -130,17 +164,28 @@ class Maps(object):
 
     has_data = False
     status_text = "Loading Map Data..."
+    source_text = None  # Where the map on screen came from, such as 'CACHE' or 'NETWORK'
+
+    fetch_threads = 4  # The most tiles downloaded at once
+    tile_margin = 1  # Tiles kept around the area shown so panning back doesn't fetch them again
 
     output_file = None
     weather_data = None
 
+    # An optional function taking bounds and returning OSM XML. Used to load maps without a network connection.
+    data_source = None
+
+    cache = None  # A MapCache of areas loaded before or None to always download
+
     SIG_PLACES = 3
     GRID_SIZE = 0.001
+    TILE_SIZE = 0.01  # Degrees. A multiple of GRID_SIZE so tiles line up with the grid.
     lat = None
     lng = None
 
     last_width = 0
     last_height = 0
+    last_area = None
     w_coef = 0
     h_coef = 0
 
@@ -149,10 +194,17 @@ class Maps(object):
 
         self.shapes = []
         self.annotations = []
-        self.nodes = []
         self.application = data_provider.application
         self.data_provider = data_provider
 
+        self.tiles = {}  # Loaded tiles by column and row
+        self.shown_tiles = ([], [])  # The loaded tiles covering the area shown and the shapes merged from them
+        self.wanted_tiles = []  # The tiles covering the area shown
+        self.pending_tiles = set()  # Tiles waiting to load
+        self.lock = Lock()
+        self.output_lock = Lock()
+        self.pool = None
+
     def float_floor_to_precision(self, value, precision):
         for i in range(precision):
             value *= 10
@@ -161,40 +213,61 @@ class Maps(object):
             value /= 10
         return value
 
+    def snap_to_grid(self, value):
+        """
+        Rounds a lat or lng to the nearest multiple of GRID_SIZE
+        :type value: float
+        """
+        return round(round(value / self.GRID_SIZE) * self.GRID_SIZE, self.SIG_PLACES)
+
+    @property
+    def is_loading(self):
+        """
+        :return: True if tiles are still being loaded
+        """
+        return len(self.pending_tiles) > 0
+
     def fetch_area(self, bounds):
-        self.status_text = "Loading Map Data..."
 
-        # Spawn a new thread and launch it
-        thread = MapLoadThread(self, bounds)
-        thread.start()
+        # Line areas up with the grid so that returning to an area after panning away asks for exactly the same area
+        bounds = tuple([self.snap_to_grid(float(value)) for value in bounds])
 
-    def save_map_data(self, data):
+        tile_size = self.TILE_SIZE
+        keys = get_tile_keys(bounds, tile_size)
 
-        if self.output_file and data:
-            try:
-                f = open(self.output_file, "w")
-                f.write(data)
-                f.close()
-            except:
-                error_message = "Unhandled error saving map data to file {0}\n".format(str(traceback.format_exc()))
-                print(error_message)
+        margin = self.tile_margin * tile_size
+        nearby = set(get_tile_keys((bounds[0] - margin, bounds[1] - margin, bounds[2] + margin, bounds[3] + margin),
+                                   tile_size))
 
-    def process_tag(self, entity, tag):
+        with self.lock:
+            self.set_area(bounds)
+            self.wanted_tiles = keys
 
-        tag_name = tag["@k"]
-        tag_value = tag["@v"]
+            # Let go of tiles that have gone well out of view. They can still come back from the cache.
+            for key in self.tiles.keys():
+                if key not in nearby:
+                    del self.tiles[key]
 
-        # Name Field
-        if tag_name == "name":
-            entity.name = tag_value
-            return True
+            missing = [key for key in keys if key not in self.tiles and key not in self.pending_tiles]
+            self.pending_tiles.update(missing)
 
-        elif str.startswith(str(tag_name), 'tiger:') or tag_name in ('source', 'created_by'):
-            return False
+            # Keep showing what overlaps the new area while the rest loads
+            self.show_tiles()
+            is_complete = not self.pending_tiles
 
-        else:
-            entity.add_tag(tag_name, tag_value)
-            return True
+        if not self.has_data:
+            self.status_text = "Loading Map Data..."
+
+        if self.pool is None:
+            self.pool = WorkerPool(self.fetch_threads, name='Map Tile')
+
+        for key in missing:
+            loader = MapTileLoader(self, key, get_tile_bounds(key, tile_size, self.SIG_PLACES))
+            self.pool.submit(loader.run)
+
+        # Everything needed was already loaded
+        if is_complete and self.has_data:
+            self.application.map_loaded(self.bounds)
 
     def fetch_by_coordinate(self, lat, lng, range):
 
@@ -210,43 +283,44 @@ class Maps(object):
         width = dimensions[0]
         height = dimensions[1]
 
-        if self.last_width != width or self.last_height != height:
+        # The area covered changes with the zoom level so that has to be checked as well as the screen size
+        if self.last_width != width or self.last_height != height or self.last_area != (self.width, self.height):
             self.w_coef = width / self.width / 2
             self.h_coef = height / self.height / 2
 
             self.last_width = width
             self.last_height = height
+            self.last_area = (self.width, self.height)
 
         return self.w_coef, self.h_coef
 
-    def translate_shapes(self, dimensions, offset):
+    def translate_shapes(self, dimensions, offset, tolerance=1):
+        """
+        Projects every shape to the screen
+        :param dimensions: The size of the area the map covers on screen
+        :param offset: The screen position of the map's origin
+        :param tolerance: The size in pixels of the grid line points are snapped to when simplifying lines for drawing
+        :return: The shapes
+        """
 
         dim_coef = self.get_dimension_coefficients(dimensions)
 
-        results = []
-
-        for item in self.shapes:
-
-            # Determine screen position based on relative GPS offset from our map origin
-            rel_lat, rel_lng = self.get_rel_lat_lng(item.lat, item.lng)
-            item.x, item.y = self.translate_lat_lng_to_x_y(rel_lat, rel_lng, dim_coef, offset)
-
-            # For lines, we'll need to translate our GPS lines to screen-relative lines - keeping the old GPS values
-            # for future iterations
-            if item.points and len(item.points) > 1:
-                screen_points = []
-                for waypoint in item.points:
-                    lat, lng = self.get_rel_lat_lng(waypoint[0], waypoint[1])
-                    screen = self.translate_lat_lng_to_x_y(lat, lng, dim_coef, offset)
-
-                    screen_points.append(screen)
+        # Work from the tiles as they are now in case a tile finishes loading part way through
+        tiles, shapes = self.shown_tiles
 
-                item.screen_points = screen_points
+        if self.projector is None:
+            self.projector = MapProjector()
 
-            # The item is good, so return it to whatever is rendering things
-            results.append(item)
+        # Determine screen positions based on relative GPS offset from our map origin. For lines, we'll need to
+        # translate our GPS lines to screen-relative lines - keeping the old GPS values for future iterations. Tiles
+        # that are already projected this way are left alone so a new tile arriving only costs its own projection.
+        projection = (self.origin, dim_coef, offset, tolerance)
+        for tile in tiles:
+            if tile.projection != projection:
+                tile.batch.project(self.projector, self.origin, dim_coef, offset, tolerance)
+                tile.projection = projection
 
-        return results
+        return list(shapes)
 
     def get_rel_lat_lng(self, lat, lng):
 
@@ -302,105 +376,128 @@ class Maps(object):
     def handle_traffic_data(self, incidents):
         self.annotations = incidents
 
-    def load_map_from_data(self, data):
+    def set_area(self, bounds):
+        """
+        Centers the map on a new area
+        :param bounds: min lng, min lat, max lng, max lat
+        """
 
-        if 'service unavailable' in data.lower():
-            print(data)
-            self.has_data = False
-            self.status_text = 'Map Server Offline'
-            return
+        self.height = (bounds[2] - bounds[0]) / 2
+        self.width = (bounds[3] - bounds[1]) / 2
+        self.bounds = bounds
+        self.origin = (
+            bounds[1] + self.height,
+            bounds[0] + self.width
+        )
 
-        if not xmltodict:
-            self.status_text = "xmltodict not available".upper()
-            return
+        # Store Lat / Lng so invokers can have context of what center point is
+        self.lat = bounds[0] + (bounds[2] - bounds[0]) / 2.0
+        self.lng = bounds[1] + (bounds[3] - bounds[1]) / 2.0
+
+    def parse_map_data(self, data, output_file=None):
+        """
+        Reads OSM XML into map shapes without showing them
+        :param data: A string of OSM XML or a file-like object to stream it from
+        :param output_file: A file to copy the data to as it is read or None
+        :return: The OsmStreamParser holding the map's store and shapes or None if the data wasn't map data. The status
+        text says why.
+        """
 
         try:
-            osm_dict = xmltodict.parse(data)
-
-            # Load Nodes
-            for node in osm_dict['osm']['node']:
-
-                # Extract ID and map the node
-                id = node['@id']
-                self.nodes[id] = node
-
-                # Skip Invisible items
-                if '@visible' in node and node['@visible'] == 'false':
-                    continue
-
-                # We don't care about it unless it has tags
-                if 'tag' not in node:
-                    continue
-
-                is_valid = False
-
-                location = MapSymbol(float(node['@lat']), float(node['@lon']))
-                location.id = id
-                location.name = None
-
-                if '@k' in node['tag']:
-                    if self.process_tag(location, node['tag']):
-                        is_valid = True
-                else:
-                    for tag in node['tag']:
-                        if self.process_tag(location, tag):
-                            is_valid = True
-
-                if is_valid:
-                    self.shapes.append(location)
-
-            # Load Waypoints
-            for waypoint in osm_dict['osm']['way']:
-
-                # Skip Invisible items
-                if '@visible' in waypoint and waypoint['@visible'] == 'false':
-                    continue
-
-                path = MapLine()
-                path.id = waypoint['@id']
-                path.name = None
-
-                # Get points from existing nodes
-                try:
-                    for node_id in waypoint['nd']:
-                        node = None
-                        if node_id == '@ref':
-                            node = self.nodes[waypoint['nd']['@ref']]
-                        elif '@ref' in node_id:
-                            node = self.nodes[node_id['@ref']]
-
-                        if node:
-                            path.points.append((float(node['@lat']), float(node['@lon'])))
-                except:
-                    error_message = "Unhandled error handling points {0}\n".format(str(traceback.format_exc()))
-                    print(error_message)
-
-                # Get tags
-                try:
-                    if 'tag' in waypoint:
-                        for tag in waypoint['tag']:
-                            if tag == '@k':
-                                self.process_tag(path, waypoint['tag'])
-                                break
-                            elif '@k' in tag:
-                                self.process_tag(path, tag)
-                            else:
-                                for tag2 in tag:
-                                    self.process_tag(path, tag2)
-                except:
-                    error_message = "Unhandled error handling tags {0}\n".format(str(traceback.format_exc()))
-                    print(error_message)
-
-                # Don't perpetuate invalid objects
-                if len(path.points) > 1:
-                    path.calculate_lat_lng_from_points()
-                    self.shapes.append(path)
+            stream = open_map_data(data, output_file)
+        except:
+            error_message = "Unhandled error saving map data to file {0}\n".format(str(traceback.format_exc()))
+            print(error_message)
+            stream = open_map_data(data)
+
+        parser = OsmStreamParser()
+
+        try:
+            parser.parse(stream)
+
+        except ParseError:
+            # Error pages from the map server usually aren't XML and are handled below. Keep what we got from
+            # map data that was cut short.
+            if parser.root_tag == 'osm':
+                error_message = "Map data ended early {0}\n".format(str(traceback.format_exc()))
+                print(error_message)
 
         except:
             error_message = "Unhandled error parsing map data {0}\n".format(str(traceback.format_exc()))
             print(error_message)
 
-        self.has_data = True
-        self.status_text = None
+        finally:
+            stream.close()
+
+        if parser.root_tag != 'osm':
+
+            if stream.bytes_read <= 0:
+                self.status_text = 'No Data Received'
+            elif 'service unavailable' in stream.head.lower():
+                print(stream.head)
+                self.status_text = 'Map Server Offline'
+            else:
+                print("Unrecognized map data {0}\n".format(stream.head))
+                self.status_text = 'Invalid Map Data'
+
+            return None
+
+        if parser.missing_points:
+            print("Map data referenced {} points that weren't included".format(parser.missing_points))
+
+        return parser
+
+    def is_tile_wanted(self, key):
+        """
+        :param key: The column and row of a tile
+        :return: True if the tile is part of the area shown
+        """
+        return key in self.wanted_tiles
+
+    def add_tile(self, tile):
+        """
+        Merges a loaded tile into the map. Tiles that are no longer part of the area shown are dropped.
+        :type tile: MapTile
+        """
+
+        # Importing NumPy for projection is slow so get it done here, off of the main thread
+        if self.projector is None:
+            self.projector = MapProjector()
+
+        tile.batch = ProjectionBatch(tile.shapes)
+
+        with self.lock:
+            if tile.key not in self.wanted_tiles:
+                return
+
+            self.tiles[tile.key] = tile
+            self.show_tiles()
+
+    def finish_tile(self, key):
+        """
+        Notes that a tile is done loading, successfully or not, and lets the application know once the whole area is
+        :param key: The column and row of the tile
+        """
+
+        with self.lock:
+            self.pending_tiles.discard(key)
+            is_complete = not self.pending_tiles
+
+        if is_complete and self.has_data:
+            self.application.map_loaded(self.bounds)
+
+    def show_tiles(self):
+        """
+        Rebuilds the map's shapes from the loaded tiles covering the area shown. The lock must be held.
+        """
+
+        tiles = [self.tiles[key] for key in self.wanted_tiles if key in self.tiles]
+
+        self.shapes = merge_tiles(tiles)
+        self.shown_tiles = (tiles, self.shapes)
+        self.has_data = len(tiles) > 0
+        self.source_text = ' + '.join(sorted(set([tile.source for tile in tiles]))) or None
+        self.last_data_received = datetime.now()
 
-        self.application.map_loaded(self.bounds)
+        if self.has_data:
+            self.status_text = None
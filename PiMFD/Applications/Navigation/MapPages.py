@@ -8,6 +8,7 @@ from PiMFD.Applications.Navigation.MapRendering import MapRenderer
 from PiMFD.UI import Keycodes
 from PiMFD.UI.Keycodes import is_up_key, is_right_key, is_left_key, is_down_key, is_enter_key
 from PiMFD.UI.Panels import StackPanel
+from PiMFD.UI.Rendering import render_text
 
 __author__ = 'Matt Eland'
 
@@ -34,11 +35,31 @@ class MapPage(MFDPage):
 
         if self.data_provider.map.has_data:
             self.map_renderer.render()
+            self.render_source()
         else:
             self.center_text(self.context.map.status_text.upper())
 
         return super(MapPage, self).render()
 
+    def render_source(self):
+        """
+        Notes where the map came from, such as the cache or the network, in the bottom left corner of the map
+        """
+
+        # Without a cache every map comes from the network so there's nothing worth saying
+        map = self.data_provider.map
+        source = map.source_text
+        if not source or not map.cache:
+            return
+
+        font = self.display.fonts.small
+        render_text(self.display,
+                    font,
+                    'MAP: ' + source,
+                    self.display.get_content_start_x(),
+                    self.display.get_content_end_y() - font.size,
+                    self.display.color_scheme.foreground)
+
     def handle_mouse_left_click(self, pos):
 
         if self.context.page_mode == 'CUR':
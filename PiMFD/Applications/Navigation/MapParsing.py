@@ -0,0 +1,206 @@
+# coding=utf-8
+
+"""
+Contains a streaming parser for Open Street Maps (OSM) XML that builds map entities as the document is read
+"""
+from cStringIO import StringIO
+from xml.etree.cElementTree import iterparse
+
+from PiMFD.Applications.Navigation.MapLines import MapLine
+from PiMFD.Applications.Navigation.MapStorage import MapStore
+from PiMFD.Applications.Navigation.MapSymbols import MapSymbol
+
+__author__ = 'Matt Eland'
+
+
+class MapDataStream(object):
+    """
+    Wraps a file-like source of OSM XML, optionally copying everything read from it to a file on disk as it goes. The
+    start of the data is kept so error pages from the map server can be recognized.
+    :param source: A file-like object with a read method
+    :param output_file: The name of a file to copy the data to or None
+    """
+
+    head_size = 512  # Bytes kept from the start of the stream
+
+    def __init__(self, source, output_file=None):
+        super(MapDataStream, self).__init__()
+
+        self.source = source
+        self.output = open(output_file, 'wb') if output_file else None
+        self.bytes_read = 0
+        self.head = ''
+
+    def read(self, size=-1):
+        """
+        Reads a chunk of data from the source
+        :param size: The maximum number of bytes to read
+        :return: The data read or an empty string at the end of the stream
+        """
+
+        data = self.source.read(size)
+
+        if data:
+            if self.bytes_read < self.head_size:
+                self.head += data[:self.head_size - self.bytes_read]
+
+            self.bytes_read += len(data)
+
+            if self.output:
+                self.output.write(data)
+
+        return data
+
+    def close(self):
+        """
+        Closes the copy on disk. The source is left for its owner to close.
+        """
+        if self.output:
+            self.output.close()
+            self.output = None
+
+
+def open_map_data(data, output_file=None):
+    """
+    Gets a MapDataStream for map data that may have been loaded as a string or may still be arriving
+    :param data: A string of OSM XML or a file-like object
+    :param output_file: The name of a file to copy the data to or None
+    :rtype: MapDataStream
+    """
+
+    if isinstance(data, basestring):
+        if isinstance(data, unicode):
+            data = data.encode('UTF-8')
+        data = StringIO(data)
+
+    return MapDataStream(data, output_file)
+
+
+class OsmStreamParser(object):
+    """
+    Reads OSM XML incrementally, turning nodes and ways into map entities as soon as each element is complete and then
+    discarding the element. Memory use grows with the entities that are kept rather than the size of the document.
+    Node locations and line points go into a MapStore. Only nodes with tags and ways get Python objects.
+    """
+
+    def __init__(self):
+        super(OsmStreamParser, self).__init__()
+
+        self.root_tag = None  # 'osm' for map data. Error pages from the map server have something else.
+        self.store = MapStore()
+        self.shapes = []
+        self.way_count = 0
+        self.missing_points = 0
+
+    def parse(self, stream):
+        """
+        Parses an entire OSM document
+        :param stream: A file-like object to read XML from
+        :return: The list of shapes found
+        """
+
+        root = None
+
+        for event, element in iterparse(stream, events=('start', 'end')):
+
+            if event == 'start':
+                if root is None:
+                    root = element
+                    self.root_tag = element.tag
+                continue
+
+            if element.tag == 'node':
+                self.read_node(element)
+            elif element.tag == 'way':
+                self.read_way(element)
+            elif element.tag not in ('relation', 'bounds'):
+                continue
+
+            # Everything we need from this element has been taken so let the document tree forget it
+            root.clear()
+
+        return self.shapes
+
+    @staticmethod
+    def process_tag(entity, tag_name, tag_value):
+        """
+        Applies a tag to an entity
+        :type entity: PiMFD.Applications.Navigation.MapEntities.MapEntity
+        :return: True if the tag is worth showing the entity for
+        """
+
+        # Name Field
+        if tag_name == "name":
+            entity.name = tag_value
+            return True
+
+        elif tag_name.startswith('tiger:') or tag_name in ('source', 'created_by'):
+            return False
+
+        else:
+            entity.add_tag(tag_name, tag_value)
+            return True
+
+    def read_node(self, element):
+        """
+        Registers a node's location and builds a symbol for it if it has tags worth showing
+        :type element: xml.etree.ElementTree.Element
+        """
+
+        attributes = element.attrib
+        id = attributes['id']
+        lat = float(attributes['lat'])
+        lng = float(attributes['lon'])
+
+        self.store.add_node(float(id), lat, lng)
+
+        # Skip Invisible items and items with nothing to say about themselves
+        if attributes.get('visible') == 'false' or not len(element):
+            return
+
+        location = MapSymbol(lat, lng)
+        location.id = id
+
+        is_valid = False
+        for tag in element.iter('tag'):
+            if self.process_tag(location, tag.get('k'), tag.get('v')):
+                is_valid = True
+
+        if is_valid:
+            self.shapes.append(location)
+
+    def read_way(self, element):
+        """
+        Builds a line from a way's points and tags
+        :type element: xml.etree.ElementTree.Element
+        """
+
+        self.way_count += 1
+
+        # Skip Invisible items
+        if element.get('visible') == 'false':
+            return
+
+        path = MapLine()
+        path.id = element.get('id')
+
+        store = self.store
+        node_indexes = []
+
+        for child in element:
+            if child.tag == 'nd':
+                index = store.find_node(float(child.get('ref')))
+                if index >= 0:
+                    node_indexes.append(index)
+                else:
+                    self.missing_points += 1
+
+            elif child.tag == 'tag':
+                self.process_tag(path, child.get('k'), child.get('v'))
+
+        # Don't perpetuate invalid objects
+        if len(node_indexes) > 1:
+            path.store = store
+            path.offset, path.length = store.add_line(node_indexes)
+            path.calculate_lat_lng_from_points()
+            self.shapes.append(path)
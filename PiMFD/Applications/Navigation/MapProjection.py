@@ -0,0 +1,257 @@
+# coding=utf-8
+
+"""
+Contains code for projecting map coordinates onto the screen in batches
+"""
+from array import array
+import gc
+from itertools import izip
+
+from PiMFD.Startup import import_optional
+
+__author__ = 'Matt Eland'
+
+
+class MapProjector(object):
+    """
+    Projects every entity anchor and line point in a map to screen positions in one pass over contiguous coordinate
+    arrays. NumPy is used when it is installed. Otherwise the same math runs in plain Python.
+
+    Screen positions are whole pixels, truncated the same way pygame truncates the floats it is given.
+    :param use_numpy: Whether to use NumPy if it is available
+    """
+
+    def __init__(self, use_numpy=True):
+        super(MapProjector, self).__init__()
+
+        self.numpy = import_optional('numpy') if use_numpy else None
+
+    def project(self, lats, lngs, origin, dim_coef, offset):
+        """
+        Projects coordinates to screen positions. This does the same math as Maps.get_rel_lat_lng followed by
+        Maps.translate_lat_lng_to_x_y.
+        :param lats: An array('d') of latitudes
+        :param lngs: An array('d') of longitudes
+        :param origin: The lat / lng at the center of the map
+        :param dim_coef: The width and height coefficients from Maps.get_dimension_coefficients
+        :param offset: The screen position of the map's origin
+        :return: A list of [x, y] pairs when using NumPy or (x, y) tuples otherwise
+        """
+
+        origin_lat, origin_lng = origin
+        x_coef = -dim_coef[0]
+        y_coef = dim_coef[1]
+        x_offset, y_offset = offset
+
+        numpy = self.numpy
+        if numpy is None:
+            return [(int((origin_lng - lng) * x_coef + x_offset), int((origin_lat - lat) * y_coef + y_offset))
+                    for lat, lng in izip(lats, lngs)]
+
+        if not len(lats):
+            return []
+
+        return self.project_array(lats, lngs, origin, dim_coef, offset).tolist()
+
+    def project_array(self, lats, lngs, origin, dim_coef, offset):
+        """
+        Projects coordinates to screen positions with NumPy
+        :return: An N x 2 NumPy array of x, y positions
+        """
+
+        numpy = self.numpy
+
+        lats = numpy.frombuffer(lats, dtype=numpy.float64)
+        lngs = numpy.frombuffer(lngs, dtype=numpy.float64)
+
+        points = numpy.empty((len(lats), 2), dtype=numpy.int32)
+        points[:, 0] = (origin[1] - lngs) * -dim_coef[0] + offset[0]
+        points[:, 1] = (origin[0] - lats) * dim_coef[1] + offset[1]
+
+        return points
+
+    def project_lines(self, store, lines, origin, dim_coef, offset, tolerance=1):
+        """
+        Projects every point in a MapStore and gives each line its slice of the results as its screen points. Lines are
+        simplified as they go; see simplify_points.
+        :type store: PiMFD.Applications.Navigation.MapStorage.MapStore
+        :param lines: MapLines whose points are in the store
+        :param tolerance: The size in pixels of the grid points are snapped to when simplifying
+        """
+
+        numpy = self.numpy
+
+        if not lines:
+            return
+
+        if numpy is None or not store.point_count:
+            points = self.project(store.lats, store.lngs, origin, dim_coef, offset)
+            for line in lines:
+                line.screen_points = simplify_points(points[line.offset:line.offset + line.length], tolerance)
+            return
+
+        points = self.project_array(store.lats, store.lngs, origin, dim_coef, offset)
+
+        starts = numpy.fromiter((line.offset for line in lines), dtype=numpy.intp, count=len(lines))
+        ends = starts + numpy.fromiter((line.length for line in lines), dtype=numpy.intp, count=len(lines))
+
+        # Keep the first point in each run of points snapped to the same grid cell, plus the ends of every line
+        cells = points // tolerance if tolerance > 1 else points
+        keep = numpy.empty(len(points), dtype=bool)
+        keep[0] = True
+        keep[1:] = (cells[1:] != cells[:-1]).any(axis=1)
+        keep[starts] = True
+        keep[ends - 1] = True
+
+        # Where each original point lands among the kept points
+        kept_index = numpy.cumsum(keep) - 1
+        kept_starts = kept_index[starts]
+        kept_ends = kept_index[ends - 1] + 1
+
+        kept = points[keep].tolist()
+
+        for line, start, end in izip(lines, kept_starts.tolist(), kept_ends.tolist()):
+            line.screen_points = kept[start:end]
+
+    def project_bounds(self, lines, bounds, origin, dim_coef, offset):
+        """
+        Gives lines the screen bounds of their points by projecting the corners of their lat / lng bounds. Projection
+        is linear and truncating to whole pixels never reverses the order of two positions, so this matches the bounds
+        of the projected points without going through them again.
+        :param lines: MapLines
+        :param bounds: Four array('d')s of the lines' min lats, min lngs, max lats and max lngs
+        """
+
+        min_lats, min_lngs, max_lats, max_lngs = bounds
+
+        # Longitude increases to the right but latitude increases upwards, so the max lat is the top edge
+        top_lefts = self.project(max_lats, min_lngs, origin, dim_coef, offset)
+        bottom_rights = self.project(min_lats, max_lngs, origin, dim_coef, offset)
+
+        for line, (left, top), (right, bottom) in izip(lines, top_lefts, bottom_rights):
+            line.screen_bounds = (left, top, right, bottom)
+
+    def project_anchors(self, entities, lats, lngs, origin, dim_coef, offset):
+        """
+        Projects the positions of map entities
+        :param entities: The entities to position
+        :param lats: An array('d') of each entity's latitude
+        :param lngs: An array('d') of each entity's longitude
+        """
+
+        for entity, (x, y) in izip(entities, self.project(lats, lngs, origin, dim_coef, offset)):
+            entity.x = x
+            entity.y = y
+
+
+def simplify_points(points, tolerance=1):
+    """
+    Simplifies a line in screen space for drawing by snapping points to a grid of tolerance sized cells and keeping the
+    first point in each run that lands in the same cell. The first and last points are always kept. A tolerance of 1
+    or less would only drop points that repeat the pixel before them, which changes nothing on screen, so the points
+    are returned as they are.
+    :param points: The line's screen points
+    :param tolerance: The size of the grid in pixels
+    :return: The simplified points
+    """
+
+    if tolerance <= 1 or len(points) < 3:
+        return points
+
+    kept = [points[0]]
+    last_cell = (points[0][0] // tolerance, points[0][1] // tolerance)
+
+    for point in points[1:-1]:
+        cell = (point[0] // tolerance, point[1] // tolerance)
+        if cell != last_cell:
+            kept.append(point)
+            last_cell = cell
+
+    kept.append(points[-1])
+
+    return kept
+
+
+def get_line_bounds(lines):
+    """
+    Gathers the lat / lng bounds of lines into arrays for projecting them all at once
+    :param lines: MapLines
+    :return: Four array('d')s of the lines' min lats, min lngs, max lats and max lngs
+    """
+
+    bounds = (array('d'), array('d'), array('d'), array('d'))
+
+    for line in lines:
+        if line.store is not None:
+            line_bounds = line.store.get_bounds(line.offset, line.length)
+        else:
+            points = line.points
+            line_bounds = (min([point[0] for point in points]), min([point[1] for point in points]),
+                           max([point[0] for point in points]), max([point[1] for point in points]))
+
+        for values, value in izip(bounds, line_bounds):
+            values.append(value)
+
+    return bounds
+
+
+class ProjectionBatch(object):
+    """
+    Everything needed to project a set of map entities at once: their anchor positions as coordinate arrays and their
+    lines grouped by the MapStore holding their points. A batch is built once per set of entities and reused each time
+    they are projected.
+    :param entities: The map entities
+    """
+
+    def __init__(self, entities):
+        super(ProjectionBatch, self).__init__()
+
+        self.entities = entities
+        self.lats = array('d', [entity.lat for entity in entities])
+        self.lngs = array('d', [entity.lng for entity in entities])
+
+        self.stored_lines = {}  # MapStore to the lines with points in it
+        self.loose_lines = []  # Lines with their own lists of points
+
+        for entity in entities:
+            store = getattr(entity, 'store', None)
+            if store is not None:
+                self.stored_lines.setdefault(store, []).append(entity)
+            elif entity.points and len(entity.points) > 1:
+                self.loose_lines.append(entity)
+
+        # Lines with points and the lat / lng bounds of those points. These are projected in place of the points
+        # themselves to find each line's screen bounds.
+        self.bounded_lines = [line for lines in self.stored_lines.itervalues() for line in lines if line.length > 0]
+        self.bounded_lines.extend(self.loose_lines)
+        self.line_bounds = get_line_bounds(self.bounded_lines)
+
+    def project(self, projector, origin, dim_coef, offset, tolerance=1):
+        """
+        Projects every entity and line in the batch
+        :type projector: MapProjector
+        :param tolerance: The size in pixels of the grid line points are snapped to when simplifying
+        """
+
+        # Creating a screen position for every point sets off the garbage collector over and over even though none of
+        # them can be part of a reference cycle. Holding it off makes large maps project several times faster.
+        collecting = gc.isenabled()
+        gc.disable()
+
+        try:
+            projector.project_anchors(self.entities, self.lats, self.lngs, origin, dim_coef, offset)
+
+            for store, lines in self.stored_lines.iteritems():
+                projector.project_lines(store, lines, origin, dim_coef, offset, tolerance)
+
+            for line in self.loose_lines:
+                points = line.points
+                points = projector.project(array('d', [point[0] for point in points]),
+                                           array('d', [point[1] for point in points]),
+                                           origin, dim_coef, offset)
+                line.screen_points = simplify_points(points, tolerance)
+
+            projector.project_bounds(self.bounded_lines, self.line_bounds, origin, dim_coef, offset)
+        finally:
+            if collecting:
+                gc.enable()
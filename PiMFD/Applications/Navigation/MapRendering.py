@@ -1,8 +1,9 @@
 # coding=utf-8
 from datetime import datetime
-import math
 
+from PiMFD.Applications.Navigation.MapContexts import MapZooms
 from PiMFD.Applications.Navigation.MapSymbols import MapSymbol
+from PiMFD.Applications.Navigation.SpatialIndexing import SpatialGrid
 
 
 __author__ = 'Matt Eland'
@@ -12,6 +13,13 @@ class MapRenderer(object):  # TODO: Maybe this should be a UIWidget?
     A class used to render a Map object
     """
 
+    # Pixels that line points are snapped to when lines are simplified at each zoom level. 1 only removes repeats.
+    simplify_tolerances = {MapZooms.large: 3, MapZooms.medium: 2}
+
+    # How far past the sides and the top or bottom of the screen a symbol can be and still have its labels show.
+    # Labels are drawn beside and below symbols so they reach much further sideways.
+    cull_margin = (160, 40)
+
     def __init__(self, display, data_provider, size=(200, 200)):
         self.map = data_provider.map
         self.display = display
@@ -20,50 +28,102 @@ class MapRenderer(object):  # TODO: Maybe this should be a UIWidget?
         self.data_provider = data_provider
         self.map_context = data_provider.map_context
         self.osm_shapes = None
+        self.shape_index = None
         self.last_translate = None
+        self.last_tolerance = None
         self.weather = None
 
-    def calculate_distance(self, pos_1, pos_2):
-        x_squared = math.pow(pos_1[0] - pos_2[0], 2)
-        y_squared = math.pow(pos_1[1] - pos_2[1], 2)
-        return math.sqrt(x_squared + y_squared)
-
-    def find_nearest_targetable_object(self, pos):
-
-        best_distance = None
-        target = None
+        # Counts from the last frame: shapes drawn and culled, and line points before and after simplification
+        self.drawn = self.culled = self.points_before = self.points_after = 0
+        display.register_stats_source(self.get_stats)
+
+    def get_stats(self):
+        """
+        Gets map rendering counts from the last frame for the frame timing overlay
+        :return: A list of lines of text
+        """
+
+        if not self.drawn and not self.culled:
+            return []
+
+        return ['Map: {} drawn, {} culled, {} of {} line points'.format(self.drawn, self.culled, self.points_after,
+                                                                        self.points_before)]
+
+    def is_on_screen(self, shape, left, top, right, bottom):
+        """
+        Determines whether a shape could draw anything on screen
+        :param shape: The shape
+        :param left: The left edge of the screen
+        :param top: The top of the screen
+        :param right: The right edge of the screen
+        :param bottom: The bottom of the screen
+        """
+
+        # Lines may cross the screen even when their middle is somewhere else
+        bounds = shape.screen_bounds
+        if bounds and bounds[0] < right and bounds[2] >= left and bounds[1] < bottom and bounds[3] >= top:
+            return True
+
+        x_margin, y_margin = self.cull_margin
+        return left - x_margin <= shape.x < right + x_margin and top - y_margin <= shape.y < bottom + y_margin
+
+    def find_nearest_targetable_objects(self, pos, count=1):
+        """
+        Finds the objects the active map filter shows that are nearest to a screen position
+        :param pos: The x, y screen position
+        :param count: The maximum number of objects to find
+        :return: A list of objects, nearest first
+        """
+
+        accept = self.map_context.should_show_entity
+
+        found = []
+        if self.shape_index:
+            found = self.shape_index.find_nearest(pos, count, accept)
+
+        # Annotations and weather move independently of the map and there are only a few of them so they're not indexed
+        others = list(self.map.annotations or [])
+        if self.weather:
+            others.append(self.weather)
 
-        candidates = []
+        for shape in others:
+            if shape and accept(shape):
+                dx = shape.x - pos[0]
+                dy = shape.y - pos[1]
+                found.append((dx * dx + dy * dy, shape))
 
-        if self.osm_shapes:
-            candidates += self.osm_shapes
+        found.sort(key=lambda item: item[0])
 
-        if self.map.annotations:
-            candidates += self.map.annotations
+        return [shape for distance, shape in found[:count]]
 
-        if self.weather:
-            candidates.append(self.weather)
+    def find_nearest_targetable_object(self, pos):
 
-        for shape in candidates:
+        nearest = self.find_nearest_targetable_objects(pos)
 
-            if not shape or not self.map_context.should_show_entity(shape):
-                continue
+        return nearest[0] if nearest else None
 
-            distance = self.calculate_distance(pos, (shape.x, shape.y))
+    def find_targetable_objects_in_rect(self, rect):
+        """
+        Finds map shapes the active map filter shows that are positioned inside a screen rectangle
+        :type rect: pygame.Rect
+        :return: A list of shapes
+        """
 
-            if best_distance is None or best_distance > distance:
-                best_distance = distance
-                target = shape
+        if not self.shape_index:
+            return []
 
-        return target
+        return self.shape_index.find_in_rect(rect, self.map_context.should_show_entity)
 
     def render(self):
 
         # Smart scale the size to accomodate for the greatest dimension. This lets us support many aspect ratios.
         max_available = max(self.display.bounds.width, self.display.bounds.height)
 
-        # Only recompute the expensive stuff if the resolution has changed or the data fetch time has changed
+        tolerance = self.simplify_tolerances.get(self.map_context.map_zoom, 1)
+
+        # Only recompute the expensive stuff if the resolution, zoom level or data fetch time has changed
         if max_available != self.size[0] or \
+                tolerance != self.last_tolerance or \
                 not self.last_translate or \
                 not self.map.last_data_received or \
                 self.map.last_data_received > self.last_translate:
@@ -72,10 +132,13 @@ class MapRenderer(object):  # TODO: Maybe this should be a UIWidget?
             self.size = (max_available, max_available)
             self.center = self.display.get_content_center()
 
-            # Translate the various curves, etc. into their appropraite screen positions
-            self.osm_shapes = self.map.translate_shapes(self.size, self.center)
+            # Translate the various curves, etc. into their appropraite screen positions. Lines are simplified for the
+            # zoom level here and kept that way until the next translation.
+            self.osm_shapes = self.map.translate_shapes(self.size, self.center, tolerance)
+            self.shape_index = SpatialGrid(self.osm_shapes)
 
             self.last_translate = datetime.now()
+            self.last_tolerance = tolerance
 
         map_context = self.map_context
 
@@ -94,9 +157,23 @@ class MapRenderer(object):  # TODO: Maybe this should be a UIWidget?
             context = self.find_nearest_targetable_object(pos)
             map_context.cursor_context = context
 
-        # Render the open street map data
+        # Render the open street map data, skipping anything that can't be seen
+        self.drawn = self.culled = self.points_before = self.points_after = 0
         if self.osm_shapes:
+            bounds = self.display.bounds
+            left, top, right, bottom = bounds.left, bounds.top, bounds.right, bounds.bottom
+
             for shape in self.osm_shapes:
+
+                if not self.is_on_screen(shape, left, top, right, bottom):
+                    self.culled += 1
+                    continue
+
+                self.drawn += 1
+                if shape.screen_bounds:
+                    self.points_before += shape.point_count
+                    self.points_after += len(shape.screen_points)
+
                 shape.render(self.display, map_context)
 
         # Render locations
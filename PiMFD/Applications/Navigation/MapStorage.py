@@ -0,0 +1,161 @@
+# coding=utf-8
+
+"""
+Contains compact, array-backed storage for map geometry
+"""
+from array import array
+from bisect import bisect_left
+
+__author__ = 'Matt Eland'
+
+
+class MapStore(object):
+    """
+    Holds the locations of every node in a map area and the points of every line in flat arrays rather than as Python
+    objects. Lines refer to a slice of a shared coordinate buffer by offset and length.
+
+    Node IDs are kept as doubles because Python 2's array module has no 64 bit integer type on every platform and OSM
+    IDs have outgrown 32 bits. Doubles hold whole numbers exactly up to 2 ** 53.
+    """
+
+    def __init__(self):
+        super(MapStore, self).__init__()
+
+        self.node_ids = array('d')
+        self.node_lats = array('d')
+        self.node_lngs = array('d')
+
+        # Set when nodes arrive out of ID order. Lists node indexes in ID order along with the matching sorted IDs.
+        self.node_order = None
+        self.sorted_ids = None
+        self.is_sorted = True
+
+        # The points of every line, one line after another
+        self.lats = array('d')
+        self.lngs = array('d')
+
+    @property
+    def node_count(self):
+        """
+        :return: The number of nodes stored
+        """
+        return len(self.node_ids)
+
+    @property
+    def point_count(self):
+        """
+        :return: The number of line points stored
+        """
+        return len(self.lats)
+
+    def add_node(self, id, lat, lng):
+        """
+        Stores a node's location
+        :type id: float
+        :type lat: float
+        :type lng: float
+        :return: The node's index
+        """
+
+        ids = self.node_ids
+
+        if ids and id <= ids[-1]:
+            self.is_sorted = False
+
+        # Any existing index no longer covers every node
+        self.node_order = None
+        self.sorted_ids = None
+
+        ids.append(id)
+        self.node_lats.append(lat)
+        self.node_lngs.append(lng)
+
+        return len(ids) - 1
+
+    def build_index(self):
+        """
+        Sorts node IDs so they can be searched. OSM data normally lists nodes in ID order so this is rarely needed.
+        """
+        ids = self.node_ids
+        self.node_order = array('l', sorted(xrange(len(ids)), key=ids.__getitem__))
+        self.sorted_ids = array('d', [ids[i] for i in self.node_order])
+
+    def find_node(self, id):
+        """
+        Finds a node by its ID
+        :type id: float
+        :return: The node's index or -1 if it isn't stored
+        """
+
+        if self.is_sorted:
+            ids = self.node_ids
+        else:
+            if self.node_order is None:
+                self.build_index()
+            ids = self.sorted_ids
+
+        i = bisect_left(ids, id)
+        if i >= len(ids) or ids[i] != id:
+            return -1
+
+        return i if self.is_sorted else self.node_order[i]
+
+    def add_line(self, node_indexes):
+        """
+        Copies the locations of a line's nodes into the shared coordinate buffer
+        :param node_indexes: Indexes of the nodes along the line
+        :return: The offset and length of the line's points
+        """
+
+        offset = len(self.lats)
+
+        self.lats.extend([self.node_lats[i] for i in node_indexes])
+        self.lngs.extend([self.node_lngs[i] for i in node_indexes])
+
+        return offset, len(node_indexes)
+
+    def get_points(self, offset, length):
+        """
+        Gets a line's points
+        :return: A list of (lat, lng) tuples
+        """
+        end = offset + length
+        return zip(self.lats[offset:end], self.lngs[offset:end])
+
+    def get_bounds(self, offset, length):
+        """
+        Gets the area covered by a line's points
+        :return: min lat, min lng, max lat, max lng
+        """
+        end = offset + length
+        lats = self.lats[offset:end]
+        lngs = self.lngs[offset:end]
+
+        return min(lats), min(lngs), max(lats), max(lngs)
+
+    def __getstate__(self):
+        """
+        Pickles the arrays as raw bytes. Arrays otherwise pickle as lists of floats, which are far larger and slower.
+        """
+        state = self.__dict__.copy()
+        for name, value in state.iteritems():
+            if isinstance(value, array):
+                state[name] = (value.typecode, value.tostring())
+
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.iteritems():
+            if isinstance(value, tuple):
+                typecode, data = value
+                value = array(typecode)
+                value.fromstring(data)
+
+            setattr(self, name, value)
+
+    def get_memory_size(self):
+        """
+        :return: The number of bytes used by the store's arrays
+        """
+        arrays = [self.node_ids, self.node_lats, self.node_lngs, self.lats, self.lngs, self.node_order, self.sorted_ids]
+        return sum([len(a) * a.itemsize for a in arrays if a is not None])
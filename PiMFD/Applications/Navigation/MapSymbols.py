@@ -410,11 +410,12 @@ class MapSymbol(MapEntity):
                         color)
 
         if left_text and map_context.should_show_left_text(self):
+            left_size = font.measure(left_text)
             render_text(display,
                         font,
                         left_text.upper(),
-                        self.x - font.measure(left_text)[0] - 12,
-                        self.y - (font.measure(left_text)[1] / 2.0),
+                        self.x - left_size[0] - 12,
+                        self.y - (left_size[1] / 2.0),
                         display.color_scheme.highlight)
 
         if bottom_text and map_context.should_show_bottom_text(self):
@@ -0,0 +1,98 @@
+# coding=utf-8
+
+"""
+Contains code for dividing the map into fixed tiles that are fetched and kept separately
+"""
+from math import ceil, floor
+
+from PiMFD.Applications.Navigation.MapLines import MapLine
+
+__author__ = 'Matt Eland'
+
+
+class MapTile(object):
+    """
+    The map data for one tile of the map grid
+    :param key: The column and row of the tile
+    :param bounds: min lng, min lat, max lng, max lat
+    :type store: PiMFD.Applications.Navigation.MapStorage.MapStore
+    :param shapes: The tile's shapes
+    :param source: Where the data came from, such as 'CACHE' or 'NETWORK'
+    """
+
+    def __init__(self, key, bounds, store, shapes, source):
+        super(MapTile, self).__init__()
+
+        self.key = key
+        self.bounds = bounds
+        self.store = store
+        self.shapes = shapes
+        self.source = source
+
+        self.batch = None  # A ProjectionBatch of the tile's shapes
+        self.projection = None  # What the tile was last projected with, so it isn't projected the same way twice
+
+
+def get_tile_keys(bounds, tile_size):
+    """
+    Gets the tiles needed to cover an area
+    :param bounds: min lng, min lat, max lng, max lat
+    :param tile_size: The width and height of each tile in degrees
+    :return: A list of (column, row) tuples ordered by row and then column
+    """
+
+    # Rounding first keeps an edge that lies exactly on a tile boundary from pulling in the next tile over
+    min_col = int(floor(round(bounds[0] / tile_size, 6)))
+    min_row = int(floor(round(bounds[1] / tile_size, 6)))
+    max_col = max(min_col, int(ceil(round(bounds[2] / tile_size, 6))) - 1)
+    max_row = max(min_row, int(ceil(round(bounds[3] / tile_size, 6))) - 1)
+
+    return [(col, row) for row in range(min_row, max_row + 1) for col in range(min_col, max_col + 1)]
+
+
+def get_tile_bounds(key, tile_size, places=6):
+    """
+    Gets the area covered by a tile
+    :param key: The column and row of the tile
+    :param tile_size: The width and height of each tile in degrees
+    :param places: The number of decimal places to round to
+    :return: min lng, min lat, max lng, max lat
+    """
+
+    col, row = key
+
+    return (round(col * tile_size, places),
+            round(row * tile_size, places),
+            round((col + 1) * tile_size, places),
+            round((row + 1) * tile_size, places))
+
+
+def merge_tiles(tiles):
+    """
+    Combines the shapes of several tiles. Ways that cross tile edges are included in every tile they touch so only the
+    first copy of each OSM entity is kept. Symbols come before lines, as nodes come before ways in OSM data.
+    :param tiles: MapTiles in the order to merge them
+    :return: A list of shapes
+    """
+
+    seen = set()
+    symbols = []
+    lines = []
+
+    for tile in tiles:
+        for shape in tile.shapes:
+
+            # Nodes and ways are numbered separately
+            is_line = isinstance(shape, MapLine)
+            key = (is_line, shape.id)
+            if key in seen:
+                continue
+
+            seen.add(key)
+
+            if is_line:
+                lines.append(shape)
+            else:
+                symbols.append(shape)
+
+    return symbols + lines
@@ -3,12 +3,8 @@ from threading import Thread
 from time import gmtime, strftime
 import traceback
 
-try:
-    import requests
-except:
-    requests = None
-
 from PiMFD.Applications.Navigation.MapSymbols import MapSymbol
+from PiMFD.Startup import import_optional
 
 
 __author__ = 'Matt Eland'
@@ -63,6 +59,7 @@ class TrafficFetchThread(Thread):
 
         # Grab Data
         try:
+            requests = import_optional('requests')
             response = requests.get(url)
             response_text = response.text
             print(response_text)
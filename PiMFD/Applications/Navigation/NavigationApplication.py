@@ -3,11 +3,9 @@
 The navigation application
 """
 
-from PiMFD.Applications.Application import MFDApplication
-from PiMFD.Applications.Navigation.MapPages import MapPage, MapInfoPage
-from PiMFD.Applications.Navigation.MapLocations import MapLocationsPage, MapLocationAddPage
+from PiMFD.Applications.Application import MFDApplication, LazyPage
+from PiMFD.Applications.Navigation.MapLocations import MapLocationAddPage
 from PiMFD.Applications.Navigation.NavigationDataProvider import NavigationDataProvider
-from PiMFD.Applications.Scheduling.Weather.WeatherPages import WeatherPage
 from PiMFD.UI.Button import MFDButton
 
 
@@ -33,10 +31,12 @@ class NavigationApp(MFDApplication):
 
         self.data_provider = NavigationDataProvider(self)
 
-        self.map_page = MapPage(controller, self)
-        self.info_page = MapInfoPage(controller, self)
-        self.locations_page = MapLocationsPage(controller, self, self.data_provider.map_context, self.map_page)
-        self.weather_page = WeatherPage(controller, self, self.data_provider.map_context)
+        self.map_page = LazyPage(self, 'MAP', 'PiMFD.Applications.Navigation.MapPages', 'MapPage')
+        self.info_page = LazyPage(self, 'INFO', 'PiMFD.Applications.Navigation.MapPages', 'MapInfoPage')
+        self.locations_page = LazyPage(self, 'GOTO', 'PiMFD.Applications.Navigation.MapLocations', 'MapLocationsPage',
+                                       self.data_provider.map_context, self.map_page)
+        self.weather_page = LazyPage(self, 'WTHR', 'PiMFD.Applications.Scheduling.Weather.WeatherPages',
+                                     'WeatherPage', self.data_provider.map_context)
         self.always_render_background = True
         
         self.pages = list([self.map_page])
@@ -50,9 +50,9 @@ class NavigationApp(MFDApplication):
 
     def get_buttons(self):
 
-        if self.active_page is self.map_page:
+        if self.active_page is self.map_page.page:
 
-            self.btn_map.text = self.map_page.get_button_text()
+            self.btn_map.text = self.map_page.page.get_button_text()
             self.btn_page.text = self.data_provider.map_context.get_page_mode_text()
             self.btn_info.enabled = self.data_provider.map_context.cursor_context
 
@@ -65,7 +65,7 @@ class NavigationApp(MFDApplication):
             if buttons and len(buttons) > 0:
                 return buttons
             
-            if self.active_page is self.weather_page:
+            if self.active_page is self.weather_page.page:
                 return [self.btn_back]
             
             return [self.btn_back, self.btn_detail_action, self.btn_save]
@@ -75,7 +75,7 @@ class NavigationApp(MFDApplication):
         if self.active_page and self.active_page.handle_lower_button(index):
             return
         
-        if self.active_page is self.map_page:
+        if self.active_page is self.map_page.page:
 
             if index == 0:
                 self.data_provider.map_context.next_map_mode()
@@ -90,14 +90,14 @@ class NavigationApp(MFDApplication):
             elif index == 3:
                 self.select_page(self.locations_page)
 
-        elif self.active_page in (self.info_page, self.weather_page):
+        elif self.active_page in (self.info_page.page, self.weather_page.page):
 
             if index == 0:
                 self.select_page(self.map_page)
 
             elif index == 1:
-                if self.active_page is self.info_page:
-                    self.info_page.toggle_details()
+                if self.active_page is self.info_page.page:
+                    self.info_page.page.toggle_details()
 
             elif index == 2:  # Save
                 add_page = MapLocationAddPage(self.controller, self, self.map_page)
@@ -143,6 +143,8 @@ class NavigationApp(MFDApplication):
 
     def map_loaded(self, bounds):
 
+        self.data_provider.notify_data_changed()
+
         if bounds:
             self.data_provider.get_traffic(bounds)
 
@@ -166,6 +168,13 @@ class NavigationApp(MFDApplication):
 
     def weather_received(self, location, weather):
         self.data_provider.map.weather_data = weather
+        self.data_provider.notify_data_changed()
+
+    def add_boot_steps(self, boot):
+
+        # Saved locations are read from disk on the worker pool before the navigation provider starts updating
+        locations = boot.add_step('LOCS', self.data_provider.load_locations, background=True)
+        boot.add_step(self.get_button_text(), self.initialize, after=locations)
 
     def initialize(self):
 
@@ -10,6 +10,7 @@ from PiMFD.Applications.Navigation.MapDataPage import MapDataPageProvider
 
 from PiMFD.Applications.Navigation.TrafficDataPage import TrafficDataPageProvider
 from PiMFD.Applications.Navigation.MapContexts import MapContext
+from PiMFD.Applications.Navigation.MapCaching import MapCache
 from PiMFD.Applications.Navigation.MapLoading import Maps
 from PiMFD.Applications.Navigation.MapLocations import MapLocation
 from PiMFD.Applications.Navigation.NavLayers.TrafficLoading import MapTraffic
@@ -41,6 +42,7 @@ class NavigationDataProvider(DataProvider):
         self.traffic = MapTraffic(self.options)
         self.traffic_incidents = None
         self.traffic_widgets = None
+        self.shown_traffic_widgets = list()
 
         self.food_nodes = dict()
         self.camera_nodes = dict()
@@ -53,6 +55,9 @@ class NavigationDataProvider(DataProvider):
         self.camera_widget = None
         self.food_widget = None
 
+        # Set whenever shapes or traffic arrive so the dashboard is only updated when something changed
+        self.dashboard_dirty = True
+
         self.traffic_data_provider = TrafficDataPageProvider(self)
         self.food_data_provider = MapDataPageProvider("Restaurant Data Provider", self.food_nodes)
         self.camera_data_provider = MapDataPageProvider("Camera Data Provider", self.camera_nodes)
@@ -71,6 +76,11 @@ class NavigationDataProvider(DataProvider):
             self.map.profile = True
             
         self.map.output_file = self.options.map_output_file
+        self.map.fetch_threads = self.options.map_fetch_threads
+
+        if self.options.enable_map_cache:
+            self.map.cache = MapCache(self.options.map_cache_dir, self.options.map_cache_ttl, self.options.map_cache_size,
+                                      Maps.GRID_SIZE)
 
         self.map_context = MapContext(self.application, self.map, self)
 
@@ -86,6 +96,9 @@ class NavigationDataProvider(DataProvider):
             self.get_map_data()
             self.requested_data = True
 
+        if self.dashboard and self.dashboard_dirty:
+            self.update_dashboard()
+
         super(NavigationDataProvider, self).update(now)
 
     def register_shape(self, shape):
@@ -109,13 +122,20 @@ class NavigationDataProvider(DataProvider):
         if shape.has_tag('tourism'):
             self.tourism_nodes[shape.id] = shape
 
-    def get_dashboard_widgets(self, display, page):
+        self.dashboard_dirty = True
 
-        widgets = []
+    def update_dashboard(self):
+
+        display = self.dashboard_display
+        page = self.dashboard_page
+        self.dashboard_dirty = False
 
         # Build out the widgets
         if self.traffic_incidents and not self.traffic_widgets:
-            
+
+            for widget in self.shown_traffic_widgets:
+                self.dashboard.hide(widget)
+
             traffic_widgets = []
 
             for incident_key in self.traffic_incidents:
@@ -139,9 +159,10 @@ class NavigationDataProvider(DataProvider):
                         widget.status = DashboardStatus.Critical
 
                 traffic_widgets.append(widget)
-                widgets.append(widget)
+                self.dashboard.show(widget)
 
             self.traffic_widgets = traffic_widgets
+            self.shown_traffic_widgets = traffic_widgets
             
         # Create a Gas Widget
         if self.gas_data_provider and not self.gas_widget:
@@ -156,11 +177,11 @@ class NavigationDataProvider(DataProvider):
             elif count == 1:
                 self.gas_widget.value = '1 Gas Station'
                 self.gas_widget.status = DashboardStatus.Passive
-                widgets.append(self.gas_widget)
             else:
                 self.gas_widget.value = '{} Gas Stations'.format(count)
                 self.gas_widget.status = DashboardStatus.Passive
-                widgets.append(self.gas_widget)
+
+            self.dashboard.set_visible(self.gas_widget, count > 0)
 
         # Create a Cameras Widget
         if self.camera_data_provider and not self.camera_widget:
@@ -175,11 +196,11 @@ class NavigationDataProvider(DataProvider):
             elif count == 1:
                 self.camera_widget.value = '1 Camera'
                 self.camera_widget.status = DashboardStatus.Passive
-                widgets.append(self.camera_widget)
             else:
                 self.camera_widget.value = '{} Cameras'.format(count)
                 self.camera_widget.status = DashboardStatus.Passive
-                widgets.append(self.camera_widget)
+
+            self.dashboard.set_visible(self.camera_widget, count > 0)
 
         # Create a Restaurants Widget
         if self.food_data_provider and not self.food_widget:
@@ -194,13 +215,11 @@ class NavigationDataProvider(DataProvider):
             elif count == 1:
                 self.food_widget.value = '1 Restaurant'
                 self.food_widget.status = DashboardStatus.Passive
-                widgets.append(self.food_widget)
             else:
                 self.food_widget.value = '{} Restaurants'.format(count)
                 self.food_widget.status = DashboardStatus.Passive
-                widgets.append(self.food_widget)
 
-        return widgets
+            self.dashboard.set_visible(self.food_widget, count > 0)
 
     def get_map_data(self, bounds=None, lat=None, lng=None):
 
@@ -245,7 +264,9 @@ class NavigationDataProvider(DataProvider):
 
     def handle_traffic_data(self, incidents):
 
+        # This arrives on a background thread, so the dashboard replaces the old traffic tiles on its next update
         self.traffic_widgets = None
+        self.dashboard_dirty = True
         if not self.traffic_incidents:
             self.traffic_incidents = dict()
             
@@ -254,6 +275,7 @@ class NavigationDataProvider(DataProvider):
                 self.traffic_incidents[incident.id] = incident
 
         self.map.handle_traffic_data(incidents)
+        self.notify_data_changed()
 
     def add_location(self, location):
         self.locations.append(location)
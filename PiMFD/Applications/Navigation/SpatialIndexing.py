@@ -0,0 +1,146 @@
+# coding=utf-8
+
+"""
+Contains a spatial index used to find map entities by their position on the screen
+"""
+import heapq
+
+__author__ = 'Matt Eland'
+
+
+class SpatialGrid(object):
+    """
+    Buckets map entities into a uniform grid of square cells by their projected screen position so that nearby
+    entities can be found without checking all of them. The grid needs to be rebuilt whenever entities are projected
+    again.
+    :param entities: Map entities with x and y screen positions
+    :param cell_size: The width and height of each cell in pixels
+    """
+
+    def __init__(self, entities, cell_size=32):
+        super(SpatialGrid, self).__init__()
+
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+
+        # The range of occupied cells so searches know when to stop looking further out
+        self.min_col = self.max_col = self.min_row = self.max_row = 0
+
+        # Entities remember their order so ties go to the earliest, as they would in a list. Cells are filled inline
+        # rather than through get_cell since grids are rebuilt for every projection.
+        cells = self.cells
+        for order, entity in enumerate(entities):
+            key = (int(entity.x // cell_size), int(entity.y // cell_size))
+            if key in cells:
+                cells[key].append((order, entity))
+            else:
+                cells[key] = [(order, entity)]
+
+        self.count = len(entities)
+
+        if cells:
+            cols = [col for col, row in cells]
+            rows = [row for col, row in cells]
+            self.min_col, self.max_col = min(cols), max(cols)
+            self.min_row, self.max_row = min(rows), max(rows)
+
+    def get_cell(self, x, y):
+        """
+        Gets the column and row of the cell containing a screen position
+        """
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def get_ring(self, col, row, radius):
+        """
+        Gets the cells that are exactly radius cells away from a cell horizontally or vertically
+        :return: A list of (col, row) tuples
+        """
+
+        if radius == 0:
+            return [(col, row)]
+
+        ring = []
+        for c in xrange(col - radius, col + radius + 1):
+            ring.append((c, row - radius))
+            ring.append((c, row + radius))
+
+        for r in xrange(row - radius + 1, row + radius):
+            ring.append((col - radius, r))
+            ring.append((col + radius, r))
+
+        return ring
+
+    def find_nearest(self, pos, count=1, accept=None):
+        """
+        Finds the entities nearest to a screen position
+        :param pos: The x, y screen position to search from
+        :param count: The maximum number of entities to find
+        :param accept: A function taking an entity and returning whether it can be included, or None to include all
+        :return: A list of (squared distance, entity) tuples, nearest first
+        """
+
+        if not self.count or count <= 0:
+            return []
+
+        x, y = pos
+        col, row = self.get_cell(x, y)
+        cells = self.cells
+        best = []  # A heap of the nearest so far as (-squared distance, -order, entity) so the furthest can be dropped
+
+        # The furthest ring that could hold anything
+        max_radius = max(abs(col - self.min_col), abs(col - self.max_col), abs(row - self.min_row),
+                         abs(row - self.max_row))
+
+        for radius in xrange(0, max_radius + 1):
+
+            # Nothing in this ring or beyond can be closer than the inside edge of the ring
+            if len(best) >= count:
+                edge = (radius - 1) * self.cell_size
+                if edge > 0 and edge * edge >= -best[0][0]:
+                    break
+
+            for cell in self.get_ring(col, row, radius):
+                for order, entity in cells.get(cell, ()):
+
+                    dx = entity.x - x
+                    dy = entity.y - y
+                    distance = dx * dx + dy * dy
+
+                    if len(best) >= count and (-distance, -order) <= best[0][:2]:
+                        continue
+
+                    if accept and not accept(entity):
+                        continue
+
+                    if len(best) < count:
+                        heapq.heappush(best, (-distance, -order, entity))
+                    else:
+                        heapq.heapreplace(best, (-distance, -order, entity))
+
+        return [(-distance, entity) for distance, order, entity in sorted(best, reverse=True)]
+
+    def find_in_rect(self, rect, accept=None):
+        """
+        Finds the entities positioned inside a screen rectangle
+        :type rect: pygame.Rect
+        :param accept: A function taking an entity and returning whether it can be included, or None to include all
+        :return: A list of entities in the order they were added
+        """
+
+        min_col, min_row = self.get_cell(max(rect.left, self.min_col * self.cell_size),
+                                         max(rect.top, self.min_row * self.cell_size))
+        max_col, max_row = self.get_cell(min(rect.right, (self.max_col + 1) * self.cell_size),
+                                         min(rect.bottom, (self.max_row + 1) * self.cell_size))
+
+        found = []
+        cells = self.cells
+
+        for col in xrange(min_col, max_col + 1):
+            for row in xrange(min_row, max_row + 1):
+                for order, entity in cells.get((col, row), ()):
+                    if rect.left <= entity.x < rect.right and rect.top <= entity.y < rect.bottom:
+                        if not accept or accept(entity):
+                            found.append((order, entity))
+
+        return [entity for order, entity in sorted(found)]
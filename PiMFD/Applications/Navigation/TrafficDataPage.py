@@ -6,7 +6,6 @@ This file contains a traffic data page
 from PiMFD.Applications.ANI.DataCategoriesPage import DataPage
 from PiMFD.Applications.ANI.DataPageProvider import DataPageProvider
 from PiMFD.UI.Button import MFDButton
-from PiMFD.UI.Widgets.MenuItem import TextMenuItem
 
 __author__ = 'Matt Eland'
 
@@ -33,22 +32,17 @@ class TrafficDataPage(DataPage):
         super(TrafficDataPage, self).__init__(controller, application, page_provider, auto_scroll)
 
     def refresh_children(self):
-        self.pnl_data.children = []
 
-        incidents = self.data_provider.traffic_incidents
+        incidents = self.data_provider.traffic_incidents or dict()
 
-        if incidents:
-            for incident_key in incidents:
-                
-                incident = incidents[incident_key]
-                
-                title = '{} ({}, {})'.format(incident.name, incident.lat, incident.lng)
-                menu_item = TextMenuItem(self.display, self, title)
-                menu_item.font = self.controller.display.fonts.list
-                menu_item.data_context = incident
-                self.pnl_data.children.append(menu_item)
+        self.show_rows([incidents[incident_key] for incident_key in incidents], self.get_incident_text)
 
-        self.focus_first_child()
+    @staticmethod
+    def get_incident_text(incident):
+        """
+        Gets the text to display for a traffic incident in the list
+        """
+        return '{} ({}, {})'.format(incident.name, incident.lat, incident.lng)
 
     def handle_control_state_changed(self, widget):
 
@@ -62,7 +56,7 @@ class TrafficDataPage(DataPage):
 
     def arrange(self):
 
-        if self.data_provider.traffic_incidents and len(self.pnl_data.children) <= 0:
+        if self.data_provider.traffic_incidents and self.lst_data.row_count <= 0:
             self.refresh_children()
 
         return super(TrafficDataPage, self).arrange()
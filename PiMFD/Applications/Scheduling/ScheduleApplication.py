@@ -3,10 +3,8 @@
 The scheduling application
 """
 
-from PiMFD.Applications.Application import MFDApplication
-from PiMFD.Applications.PlaceholderPage import SimpleMessagePage
+from PiMFD.Applications.Application import MFDApplication, LazyPage
 from PiMFD.Applications.Scheduling.Weather.WeatherDataProvider import WeatherDataProvider
-from PiMFD.Applications.Scheduling.Weather.WeatherPages import WeatherPage
 
 __author__ = 'Matt Eland'
 
@@ -30,11 +28,14 @@ class ScheduleApp(MFDApplication):
 
         self.weather_data_provider = WeatherDataProvider(self, controller.options)
 
-        self.root_page = SimpleMessagePage(controller, self, self.get_button_text())
-        self.task_page = SimpleMessagePage(controller, self, "TASK")
-        self.mail_page = SimpleMessagePage(controller, self, "MAIL")
-        self.calendar_page = SimpleMessagePage(controller, self, "CAL")
-        self.weather_page = WeatherPage(controller, self, self.weather_data_provider)
+        placeholders = 'PiMFD.Applications.PlaceholderPage'
+        self.root_page = LazyPage(self, self.get_button_text(), placeholders, 'SimpleMessagePage',
+                                  self.get_button_text())
+        self.task_page = LazyPage(self, "TASK", placeholders, 'SimpleMessagePage', "TASK")
+        self.mail_page = LazyPage(self, "MAIL", placeholders, 'SimpleMessagePage', "MAIL")
+        self.calendar_page = LazyPage(self, "CAL", placeholders, 'SimpleMessagePage', "CAL")
+        self.weather_page = LazyPage(self, "WTHR", 'PiMFD.Applications.Scheduling.Weather.WeatherPages', 'WeatherPage',
+                                     self.weather_data_provider)
 
         self.pages = list([self.task_page, self.mail_page, self.calendar_page, self.weather_page])
 
@@ -45,6 +46,9 @@ class ScheduleApp(MFDApplication):
         """
         return self.root_page
 
+    def get_data_providers(self):
+        return [self.weather_data_provider]
+
     def get_button_text(self):
         """
         Gets text for the button representing this page.
@@ -60,7 +64,7 @@ class ScheduleApp(MFDApplication):
         super(ScheduleApp, self).page_reselected(page)
 
         # If the user re-selects weather, refresh data
-        if page is self.weather_page:
+        if page is self.weather_page.page:
             self.weather_data_provider.get_weather()
 
     def handle_selected(self):
@@ -1,14 +1,7 @@
 from threading import Thread
 
-from suds.client import Client
-
-
-try:
-    import pywapi
-except ImportError:
-    pywapi = None
-
 from PiMFD.Applications.Scheduling.Weather.WeatherData import WeatherData
+from PiMFD.Startup import import_optional
 
 
 __author__ = 'Matt Eland'
@@ -38,7 +31,13 @@ class WeatherAPI(object):
 
     @staticmethod
     def get_ani_weather(location):
-        client = Client("http://www.matteland.com/ANIServices/AniService.svc?wsdl")
+
+        # suds is slow to import, so we wait until weather is requested
+        suds_client = import_optional('suds.client')
+        if not suds_client:
+            return None
+
+        client = suds_client.Client("http://www.matteland.com/ANIServices/AniService.svc?wsdl")
         data = client.service.GetWeatherData('username', 'userapikey', location)  # TODO: Grab these from somewhere
 
         weather_data = WeatherData()
@@ -49,6 +48,7 @@ class WeatherAPI(object):
     @staticmethod
     def get_yahoo_weather(location):
 
+        pywapi = import_optional('PiMFD.Applications.Scheduling.Weather.pywapi')
         if not pywapi:
             return None
 
@@ -66,7 +66,11 @@ class WeatherForecastDashboardWidget(DashboardWidget):
         self.lbl_frost.font = display.fonts.list
         self.panel.children.append(self.lbl_frost)
 
-    def render(self):
+    def get_render_key(self):
+        return (self.status, self.lbl_title.text, self.lbl_value.text, self.lbl_condition.text_data, self.lbl_frost.text,
+                self.chart.value_low, self.chart.value_high)
+
+    def render_content(self):
 
         # Colorize as needed
         color = self.get_color()
@@ -97,6 +101,9 @@ class WeatherForecastDashboardWidget(DashboardWidget):
 
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         self.status = self.get_status()
         self.lbl_title.text = self.title
         if self.forecast and self.weather:
@@ -132,8 +139,11 @@ class WeatherForecastDashboardWidget(DashboardWidget):
                 self.chart.value_low = self.forecast.low
                 self.chart.value_high = self.forecast.high
 
+        self.panel.pos = self.pos[0] + self.padding, self.pos[1] + self.padding
         self.panel.arrange()
         self.desired_size = self.panel.desired_size[0] + (self.padding * 2), self.panel.desired_size[1] + (self.padding * 2)
+
+        self.arranged()
         return self.desired_size
 
     def get_status(self):
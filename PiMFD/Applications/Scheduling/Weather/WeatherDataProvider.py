@@ -18,6 +18,7 @@ class WeatherDataProvider(DataProvider):
     weather_api = None
     last_request = None
     refresh_interval_minutes = 15
+    dashboard_weather = None
 
     def __init__(self, application, options):
         super(WeatherDataProvider, self).__init__("Weather Data Provider")
@@ -35,6 +36,10 @@ class WeatherDataProvider(DataProvider):
         if not self.last_request or (now - self.last_request).seconds > (60 * self.refresh_interval_minutes):
             self.get_weather()
 
+        # Weather arrives on a background thread, so bind it to the dashboard here
+        if self.dashboard and self.weather_data is not self.dashboard_weather:
+            self.update_dashboard()
+
         super(WeatherDataProvider, self).update(now)
 
     def get_weather(self, consumer=None):
@@ -67,6 +72,7 @@ class WeatherDataProvider(DataProvider):
 
     def weather_received(self, location, weather):
         self.weather_data = weather
+        self.notify_data_changed()
 
     def build_weather(self, display, page, widget, label, forecast_index, is_forecast):
         # Update the current weather widget
@@ -85,28 +91,25 @@ class WeatherDataProvider(DataProvider):
 
         return widget
 
-    def get_dashboard_widgets(self, display, page):
+    def update_dashboard(self):
 
-        if self.weather_data:
-            if not self.current_conditions_widget:
-                self.current_conditions_widget = self.build_weather(display, page, self.current_conditions_widget,
-                                                                    "Weather", 0, False)
-            else:
-                self.current_conditions_widget.weather = self.weather_data
+        display = self.dashboard_display
+        page = self.dashboard_page
 
-            if not self.today_forecast_widget:
-                self.today_forecast_widget = self.build_weather(display, page, self.today_forecast_widget, "Today", 0,
-                                                                True)
-            else:
-                self.current_conditions_widget.forecast = self.weather_data.forecasts[0]
+        self.dashboard_weather = self.weather_data
+        if not self.weather_data:
+            return
 
-            if not self.tomorrow_conditions_widget:
-                self.tomorrow_conditions_widget = self.build_weather(display, page, self.tomorrow_conditions_widget,
-                                                                     "Tomorrow", 1, True)
-            else:
-                self.tomorrow_conditions_widget.forecast = self.weather_data.forecasts[1]
+        self.current_conditions_widget = self.build_weather(display, page, self.current_conditions_widget, "Weather", 0,
+                                                            False)
+        self.today_forecast_widget = self.build_weather(display, page, self.today_forecast_widget, "Today", 0, True)
+        self.tomorrow_conditions_widget = self.build_weather(display, page, self.tomorrow_conditions_widget, "Tomorrow",
+                                                             1, True)
 
-            self.tomorrow_conditions_widget.minutes_to_clean_frost = self.weather_data.forecasts[
-                1].minutes_to_clean_frost
+        tomorrow = self.tomorrow_conditions_widget.forecast
+        if tomorrow:
+            self.tomorrow_conditions_widget.minutes_to_clean_frost = tomorrow.minutes_to_clean_frost
 
-        return [self.current_conditions_widget, self.today_forecast_widget, self.tomorrow_conditions_widget]
\ No newline at end of file
+        for widget in (self.current_conditions_widget, self.today_forecast_widget, self.tomorrow_conditions_widget):
+            widget.status = widget.get_status()
+            self.dashboard.show(widget)
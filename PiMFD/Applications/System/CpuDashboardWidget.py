@@ -46,7 +46,10 @@ class CpuDashboardWidget(DashboardWidget):
             return DashboardStatus.Passive
 
     def arrange(self):
-        
+
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         max_value = -1
 
         if not self.charts and self.values and len(self.values) > 0:
@@ -74,11 +77,17 @@ class CpuDashboardWidget(DashboardWidget):
 
         self.lbl_title.text = self.title
 
+        self.panel.pos = self.pos[0] + self.padding, self.pos[1] + self.padding
         self.panel.arrange()
         self.desired_size = 150 + (self.padding * 2), self.panel.desired_size[1] + (self.padding * 2)
+
+        self.arranged()
         return self.desired_size
 
-    def render(self):
+    def get_render_key(self):
+        return self.status, self.title, tuple(self.values or ())
+
+    def render_content(self):
 
         # Colorize as needed
         color = self.get_color()
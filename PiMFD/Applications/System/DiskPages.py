@@ -9,16 +9,8 @@ from PiMFD.Applications.System.ByteFormatting import format_size
 from PiMFD.UI.Widgets.Charts import BarChart
 from PiMFD.UI.Panels import StackPanel
 from PiMFD.UI.Widgets.DashboardWidget import DashboardStatus
-
-
-try:
-    import psutil
-    from psutil._common import sdiskpart
-except ImportError:
-    psutil = None
-    sdiskpart = None
-
 from PiMFD.Applications.MFDPage import MFDPage
+from PiMFD.Startup import import_optional
 from PiMFD.UI.Widgets.MenuItem import MenuItem
 
 __author__ = 'Matt Eland'
@@ -27,7 +19,7 @@ __author__ = 'Matt Eland'
 class DiskDrive(object):
     def __init__(self, partition):
         """
-        :type partition: sdiskpart
+        :type partition: psutil._common.sdiskpart
         """
         super(DiskDrive, self).__init__()
 
@@ -43,6 +35,7 @@ class DiskDrive(object):
         if self.can_get_usage():
 
             # Normal disk - display information on availability / etc.
+            psutil = import_optional('psutil')
             self.usage = psutil.disk_usage(self.mountpoint)
             self.usage_percent = self.usage.percent
 
@@ -114,6 +107,7 @@ class DiskDrive(object):
 
     def refresh_counters(self):
 
+        psutil = import_optional('psutil')
         counters = psutil.disk_io_counters(perdisk=True)
 
         self.load_counters(self.counter_key, counters[self.counter_key])
@@ -9,7 +9,7 @@ except ImportError:
     AF_UNIX = 1
 
 from PiMFD.Applications.MFDPage import MFDPage
-from PiMFD.UI.Widgets.MenuItem import TextMenuItem
+from PiMFD.UI.Widgets.VirtualList import VirtualListPanel
 
 
 """
@@ -32,40 +32,43 @@ class NetworkPage(MFDPage):
 
         self.last_refresh = datetime.now()
         self.data_provider = application.data_provider
-        self.refresh()
 
-    def refresh(self, ):
+        self.connections = list()
+        self.lbl_header = self.get_header_label('Connections ({})')
+        self.lst_connections = VirtualListPanel(self.display, self, self.connections, self.get_connection_text)
+        self.panel.children = [self.lbl_header, self.lst_connections]
 
-        self.panel.children = [self.get_header_label('Connections ({})'.format(len(self.data_provider.connections)))]
+        self.refresh()
 
-        is_first_control = True
+    def refresh(self, ):
 
-        for c in self.data_provider.connections:
+        self.connections[:] = self.data_provider.connections or list()
+        self.lbl_header.text_data = len(self.connections)
 
-            family = self.get_connection_family_text(c.family)
-            conn_type = self.get_connection_type_text(c.type)
-            local_address = self.get_address_text(c.laddr)  # May be tuple or path
-            remote_address = self.get_address_text(c.raddr)  # May be tuple, path, or None
-            status = c.status
-            pid = self.get_process_text(c.pid)
+        if self.connections and self.focus is not self.lst_connections:
+            self.set_focus(self.lst_connections)
 
-            if local_address == remote_address:
-                address_text = remote_address
-            else:
-                address_text = "{}({})".format(remote_address, local_address)
+        self.last_refresh = datetime.now()
 
-            text = "{} {} {}/{} {}".format(status, address_text, conn_type, family, pid)
+    def get_connection_text(self, c):
+        """
+        Gets the text to display for a connection in the list
+        :param c: The connection
+        """
 
-            lbl = TextMenuItem(self.controller.display, self, text)
-            lbl.font = self.controller.display.fonts.list
-            lbl.data_context = c
-            self.panel.children.append(lbl)
+        family = self.get_connection_family_text(c.family)
+        conn_type = self.get_connection_type_text(c.type)
+        local_address = self.get_address_text(c.laddr)  # May be tuple or path
+        remote_address = self.get_address_text(c.raddr)  # May be tuple, path, or None
+        status = c.status
+        pid = self.get_process_text(c.pid)
 
-            if is_first_control:
-                self.set_focus(lbl)
-                is_first_control = False
+        if local_address == remote_address:
+            address_text = remote_address
+        else:
+            address_text = "{}({})".format(remote_address, local_address)
 
-        self.last_refresh = datetime.now()
+        return "{} {} {}/{} {}".format(status, address_text, conn_type, family, pid)
 
     def handle_control_state_changed(self, widget):
 
@@ -163,8 +166,8 @@ class NetworkPage(MFDPage):
 
     def arrange(self):
 
-        num_children = len(self.panel.children)
-        if (num_children <= 1 and self.data_provider.partitions) or (datetime.now() - self.last_refresh).seconds > 60:
+        if (not self.connections and self.data_provider.connections) or (
+            datetime.now() - self.last_refresh).seconds > 60:
             self.refresh()
 
         return super(NetworkPage, self).arrange()
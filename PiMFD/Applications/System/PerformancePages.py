@@ -39,62 +39,100 @@ class PerformancePage(MFDPage):
     def refresh(self):
 
         """
-        Refreshes the list of drives
+        Refreshes the performance statistics. Widgets from the last refresh are reused wherever possible.
         """
 
         # CPU Usage
         if self.application.data_provider.percentages:
-            self.pnl_cpu.children = [self.get_header_label('CPU Performance')]
-            cpu_index = 1
-            for percent in self.application.data_provider.percentages:
-
-                # Protect against bad values on first round
-                if not percent:
-                    percent = 0.0
-
-                pnl = StackPanel(self.display, self, is_horizontal=True)
-                lbl = self.get_list_label('{:02.1f} %'.format(percent))
-                chart = BarChart(self.display, self)
-                chart.value = percent
-                chart.width, chart.height = 50, lbl.font.size
-                pnl.children = [self.get_list_label('{}:'.format(cpu_index)), chart, lbl]
-                self.pnl_cpu.children.append(pnl)
-                cpu_index += 1
+            rows = [('header', 'CPU Performance')]
+
+            # Protect against bad values on first round
+            for cpu_index, percent in enumerate(self.application.data_provider.percentages):
+                rows.append((cpu_index + 1, percent or 0.0))
+
+            self.pnl_cpu.reconcile(rows, self.create_cpu_row, self.update_cpu_row)
 
         # Virtual Memory
         virt_mem = self.application.data_provider.virt_mem
         if virt_mem:
-            self.pnl_virt_mem.children = [self.get_header_label('Virtual Memory')]
-            self.pnl_virt_mem.children.append(self.get_list_label("Percent Used: {} %".format(virt_mem.percent)))
-
-            self.pnl_virt_mem.children.append(BarChart(self.display,
-                                                       self,
-                                                       value=virt_mem.percent,
-                                                       width=200,
-                                                       height=5))
-            
-            self.pnl_virt_mem.children.append(self.get_list_label("Total: {}".format(format_size(virt_mem.total))))
-            self.pnl_virt_mem.children.append(self.get_list_label("Used: {}".format(format_size(virt_mem.used))))
-            self.pnl_virt_mem.children.append(self.get_list_label("Free: {}".format(format_size(virt_mem.free))))
+            rows = [('header', 'Virtual Memory'),
+                    ('percent', "Percent Used: {} %".format(virt_mem.percent)),
+                    ('chart', virt_mem.percent),
+                    ('total', "Total: {}".format(format_size(virt_mem.total))),
+                    ('used', "Used: {}".format(format_size(virt_mem.used))),
+                    ('free', "Free: {}".format(format_size(virt_mem.free)))]
+
             if virt_mem.free != virt_mem.available:
-                self.pnl_virt_mem.children.append(
-                    self.get_list_label("Available: {}".format(format_size(virt_mem.available))))
+                rows.append(('available', "Available: {}".format(format_size(virt_mem.available))))
+
+            self.pnl_virt_mem.reconcile(rows, self.create_memory_row, self.update_memory_row)
 
         # Swap Memory
         swap_mem = self.application.data_provider.swap_mem
         if swap_mem:
-            self.pnl_swap_mem.children = [self.get_header_label('Swap Memory')]
-            self.pnl_swap_mem.children.append(self.get_list_label("Percent Used: {} %".format(swap_mem.percent)))
-
-            self.pnl_swap_mem.children.append(BarChart(self.display,
-                                                       self,
-                                                       value=swap_mem.percent,
-                                                       width=200,
-                                                       height=5))
-            
-            self.pnl_swap_mem.children.append(self.get_list_label("Total: {}".format(format_size(swap_mem.total))))
-            self.pnl_swap_mem.children.append(self.get_list_label("Used: {}".format(format_size(swap_mem.used))))
-            self.pnl_swap_mem.children.append(self.get_list_label("Free: {}".format(format_size(swap_mem.free))))
+            rows = [('header', 'Swap Memory'),
+                    ('percent', "Percent Used: {} %".format(swap_mem.percent)),
+                    ('chart', swap_mem.percent),
+                    ('total', "Total: {}".format(format_size(swap_mem.total))),
+                    ('used', "Used: {}".format(format_size(swap_mem.used))),
+                    ('free', "Free: {}".format(format_size(swap_mem.free)))]
+
+            self.pnl_swap_mem.reconcile(rows, self.create_memory_row, self.update_memory_row)
+
+    def create_cpu_row(self, key, percent):
+        """
+        Creates the widgets for a CPU
+        :param key: The 1-based CPU index or 'header' for the header
+        :param percent: The CPU's usage
+        """
+
+        if key == 'header':
+            return self.get_header_label(percent)
+
+        lbl = self.get_list_label('{:02.1f} %')
+        chart = BarChart(self.display, self)
+        chart.width, chart.height = 50, lbl.font.size
+
+        pnl = StackPanel(self.display, self, is_horizontal=True)
+        pnl.children = [self.get_list_label('{}:'.format(key)), chart, lbl]
+        return pnl
+
+    @staticmethod
+    def update_cpu_row(widget, percent):
+        """
+        Updates the widgets for a CPU with its latest usage
+        """
+
+        if isinstance(widget, StackPanel):
+            lbl_index, chart, lbl = widget.children
+            chart.value = percent
+            lbl.text_data = percent
+
+    def create_memory_row(self, key, data):
+        """
+        Creates a widget for a line of memory statistics
+        :param key: The statistic the row represents
+        :param data: The text of the row or the percentage used for the chart
+        """
+
+        if key == 'header':
+            return self.get_header_label(data)
+
+        if key == 'chart':
+            return BarChart(self.display, self, width=200, height=5)
+
+        return self.get_list_label(data)
+
+    @staticmethod
+    def update_memory_row(widget, data):
+        """
+        Updates a line of memory statistics with its latest value
+        """
+
+        if isinstance(widget, BarChart):
+            widget.value = data
+        else:
+            widget.text = data
 
     def arrange(self):
         """
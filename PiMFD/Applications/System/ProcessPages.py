@@ -13,7 +13,7 @@ except ImportError:
     psutil = None
 
 from PiMFD.Applications.MFDPage import MFDPage
-from PiMFD.UI.Widgets.MenuItem import TextMenuItem
+from PiMFD.UI.Widgets.VirtualList import VirtualListPanel
 
 
 __author__ = 'Matt Eland'
@@ -36,6 +36,25 @@ class ProcessDetailsPage(MFDPage):
 
         self.name = self.get_process_name(process)
 
+        # Sections are built once and updated in place on each refresh
+        self.lbl_header = self.get_header_label("{} (PID: {})")
+
+        self.lbl_cpu = self.get_list_label("CPU:")
+        self.lbl_cpu_pct = self.get_list_label("{} %")
+        self.chrt_cpu = BarChart(self.display, self, 0.0, width=25, height=self.lbl_cpu.font.size)
+        self.pnl_cpu = StackPanel(self.display, self, is_horizontal=True)
+        self.pnl_cpu.children = [self.lbl_cpu, self.chrt_cpu, self.lbl_cpu_pct]
+
+        self.pnl_mem = StackPanel(self.display, self)
+        self.lbl_mem_rss = self.get_list_label("Memory Usage: {}")
+        self.lbl_mem_vms = self.get_list_label("Virtual Memory Size: {}")
+        self.pnl_mem.children = [self.get_label("Memory"), self.lbl_mem_rss, self.lbl_mem_vms]
+
+        self.pnl_connections = StackPanel(self.display, self)
+        self.pnl_files = StackPanel(self.display, self)
+        self.pnl_children = StackPanel(self.display, self)
+        self.pnl_threads = StackPanel(self.display, self)
+
         self.refresh_performance_counters()
 
     @staticmethod
@@ -62,108 +81,113 @@ class ProcessDetailsPage(MFDPage):
     def get_button_text(self):
         return "INFO"
 
+    def create_section_row(self, key, data):
+        """
+        Creates a label for a row in one of the list sections
+        :param key: The key of the row. The section's header uses 'header'.
+        :param data: A tuple of the row's text and data context
+        """
+
+        if key == 'header':
+            return self.get_label(data[0])
+
+        return self.get_list_label(data[0])
+
+    @staticmethod
+    def update_section_row(widget, data):
+        """
+        Updates a label in one of the list sections
+        :param data: A tuple of the row's text and data context
+        """
+        widget.text, widget.data_context = data
+
+    def show_section(self, panel, title, rows):
+        """
+        Reconciles a list section's labels against its latest rows
+        :type panel: StackPanel
+        :param title: The section header
+        :param rows: A sequence of (key, (text, data context)) tuples
+        :return: The panel if it has any rows to show; otherwise None
+        """
+
+        if not rows:
+            return None
+
+        panel.reconcile([('header', (title, None))] + rows, self.create_section_row, self.update_section_row)
+        return panel
+
     def refresh_performance_counters(self):
 
-        self.panel.children = [self.get_header_label("{} (PID: {})".format(self.name, self.process.pid))]
+        self.lbl_header.text_data = self.name, self.process.pid
+        sections = [self.lbl_header]
 
         # Render CPU
         pct = self.process.cpu_percent()
         if not pct:
             pct = 0.0
 
-        lbl_cpu = self.get_list_label("CPU:")
-        lbl_cpu_pct = self.get_list_label("{} %".format(pct))
-        chrt_cpu = BarChart(self.display, self, pct, width=25, height=lbl_cpu.font.size)
-        pnl_cpu = StackPanel(self.display, self, is_horizontal=True)
-        pnl_cpu.children = [lbl_cpu, chrt_cpu, lbl_cpu_pct]
-
-        self.panel.children.append(pnl_cpu)
+        self.lbl_cpu_pct.text_data = pct
+        self.chrt_cpu.value = pct
+        sections.append(self.pnl_cpu)
 
         # Render Memory
         mem = self.process.memory_info()
         if mem:
-            pnl_mem = StackPanel(self.display, self)
-            pnl_mem.children.append(self.get_label("Memory"))
-            pnl_mem.children.append(self.get_list_label("Memory Usage: {}".format(format_size(mem.rss))))
-            pnl_mem.children.append(self.get_list_label("Virtual Memory Size: {}".format(format_size(mem.vms))))
-            self.panel.children.append(pnl_mem)
+            self.lbl_mem_rss.text_data = format_size(mem.rss)
+            self.lbl_mem_vms.text_data = format_size(mem.vms)
+            sections.append(self.pnl_mem)
 
         # Render Connections
         try:
             connections = self.process.connections()
-            if connections:
-                pnl_connections = StackPanel(self.display, self)
-                pnl_connections.children.append(self.get_label("Connections ({})".format(len(connections))))
-                self.panel.children.append(pnl_connections)
-
-                for c in connections:
-                    if c.laddr == c.raddr:
-                        address_text = NetworkPage.get_address_text(c.raddr)
-                    else:
-                        address_text = "{}({})".format(NetworkPage.get_address_text(c.raddr),
-                                                       NetworkPage.get_address_text(c.laddr))
-
-                    text = "{} {} {}/{}".format(c.status,
-                                                address_text,
-                                                NetworkPage.get_connection_type_text(c.type),
-                                                NetworkPage.get_connection_family_text(c.family))
-
-                    lbl = self.get_list_label(text)
-                    pnl_connections.children.append(lbl)
-
         except psutil.NoSuchProcess or psutil.AccessDenied:
-            pass
+            connections = None
+
+        rows = list()
+        for c in connections or ():
+            if c.laddr == c.raddr:
+                address_text = NetworkPage.get_address_text(c.raddr)
+            else:
+                address_text = "{}({})".format(NetworkPage.get_address_text(c.raddr),
+                                               NetworkPage.get_address_text(c.laddr))
+
+            text = "{} {} {}/{}".format(c.status,
+                                        address_text,
+                                        NetworkPage.get_connection_type_text(c.type),
+                                        NetworkPage.get_connection_family_text(c.family))
+
+            rows.append(((c.laddr, c.raddr, c.type), (text, None)))
+
+        sections.append(self.show_section(self.pnl_connections, "Connections ({})".format(len(rows)), rows))
 
         # Render Files
         try:
             files = self.process.open_files()
         except psutil.AccessDenied:
             files = None
-            
-        if files:
-            pnl_files = StackPanel(self.display, self)
-            pnl_files.children.append(self.get_label("Files ({})".format(len(files))))
 
-            for f in files:
-                lbl = self.get_list_label(f.path)
-                lbl.data_context = f
-                pnl_files.children.append(lbl)
+        rows = [((f.path, f.fd), (f.path, f)) for f in files or ()]
+        sections.append(self.show_section(self.pnl_files, "Files ({})".format(len(rows)), rows))
 
-            self.panel.children.append(pnl_files)
-                
         # Render Children
         try:
             children = self.process.children()
         except psutil.NoSuchProcess or psutil.AccessDenied:
             children = None
 
-        if children:
-            pnl_children = StackPanel(self.display, self)
-            pnl_children.children.append(self.get_label("Children ({})".format(len(children))))
-
-            for c in children:
-                name = self.get_process_name(c)
-                lbl = self.get_list_label("{}: {}".format(c.pid, name))
-                lbl.data_context = c
-                pnl_children.children.append(lbl)
-
-            self.panel.children.append(pnl_children)
+        rows = [(c.pid, ("{}: {}".format(c.pid, self.get_process_name(c)), c)) for c in children or ()]
+        sections.append(self.show_section(self.pnl_children, "Children ({})".format(len(rows)), rows))
 
         # Render threads
         try:
             threads = self.process.threads()
         except psutil.AccessDenied or psutil.NoSuchProcess:
             threads = None
-            
-        if threads:
-            pnl_threads = StackPanel(self.display, self)
-            pnl_threads.children = [self.get_label("Threads ({})".format(len(threads)))]
 
-            for t in threads:
-                lbl = self.get_list_label("{}: User: {}, SYS: {}".format(t.id, t.user_time, t.system_time))
-                pnl_threads.children.append(lbl)
+        rows = [(t.id, ("{}: User: {}, SYS: {}".format(t.id, t.user_time, t.system_time), None)) for t in threads or ()]
+        sections.append(self.show_section(self.pnl_threads, "Threads ({})".format(len(rows)), rows))
 
-            self.panel.children.append(pnl_threads)
+        self.panel.children = [section for section in sections if section]
 
 
 class ProcessPage(MFDPage):
@@ -171,23 +195,35 @@ class ProcessPage(MFDPage):
     def __init__(self, controller, application, auto_scroll=True):
         super(ProcessPage, self).__init__(controller, application, auto_scroll)
 
+        self.processes = list()
+        self.lbl_header = self.get_header_label('Processes ({})')
+        self.lst_processes = VirtualListPanel(self.display, self, self.processes, self.get_process_text)
+        self.panel.children = [self.lbl_header, self.lst_processes]
+
         self.last_refresh = datetime.now()
         self.refresh()
 
+    @staticmethod
+    def get_process_text(process):
+        """
+        Gets the text to display for a process in the list
+        :type process: psutil.Process
+        """
+        return "{}: {}".format(process.pid, process.name())
+
     def refresh(self,):
 
         if not psutil:
             return
 
-        self.panel.children = [
-            self.get_header_label('Processes ({})'.format(len(self.application.data_provider.processes)))]
-
-        is_first_control = True
+        self.lbl_header.text_data = len(self.application.data_provider.processes)
 
+        # Only keep processes we can get names for. psutil remembers names so displaying rows won't look them up again.
+        processes = list()
         for p in self.application.data_provider.processes:
 
             try:
-                name = p.name()
+                p.name()
 
             except psutil.AccessDenied:
                 continue
@@ -195,15 +231,12 @@ class ProcessPage(MFDPage):
             except psutil.NoSuchProcess:
                 continue
 
-            lbl = TextMenuItem(self.controller.display, self, "{}: {}".format(p.pid, name))
-            lbl.font = self.display.fonts.list
-            lbl.data_context = p
+            processes.append(p)
 
-            self.panel.children.append(lbl)
+        self.processes[:] = processes
 
-            if is_first_control:
-                self.set_focus(lbl)
-                is_first_control = False
+        if self.processes and self.focus is not self.lst_processes:
+            self.set_focus(self.lst_processes)
 
         self.last_refresh = datetime.now()
 
@@ -218,7 +251,7 @@ class ProcessPage(MFDPage):
 
     def arrange(self):
 
-        if (len(self.panel.children) <= 1 and self.application.data_provider.processes) or (
+        if (not self.processes and self.application.data_provider.processes) or (
             datetime.now() - self.last_refresh).seconds > 15:
             self.refresh()
         
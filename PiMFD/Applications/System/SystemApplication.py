@@ -1,12 +1,7 @@
 # coding=utf-8
 
-from PiMFD.Applications.Application import MFDApplication
-from PiMFD.Applications.System.DiskPages import DiskDrivesPage
-from PiMFD.Applications.System.NetworkPages import NetworkPage
-from PiMFD.Applications.System.PerformancePages import PerformancePage
-from PiMFD.Applications.System.ProcessPages import ProcessPage, ProcessDetailsPage
+from PiMFD.Applications.Application import MFDApplication, LazyPage
 from PiMFD.Applications.System.SystemDataProvider import SystemDataProvider
-from PiMFD.Applications.System.WMIServicesPages import WMIServicesPage
 
 
 __author__ = 'Matt Eland'
@@ -28,11 +23,11 @@ class SysApplication(MFDApplication):
         super(SysApplication, self).__init__(controller)
 
         self.data_provider = SystemDataProvider("System Data Provider", self)
-        self.perf_page = PerformancePage(controller, self)
-        self.proc_page = ProcessPage(controller, self)
-        self.disk_page = DiskDrivesPage(controller, self)
-        self.net_page = NetworkPage(controller, self)
-        self.services_page = WMIServicesPage(controller, self)
+        self.perf_page = LazyPage(self, 'PERF', 'PiMFD.Applications.System.PerformancePages', 'PerformancePage')
+        self.proc_page = LazyPage(self, 'PROC', 'PiMFD.Applications.System.ProcessPages', 'ProcessPage')
+        self.disk_page = LazyPage(self, 'DRVS', 'PiMFD.Applications.System.DiskPages', 'DiskDrivesPage')
+        self.net_page = LazyPage(self, 'CONN', 'PiMFD.Applications.System.NetworkPages', 'NetworkPage')
+        self.services_page = LazyPage(self, 'SRVC', 'PiMFD.Applications.System.WMIServicesPages', 'WMIServicesPage')
 
         self.pages = list([self.perf_page, self.disk_page, self.services_page, self.proc_page, self.net_page])
 
@@ -63,6 +58,8 @@ class SysApplication(MFDApplication):
                     break
 
             if proc:
+                # Process pages import psutil, so they aren't imported until a process is shown
+                from PiMFD.Applications.System.ProcessPages import ProcessDetailsPage
                 self.select_page(ProcessDetailsPage(self.controller, self, proc))
 
     def initialize(self):
@@ -3,21 +3,30 @@
 """
 This file contains a data provider for system data
 """
-try:
-    import psutil
-except:
-    psutil = None
+from collections import namedtuple
 
 from PiMFD.Applications.System.CpuDashboardWidget import CpuDashboardWidget
 from PiMFD.Applications.System.DiskPages import DiskDrive
 
 from PiMFD.DataProvider import DataProvider
+from PiMFD.Startup import import_optional
 from PiMFD.UI.Widgets.DashboardWidget import BarChartDashboardWidget, DashboardStatus
 
 
 __author__ = 'Matt Eland'
 
 
+# An immutable set of system data published by the background refresh
+SystemSnapshot = namedtuple('SystemSnapshot', ['processes',
+                                               'percentages',
+                                               'virt_mem',
+                                               'swap_mem',
+                                               'partitions',
+                                               'drives',
+                                               'disk_counters',
+                                               'connections'])
+
+
 class SystemDataProvider(DataProvider):
     
     last_proc_update = None
@@ -30,45 +39,104 @@ class SystemDataProvider(DataProvider):
     drives_update_interval = 10
     conn_update_interval = 60
 
+    refresh_interval = 1
+    refresh_timeout = 30
+
     cpu_widget = None
     drive_widgets = None
+    drive_widgets_source = None
     mem_widget = None
+    dashboard_snapshot = None
 
     def __init__(self, name, application):
         super(SystemDataProvider, self).__init__(name)
 
         self.application = application
-        self.processes = []
-        self.percentages = []
-        self.virt_mem = None
-        self.swap_mem = None
-        self.partitions = []
-        self.drives = []
-        self.disk_counters = None
-        self.connections = []
+        self.snapshot = SystemSnapshot(processes=[],
+                                       percentages=[],
+                                       virt_mem=None,
+                                       swap_mem=None,
+                                       partitions=[],
+                                       drives=[],
+                                       disk_counters=None,
+                                       connections=[])
+
+    @property
+    def has_psutil(self):
+        """
+        Whether psutil is installed. psutil is imported by the first refresh rather than at startup.
+        """
+        return import_optional('psutil') is not None
+
+    @property
+    def processes(self):
+        return self.snapshot.processes
+
+    @property
+    def percentages(self):
+        return self.snapshot.percentages
+
+    @property
+    def virt_mem(self):
+        return self.snapshot.virt_mem
+
+    @property
+    def swap_mem(self):
+        return self.snapshot.swap_mem
+
+    @property
+    def partitions(self):
+        return self.snapshot.partitions
+
+    @property
+    def drives(self):
+        return self.snapshot.drives
+
+    @property
+    def disk_counters(self):
+        return self.snapshot.disk_counters
+
+    @property
+    def connections(self):
+        return self.snapshot.connections
+
+    def update(self, now):
+        super(SystemDataProvider, self).update(now)
+
+        # The background refresh publishes a new snapshot whenever it collects new data
+        if self.dashboard and self.snapshot is not self.dashboard_snapshot:
+            self.update_dashboard()
 
-        if psutil:
-            self.has_psutil = True
-        else:
-            self.has_psutil = False
+    def update_dashboard(self):
 
-    def get_dashboard_widgets(self, display, page):
+        display = self.dashboard_display
+        page = self.dashboard_page
 
-        widgets = []
+        # Read from a single snapshot since the background thread may publish a new one at any time
+        snapshot = self.snapshot
+        self.dashboard_snapshot = snapshot
 
         # Instantiate CPU Widget as needed
-        if not self.cpu_widget and self.percentages and len(self.percentages) > 0:
+        if not self.cpu_widget and snapshot.percentages and len(snapshot.percentages) > 0:
             self.cpu_widget = CpuDashboardWidget(display, page)
 
-        # Populate / refresh the CPU widget
+        # Populate / refresh the CPU widget. Status is set here as well so the dashboard can order by it.
         if self.cpu_widget:
-            self.cpu_widget.values = self.percentages
-            widgets.append(self.cpu_widget)
+            self.cpu_widget.values = snapshot.percentages
+            self.cpu_widget.status = self.cpu_widget.get_percent_status(max([-1] + list(snapshot.percentages or [])))
+            self.dashboard.show(self.cpu_widget)
             
         # Instantiate Drive Widgets as Needed
-        if (not self.drive_widgets or len(self.drive_widgets) <= 0) and self.drives:
+        if self.drive_widgets_source is not snapshot.drives:
+            for drive_widget in self.drive_widgets or []:
+                self.dashboard.hide(drive_widget)
+
+            self.drive_widgets = None
+
+        if (not self.drive_widgets or len(self.drive_widgets) <= 0) and snapshot.drives:
             self.drive_widgets = []
-            for drive in self.drives:
+            self.drive_widgets_source = snapshot.drives
+            for drive in snapshot.drives:
                 if drive and drive.can_get_usage():
                     widget = BarChartDashboardWidget(display, page, drive.device, value=drive.usage_percent)
                     widget.data_context = drive
@@ -80,73 +148,87 @@ class SystemDataProvider(DataProvider):
                 drive = drive_widget.data_context
                 drive_widget.value = drive.usage_percent
                 drive_widget.status = drive.get_dashboard_status()
-                widgets.append(drive_widget)
+                self.dashboard.show(drive_widget)
                 
         # Instantiate Memory Widget as Needed
-        if not self.mem_widget and self.virt_mem:
-            self.mem_widget = BarChartDashboardWidget(display, page, 'Virt. Memory', value=self.virt_mem.percent)
+        virt_mem = snapshot.virt_mem
+        if not self.mem_widget and virt_mem:
+            self.mem_widget = BarChartDashboardWidget(display, page, 'Virt. Memory', value=virt_mem.percent)
             
         # Update the values in the memory widget
-        if self.mem_widget and self.virt_mem:
+        if self.mem_widget and virt_mem:
             
             # Set Value
-            self.mem_widget.value = self.virt_mem.percent
+            self.mem_widget.value = virt_mem.percent
             
             # Update Mem Widget Status
-            if self.virt_mem.percent >= 90:
+            if virt_mem.percent >= 90:
                 self.mem_widget.status = DashboardStatus.Critical
-            elif self.virt_mem.percent >= 75:
+            elif virt_mem.percent >= 75:
                 self.mem_widget.status = DashboardStatus.Caution
             else:
                 self.mem_widget.status = DashboardStatus.Passive
                 
-            widgets.append(self.mem_widget)
+            self.dashboard.show(self.mem_widget)
 
-        return widgets
+    def refresh(self, now):
+        """
+        Collects system data on a background thread and publishes it as a new snapshot
+        :type now: datetime.datetime The current time
+        """
 
-    def update(self, now):
+        psutil = import_optional('psutil')
+        if not psutil:
+            return
 
-        if psutil:
+        old = self.snapshot
+        snapshot = old
 
-            # Update Perf Data as needed
-            if not self.last_perf_update or (now - self.last_perf_update).seconds >= self.perf_update_interval:
-                self.percentages = psutil.cpu_percent(percpu=True)
-                
-                self.last_perf_update = now
+        # Update Perf Data as needed
+        if not self.last_perf_update or (now - self.last_perf_update).seconds >= self.perf_update_interval:
+            snapshot = snapshot._replace(percentages=psutil.cpu_percent(percpu=True))
 
-            # Update Processes as needed
-            if not self.last_proc_update or (now - self.last_proc_update).seconds >= self.process_update_interval:
-                self.processes = psutil.get_process_list()
-                self.virt_mem = psutil.virtual_memory()
-                self.swap_mem = psutil.swap_memory()
-                
-                self.last_proc_update = now
+            self.last_perf_update = now
 
-            # Update Disk Drives
-            if not self.last_drive_update or (now - self.last_drive_update).seconds >= self.drives_update_interval:
-                self.partitions = psutil.disk_partitions()
-                
-                # Build a list of drives
-                self.drives = []
-                if self.partitions:
-                    for partition in self.partitions:
-                        drive = DiskDrive(partition)
-                        self.drives.append(drive)
-
-                # Grab Disk IO over the course of a second
-                self.disk_counters = psutil.disk_io_counters(perdisk=True)
-                self.disk_counters = psutil.disk_io_counters(perdisk=True)
-                self.drive_widgets = None
-
-                self.last_drive_update = now
-                
-            # Connections
-            if not self.last_conn_update or (now - self.last_conn_update).seconds >= self.conn_update_interval:
-                try:
-                    self.connections = psutil.net_connections(kind='all')
-                except psutil.AccessDenied:
-                    self.connections = []
-                    
-                self.last_conn_update = now
-
-        super(SystemDataProvider, self).update(now)
\ No newline at end of file
+        # Update Processes as needed
+        if not self.last_proc_update or (now - self.last_proc_update).seconds >= self.process_update_interval:
+            snapshot = snapshot._replace(processes=psutil.get_process_list(),
+                                         virt_mem=psutil.virtual_memory(),
+                                         swap_mem=psutil.swap_memory())
+
+            self.last_proc_update = now
+
+        # Update Disk Drives
+        if not self.last_drive_update or (now - self.last_drive_update).seconds >= self.drives_update_interval:
+            partitions = psutil.disk_partitions()
+
+            # Build a list of drives
+            drives = []
+            if partitions:
+                for partition in partitions:
+                    drive = DiskDrive(partition)
+                    drives.append(drive)
+
+            # Grab Disk IO over the course of a second
+            disk_counters = psutil.disk_io_counters(perdisk=True)
+            disk_counters = psutil.disk_io_counters(perdisk=True)
+
+            snapshot = snapshot._replace(partitions=partitions, drives=drives, disk_counters=disk_counters)
+
+            self.last_drive_update = now
+
+        # Connections
+        if not self.last_conn_update or (now - self.last_conn_update).seconds >= self.conn_update_interval:
+            try:
+                connections = psutil.net_connections(kind='all')
+            except psutil.AccessDenied:
+                connections = []
+
+            snapshot = snapshot._replace(connections=connections)
+
+            self.last_conn_update = now
+
+        # Publish everything at once so the rendering thread never sees a partial update
+        if snapshot is not old:
+            self.snapshot = snapshot
+            self.notify_data_changed()
@@ -0,0 +1,817 @@
+# coding=utf-8
+
+"""
+Contains a headless, repeatable benchmark of Pi-MFD's pages using fixture data instead of network services
+"""
+from datetime import datetime
+from math import floor
+from multiprocessing import Process, Queue
+import os
+import platform
+import sys
+from timeit import default_timer
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from PiMFD.Applications.Navigation.MapLines import MapLine
+from PiMFD.Applications.Navigation.MapParsing import OsmStreamParser, open_map_data
+from PiMFD.Applications.Navigation.MapProjection import MapProjector, ProjectionBatch
+from PiMFD.Applications.Navigation.MapStorage import MapStore
+from PiMFD.Applications.Navigation.MapSymbols import MapSymbol
+from PiMFD.Applications.Scheduling.Weather.WeatherData import WeatherData
+from PiMFD.Startup import import_optional
+from PiMFD.UI import Keycodes
+
+__author__ = 'Matt Eland'
+
+
+class FixtureMapSource(object):
+    """
+    Generates deterministic OSM XML for any bounds. Streets lie on a fixed grid of absolute coordinates, so the same
+    area always produces the same data and overlapping requests agree with each other. Like the OSM API, every way that
+    touches the bounds is included in full, so streets are split into fixed runs of blocks rather than running forever.
+    """
+
+    spacing = 0.0005  # Degrees between streets
+    poi_frequency = 12  # One point of interest per this many blocks
+    street_blocks = 8  # Blocks in each way making up a street
+
+    def __init__(self, density=1.0):
+        super(FixtureMapSource, self).__init__()
+
+        self.spacing = FixtureMapSource.spacing / density
+        self.requests = 0
+
+    @staticmethod
+    def entity_id(kind, i, j=0):
+        """
+        Builds a stable ID for an entity at a grid location. Kind separates entities sharing the same grid cell.
+        """
+        return ((kind * 400000 + i + 180000) * 1000000) + j + 360000
+
+    def get_street_runs(self, first, last):
+        """
+        Gets the runs of blocks that streets crossing a range of grid lines are split into
+        :param first: The first grid line crossed
+        :param last: The last grid line crossed
+        :return: A list of (run number, grid lines) tuples
+        """
+        blocks = self.street_blocks
+        return [(run, range(run * blocks, (run + 1) * blocks + 1))
+                for run in range(int(floor(first / float(blocks))), int(floor(last / float(blocks))) + 1)]
+
+    def __call__(self, bounds):
+        """
+        Builds OSM XML for the specified bounds
+        :param bounds: min lng, min lat, max lng, max lat
+        :return: The OSM XML as a string
+        """
+
+        self.requests += 1
+
+        min_lng, min_lat, max_lng, max_lat = bounds
+        spacing = self.spacing
+
+        rows = range(int(floor(min_lat / spacing)), int(floor(max_lat / spacing)) + 1)
+        cols = range(int(floor(min_lng / spacing)), int(floor(max_lng / spacing)) + 1)
+
+        row_runs = self.get_street_runs(rows[0], rows[-1])
+        col_runs = self.get_street_runs(cols[0], cols[-1])
+
+        nodes = []
+        ways = []
+
+        # Street intersections, including those past the bounds on streets that cross into them
+        intersections = set()
+        for i in rows:
+            for run, run_cols in col_runs:
+                intersections.update([(i, j) for j in run_cols])
+        for run, run_rows in row_runs:
+            for j in cols:
+                intersections.update([(i, j) for i in run_rows])
+
+        for i, j in sorted(intersections):
+            nodes.append('<node id="{}" visible="true" lat="{:.7f}" lon="{:.7f}"/>'.format(
+                self.entity_id(0, i, j), i * spacing, j * spacing))
+
+        # East / West streets
+        for i in rows:
+            for run, run_cols in col_runs:
+                refs = ''.join(['<nd ref="{}"/>'.format(self.entity_id(0, i, j)) for j in run_cols])
+                kind = 'primary' if i % 4 == 0 else 'residential'
+                ways.append('<way id="{}" visible="true">{}<tag k="highway" v="{}"/><tag k="name" v="{} St"/></way>'
+                            .format(self.entity_id(1, i, run), refs, kind, abs(i) % 1000))
+
+        # North / South streets
+        for j in cols:
+            for run, run_rows in row_runs:
+                refs = ''.join(['<nd ref="{}"/>'.format(self.entity_id(0, i, j)) for i in run_rows])
+                kind = 'secondary' if j % 5 == 0 else 'residential'
+                ways.append('<way id="{}" visible="true">{}<tag k="highway" v="{}"/><tag k="name" v="{} Ave"/></way>'
+                            .format(self.entity_id(2, j, run), refs, kind, abs(j) % 1000))
+
+        # A building in each block and the occasional point of interest
+        inset = spacing * 0.2
+        for i in rows[:-1]:
+            for j in cols[:-1]:
+                corners = ((i * spacing + inset, j * spacing + inset),
+                           (i * spacing + inset, (j + 1) * spacing - inset),
+                           ((i + 1) * spacing - inset, (j + 1) * spacing - inset),
+                           ((i + 1) * spacing - inset, j * spacing + inset))
+
+                refs = []
+                for kind, corner in enumerate(corners):
+                    node_id = self.entity_id(kind + 1, i, j)
+                    nodes.append('<node id="{}" visible="true" lat="{:.7f}" lon="{:.7f}"/>'.format(
+                        node_id, corner[0], corner[1]))
+                    refs.append('<nd ref="{}"/>'.format(node_id))
+
+                refs.append(refs[0])
+                ways.append('<way id="{}" visible="true">{}<tag k="building" v="yes"/></way>'.format(
+                    self.entity_id(3, i, j), ''.join(refs)))
+
+                if (i * 31 + j * 17) % self.poi_frequency == 0:
+                    nodes.append(self.build_poi(i, j))
+
+        return '<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6" generator="Pi-MFD Benchmark">' \
+               '<bounds minlat="{}" minlon="{}" maxlat="{}" maxlon="{}"/>{}{}</osm>'.format(min_lat, min_lng,
+                                                                                         max_lat, max_lng,
+                                                                                         ''.join(nodes),
+                                                                                         ''.join(ways))
+
+    def build_poi(self, i, j):
+        """
+        Builds a point of interest in the center of a block
+        """
+
+        kinds = (('amenity', 'restaurant'), ('amenity', 'fuel'), ('shop', 'supermarket'), ('tourism', 'museum'))
+        key, value = kinds[abs(i + j) % len(kinds)]
+
+        return '<node id="{}" visible="true" lat="{:.7f}" lon="{:.7f}"><tag k="{}" v="{}"/>' \
+               '<tag k="name" v="{} {}"/></node>'.format(self.entity_id(5, i, j),
+                                                         (i + 0.5) * self.spacing,
+                                                         (j + 0.5) * self.spacing,
+                                                         key, value, value.title(), abs(i * j) % 100)
+
+
+class SlowMapSource(object):
+    """
+    Wraps a map source so that it takes as long to answer as a map server would: a fixed wait for every request plus the
+    time to download the data
+    :param source: The map source to wrap
+    :param latency: Seconds of waiting for each request
+    :param bytes_per_second: The download speed
+    """
+
+    def __init__(self, source, latency=0.5, bytes_per_second=1024 * 1024):
+        super(SlowMapSource, self).__init__()
+
+        self.source = source
+        self.latency = latency
+        self.bytes_per_second = bytes_per_second
+        self.requests = 0
+        self.bytes = 0
+
+    def __call__(self, bounds):
+        data = self.source(bounds)
+
+        time.sleep(self.latency + len(data) / float(self.bytes_per_second))
+
+        self.requests += 1
+        self.bytes += len(data)
+
+        return data
+
+
+class FixtureWeatherAPI(object):
+    """
+    Stands in for WeatherAPI and immediately provides the same weather every time
+    """
+
+    def get_yahoo_weather(self, location):
+        weather = WeatherData()
+        weather.parse_yahoo_data(self.build_yahoo_data(location))
+        return weather
+
+    def get_weather_async(self, location, consumer):
+        consumer.weather_received(location, self.get_yahoo_weather(location))
+
+    @staticmethod
+    def build_yahoo_data(location):
+
+        forecasts = []
+        for day in range(0, 5):
+            forecasts.append({'text': 'Partly Cloudy',
+                              'code': '30',
+                              'high': str(70 + day),
+                              'low': str(50 + day),
+                              'date': '{} Jun 2015'.format(day + 1),
+                              'day': ('Mon', 'Tue', 'Wed', 'Thu', 'Fri')[day]})
+
+        return {'condition': {'text': 'Fair', 'code': '34', 'temp': '68', 'date': 'Mon, 01 Jun 2015 8:00 am EDT'},
+                'wind': {'speed': '7', 'direction': 225, 'chill': '68'},
+                'units': {'temperature': 'F', 'speed': 'mph', 'pressure': 'in', 'distance': 'mi'},
+                'location': {'city': 'Benchmark {}'.format(location)},
+                'atmosphere': {'humidity': '52', 'pressure': '30.1', 'visibility': '10'},
+                'astronomy': {'sunrise': '6:05 am', 'sunset': '8:55 pm'},
+                'geo': {'lat': '40', 'long': '-83'},
+                'forecasts': forecasts}
+
+
+def get_peak_rss_kb():
+    """
+    Gets the peak resident set size of this process in kilobytes or None if the platform can't tell us
+    """
+
+    if not resource:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Mac OS reports bytes. Everyone else reports kilobytes.
+    if sys.platform == 'darwin':
+        peak /= 1024
+
+    return peak
+
+
+def summarize_frame_times(times):
+    """
+    Summarizes a list of frame times
+    :param times: Frame durations in seconds
+    :return: A dictionary of statistics with times in milliseconds
+    """
+
+    if not times:
+        return {'frames': 0}
+
+    ordered = sorted(times)
+    total = sum(times)
+
+    def percentile(p):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100.0))] * 1000, 3)
+
+    return {'frames': len(times),
+            'fps': round(len(times) / total, 2) if total > 0 else None,
+            'mean_ms': round(total / len(times) * 1000, 3),
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'p99_ms': percentile(99),
+            'max_ms': round(ordered[-1] * 1000, 3)}
+
+
+def benchmark_overlays(display, frames=300):
+    """
+    Measures the cost of rendering overlays with the static overlay layer rebuilt every frame versus cached
+    :param display: A DisplayManager that has had its graphics initialized
+    :type display: PiMFD.UI.DisplayManager.DisplayManager
+    :param frames: The number of frames to measure for each mode
+    :return: A dictionary of results suitable for serializing to JSON
+    """
+
+    options = display.options
+    original = options.cache_static_overlays
+
+    results = {'resolution': [display.bounds.width, display.bounds.height]}
+
+    try:
+        for name, cached in (('uncached', False), ('cached', True)):
+            options.cache_static_overlays = cached
+
+            times = []
+            for frame in range(0, frames):
+                display.render_background()
+
+                start = default_timer()
+                display.render_overlays()
+                times.append(default_timer() - start)
+
+            results[name] = summarize_frame_times(times)
+
+    finally:
+        options.cache_static_overlays = original
+
+    return results
+
+
+def write_map_fixture(filename, lat, lng, size):
+    """
+    Saves fixture map data to disk in the same form as map_data.xml
+    :param filename: The file to write
+    :param lat: The latitude at the center of the area
+    :param lng: The longitude at the center of the area
+    :param size: The distance in degrees from the center to each edge, such as a MapZooms value
+    """
+
+    with open(filename, 'w') as f:
+        f.write(FixtureMapSource()((lng - size, lat - size, lng + size, lat + size)))
+
+
+def get_object_size(value, seen=None):
+    """
+    Estimates the memory held by an object and everything inside it
+    :param value: The object to measure
+    :param seen: IDs of objects already counted
+    :return: The size in bytes
+    """
+
+    if seen is None:
+        seen = set()
+
+    if id(value) in seen:
+        return 0
+
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum([get_object_size(k, seen) + get_object_size(v, seen) for k, v in value.iteritems()])
+    elif isinstance(value, (list, tuple, set)):
+        size += sum([get_object_size(item, seen) for item in value])
+
+    return size
+
+
+def get_map_memory_stats(node_count, point_count, geometry):
+    """
+    Describes how much memory map geometry takes
+    :param node_count: The number of nodes in the map
+    :param point_count: The number of points across all lines
+    :param geometry: The objects holding node locations and line points
+    :return: A dictionary of statistics
+    """
+
+    size = get_object_size(geometry)
+
+    return {'nodes': node_count,
+            'line_points': point_count,
+            'geometry_kb': size / 1024,
+            'geometry_bytes_per_node': round(float(size) / node_count, 1) if node_count else None}
+
+
+def parse_map_file_streaming(filename):
+    """
+    Loads shapes from a saved map file the way MapLoading does, streaming the file through OsmStreamParser into a
+    MapStore
+    :return: A dictionary of statistics
+    """
+
+    with open(filename, 'rb') as f:
+        parser = OsmStreamParser()
+        shapes = parser.parse(open_map_data(f))
+
+    store = parser.store
+    results = get_map_memory_stats(store.node_count, store.point_count, [store.node_ids, store.node_lats,
+                                                                          store.node_lngs, store.lats, store.lngs])
+    results['shapes'] = len(shapes)
+
+    return results
+
+
+def parse_map_file_xmltodict(filename):
+    """
+    Loads shapes from a saved map file the way MapLoading used to: the entire response as text and as UTF-8, then an
+    xmltodict tree of the whole document, then shapes built from the tree with a list of points for each line
+    :return: A dictionary of statistics
+    """
+
+    xmltodict = import_optional('xmltodict')
+
+    with open(filename, 'rb') as f:
+        text = f.read().decode('UTF-8')
+
+    data = text.encode('UTF-8')
+    osm = xmltodict.parse(data)['osm']
+
+    def as_list(value):
+        return value if isinstance(value, list) else [value]
+
+    nodes = {}
+    shapes = []
+
+    for node in as_list(osm.get('node', [])):
+        nodes[node['@id']] = node
+
+        if node.get('@visible') == 'false' or 'tag' not in node:
+            continue
+
+        location = MapSymbol(float(node['@lat']), float(node['@lon']))
+        location.id = node['@id']
+
+        if [OsmStreamParser.process_tag(location, tag['@k'], tag['@v']) for tag in as_list(node['tag'])].count(True):
+            shapes.append(location)
+
+    for way in as_list(osm.get('way', [])):
+
+        if way.get('@visible') == 'false':
+            continue
+
+        path = MapLine()
+        path.id = way['@id']
+
+        for nd in as_list(way.get('nd', [])):
+            node = nodes.get(nd['@ref'])
+            if node:
+                path.points.append((float(node['@lat']), float(node['@lon'])))
+
+        for tag in as_list(way.get('tag', [])):
+            OsmStreamParser.process_tag(path, tag['@k'], tag['@v'])
+
+        if len(path.points) > 1:
+            path.calculate_lat_lng_from_points()
+            shapes.append(path)
+
+    lines = [shape.points for shape in shapes if isinstance(shape, MapLine)]
+    results = get_map_memory_stats(len(nodes), sum([len(points) for points in lines]), [nodes, lines])
+    results['shapes'] = len(shapes)
+
+    return results
+
+
+def measure_map_parser(parser, filename, results):
+    """
+    Times a map parser and measures how much its peak memory grows. This runs in its own process so each parser's peak
+    is measured from the same starting point.
+    :param parser: A function taking a filename and returning a dictionary of statistics
+    :param filename: The saved map data to parse
+    :type results: multiprocessing.Queue
+    """
+
+    baseline = get_peak_rss_kb()
+
+    start = default_timer()
+    stats = parser(filename)
+    elapsed = default_timer() - start
+
+    peak = get_peak_rss_kb()
+
+    stats['parse_ms'] = round(elapsed * 1000, 3)
+    stats['peak_rss_growth_kb'] = peak - baseline if peak is not None and baseline is not None else None
+
+    results.put(stats)
+
+
+def benchmark_map_parsing(filenames):
+    """
+    Compares streaming map parsing into a MapStore with the previous xmltodict approach on saved map data
+    :param filenames: Saved map data files such as map_data.xml
+    :return: A dictionary of results suitable for serializing to JSON
+    """
+
+    parsers = [('streaming', parse_map_file_streaming)]
+    if import_optional('xmltodict'):
+        parsers.append(('xmltodict', parse_map_file_xmltodict))
+
+    results = []
+
+    for filename in filenames:
+        file_result = {'file': filename, 'size_kb': os.path.getsize(filename) / 1024}
+
+        for name, parser in parsers:
+            queue = Queue()
+            process = Process(target=measure_map_parser, args=(parser, filename, queue))
+            process.start()
+            file_result[name] = queue.get()
+            process.join()
+
+        results.append(file_result)
+
+    return {'map_parsing': results}
+
+
+def build_projection_fixture(vertices, points_per_line=10):
+    """
+    Builds lines in a MapStore spread over an area the size of the largest map zoom
+    :param vertices: The total number of line points
+    :param points_per_line: The number of points in each line
+    :return: The lines
+    """
+
+    store = MapStore()
+    lines = []
+
+    for offset in xrange(0, vertices, points_per_line):
+        length = min(points_per_line, vertices - offset)
+        for i in xrange(length):
+            store.lats.append(40.0 + ((offset * 7919 + i) % 4000) * 0.00001)
+            store.lngs.append(-83.0 + ((offset * 104729 + i) % 4000) * 0.00001)
+
+        line = MapLine(store=store, offset=offset, length=length)
+        line.calculate_lat_lng_from_points()
+        lines.append(line)
+
+    return lines
+
+
+def project_lines_per_point(lines, origin, dim_coef, offset):
+    """
+    Projects lines the way Maps.translate_shapes used to: two function calls and several tuples for every point
+    :param lines: Lines with lists of points
+    """
+
+    def get_rel_lat_lng(lat, lng):
+        return origin[0] - lat, origin[1] - lng
+
+    def translate_lat_lng_to_x_y(rel_lat, rel_lng):
+        return (rel_lng * -dim_coef[0]) + offset[0], (rel_lat * dim_coef[1]) + offset[1]
+
+    for line, points in lines:
+        line.x, line.y = translate_lat_lng_to_x_y(*get_rel_lat_lng(line.lat, line.lng))
+
+        screen_points = []
+        for waypoint in points:
+            screen_points.append(translate_lat_lng_to_x_y(*get_rel_lat_lng(waypoint[0], waypoint[1])))
+
+        line.screen_points = screen_points
+
+
+def benchmark_projection(vertex_counts, repeats=3):
+    """
+    Compares projecting map lines point by point with batch projection in Python and in NumPy
+    :param vertex_counts: The numbers of line points to project
+    :param repeats: The number of times to project each set of lines. The best time is reported.
+    :return: A dictionary of results suitable for serializing to JSON
+    """
+
+    origin = (40.02, -82.98)
+    dim_coef = (20000.0, 12000.0)
+    offset = (400, 240)
+
+    methods = [('python', MapProjector(use_numpy=False))]
+    numpy_projector = MapProjector()
+    if numpy_projector.numpy:
+        methods.append(('numpy', numpy_projector))
+
+    results = []
+
+    for vertices in vertex_counts:
+        lines = build_projection_fixture(vertices)
+        batch = ProjectionBatch(lines)
+        result = {'vertices': vertices, 'lines': len(lines)}
+
+        with_points = [(line, line.points) for line in lines]
+        times = []
+        for repeat in range(repeats):
+            start = default_timer()
+            project_lines_per_point(with_points, origin, dim_coef, offset)
+            times.append(default_timer() - start)
+        result['per_point_ms'] = round(min(times) * 1000, 3)
+        del with_points
+
+        for name, projector in methods:
+            times = []
+            for repeat in range(repeats):
+                start = default_timer()
+                batch.project(projector, origin, dim_coef, offset)
+                times.append(default_timer() - start)
+            result[name + '_ms'] = round(min(times) * 1000, 3)
+
+        results.append(result)
+
+    return {'projection': results}
+
+
+class BenchmarkRunner(object):
+    """
+    Drives an MFDController through a scripted set of pages and inputs and measures each page
+    """
+
+    warmup_frames = 10
+    frames_per_page = 120
+    input_interval = 10  # Frames between scripted key presses
+    map_load_timeout = 30  # Seconds
+
+    def __init__(self, controller):
+        """
+        :type controller: PiMFD.Controller.MFDController
+        """
+        super(BenchmarkRunner, self).__init__()
+
+        self.controller = controller
+        self.display = controller.display
+        self.map_load_times = []
+
+    @staticmethod
+    def prepare(display, options):
+        """
+        Configures a display and options for benchmarking. This should be called before the controller is created.
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        :type options: PiMFD.Options.MFDAppOptions
+        """
+
+        # Render as fast as possible with no idle throttling so frame times reflect work
+        display.frames_per_second = 0
+        display.is_fullscreen = False
+        display.allow_resize = False
+
+        # The dummy video driver can't create alpha surfaces unless we ask for 32 bit color
+        display.color_depth = 32
+
+        options.enable_idle_frame_rate = False
+        options.staged_boot = False
+        options.button_sound = None
+        options.key_sound = None
+        options.save_map_to_disk = False
+        options.enable_map_cache = False
+        options.bing_maps_key = None
+
+    def use_fixtures(self, map_source=None):
+        """
+        Replaces network-backed data sources with deterministic fixtures
+        :param map_source: The map source to use or None for the default FixtureMapSource
+        """
+
+        nav = self.controller.nav_app.data_provider
+        nav.map.data_source = map_source or FixtureMapSource()
+
+        self.controller.sch_app.weather_data_provider.weather_api = FixtureWeatherAPI()
+
+    def run_frames(self, count, keys=None):
+        """
+        Renders frames, pressing keys along the way
+        :param count: The number of frames to render
+        :param keys: Keys to press, one every input_interval frames
+        :return: A list of frame durations in seconds
+        """
+
+        keys = list(keys or [])
+        times = []
+
+        for frame in range(0, count):
+
+            if keys and frame > 0 and frame % self.input_interval == 0:
+                self.press(keys.pop(0))
+
+            start = default_timer()
+            self.controller.execute_main_loop()
+            times.append(default_timer() - start)
+
+        return times
+
+    def press(self, key):
+        """
+        Sends a key press through the controller and waits for any map load it triggers
+        :param key: The key code
+        """
+
+        self.controller.handle_keyboard_event(key)
+
+        if self.controller.active_app is self.controller.nav_app:
+            self.wait_for_map()
+
+    def wait_for_map(self):
+        """
+        Waits for every tile of the map to finish loading
+        :return: The number of seconds spent waiting
+        """
+
+        map = self.controller.nav_app.data_provider.map
+
+        # Loads happen on background threads so give them a chance to start
+        time.sleep(0.01)
+
+        start = default_timer()
+        while (not map.has_data or map.is_loading) and default_timer() - start < self.map_load_timeout:
+            time.sleep(0.005)
+
+        elapsed = default_timer() - start
+        self.map_load_times.append(elapsed)
+
+        return elapsed
+
+    def measure_pan(self, key):
+        """
+        Pans the map and renders frames until every tile of the new area has loaded
+        :param key: The key code to pan with
+        :return: A dictionary with the seconds until the map showed anything and until it finished loading, along with
+        the frame times along the way
+        """
+
+        map = self.controller.nav_app.data_provider.map
+
+        start = default_timer()
+        self.controller.handle_keyboard_event(key)
+
+        shown = None
+        times = []
+
+        while default_timer() - start < self.map_load_timeout:
+
+            frame_start = default_timer()
+            self.controller.execute_main_loop()
+            times.append(default_timer() - frame_start)
+
+            if map.has_data:
+                if shown is None:
+                    shown = default_timer() - start
+
+                if not map.is_loading:
+                    break
+
+        return {'shown': shown, 'loaded': default_timer() - start, 'times': times}
+
+    def run_panning(self, keys, map_source):
+        """
+        Measures how long the map takes to catch up after each pan
+        :param keys: Key codes to pan with, in order
+        :type map_source: SlowMapSource
+        :return: A dictionary of results suitable for serializing to JSON
+        """
+
+        self.run_frames(1)
+        self.wait_for_map()
+        self.select(3)
+        self.run_frames(self.warmup_frames)
+
+        requests = map_source.requests
+        downloaded = map_source.bytes
+
+        pans = [self.measure_pan(key) for key in keys]
+
+        shown = [pan['shown'] for pan in pans if pan['shown'] is not None]
+        loaded = [pan['loaded'] for pan in pans]
+
+        results = summarize_frame_times(sum([pan['times'] for pan in pans], []))
+        results['pans'] = len(pans)
+        results['pan_shown_mean_ms'] = round(sum(shown) / len(shown) * 1000, 3) if shown else None
+        results['pan_loaded_mean_ms'] = round(sum(loaded) / len(loaded) * 1000, 3)
+        results['pan_loaded_max_ms'] = round(max(loaded) * 1000, 3)
+        results['requests'] = map_source.requests - requests
+        results['downloaded_kb'] = (map_source.bytes - downloaded) / 1024
+
+        return results
+
+    def select(self, app_index, page_index=None):
+        """
+        Selects an application and optionally a page within it using the same buttons a user would
+        """
+
+        self.controller.handle_button(app_index, True)
+
+        if page_index is not None:
+            self.controller.handle_button(page_index, False)
+
+    def get_scenario(self):
+        """
+        Gets the pages to benchmark as a list of (name, app index, page index, keys) tuples
+        """
+
+        pan_keys = [Keycodes.KEY_RIGHT, Keycodes.KEY_DOWN, Keycodes.KEY_LEFT, Keycodes.KEY_UP,
+                    Keycodes.KEY_KP_PLUS, Keycodes.KEY_KP_MINUS]
+
+        scroll_keys = [Keycodes.KEY_DOWN, Keycodes.KEY_DOWN, Keycodes.KEY_PAGEDOWN, Keycodes.KEY_DOWN,
+                       Keycodes.KEY_PAGEUP, Keycodes.KEY_UP]
+
+        return [('Dashboard', 0, 0, []),
+                ('Map', 3, None, pan_keys),
+                ('Performance', 2, 0, scroll_keys),
+                ('Processes', 2, 3, scroll_keys),
+                ('Network', 2, 4, scroll_keys),
+                ('Weather', 4, 3, [])]
+
+    def run(self, pages=None):
+        """
+        Runs the benchmark
+        :param pages: The names of pages to benchmark or None for all of them
+        :return: A dictionary of results suitable for serializing to JSON
+        """
+
+        results = {'timestamp': datetime.now().isoformat(),
+                   'python': platform.python_version(),
+                   'platform': platform.platform(),
+                   'machine': platform.machine(),
+                   'resolution': [self.display.bounds.width, self.display.bounds.height],
+                   'frames_per_page': self.frames_per_page,
+                   'pages': []}
+
+        # Make sure the map is ready so the map page measures rendering rather than loading
+        self.map_load_times = []
+        self.run_frames(1)
+        self.wait_for_map()
+
+        for name, app_index, page_index, keys in self.get_scenario():
+
+            if pages and name not in pages:
+                continue
+
+            self.map_load_times = []
+            self.select(app_index, page_index)
+            self.run_frames(self.warmup_frames)
+
+            times = self.run_frames(self.frames_per_page, keys)
+
+            page_result = summarize_frame_times(times)
+            page_result['name'] = name
+            page_result['peak_rss_kb'] = get_peak_rss_kb()
+
+            if self.map_load_times:
+                page_result['map_loads'] = len(self.map_load_times)
+                page_result['map_load_mean_ms'] = round(sum(self.map_load_times) / len(self.map_load_times) * 1000, 3)
+
+            results['pages'].append(page_result)
+
+        return results
@@ -0,0 +1,218 @@
+# coding=utf-8
+
+"""
+Contains the staged boot sequence used to get the first frame on screen before slower startup work is done
+"""
+from timeit import default_timer
+import traceback
+
+from PiMFD.Startup import startup_profiler, launch_time
+
+__author__ = 'Matt Eland'
+
+
+class BootStep(object):
+    """
+    A piece of startup work that doesn't need to be done before the first frame is shown
+    :param name: The name shown on the boot progress overlay
+    :param action: The function that does the work
+    :param background: Whether the work can run on the worker pool. Work touching pygame's display, fonts or
+    application state should stay on the main thread.
+    :type after: BootStep A step that must finish before this one can start
+    """
+
+    # States shown on the boot progress overlay
+    waiting = 'WAIT'
+    running = 'LOAD'
+    ready = 'OK'
+    failed = 'FAIL'
+
+    state = waiting
+    work_item = None
+    duration = None
+
+    def __init__(self, name, action, background=False, after=None):
+        super(BootStep, self).__init__()
+
+        self.name = name
+        self.action = action
+        self.background = background
+        self.after = after
+
+    @property
+    def is_done(self):
+        """
+        :return: True if the step has finished, successfully or not
+        """
+        return self.state in (BootStep.ready, BootStep.failed)
+
+    def can_start(self):
+        """
+        :return: True if the step is waiting and anything it runs after has finished
+        """
+        return self.state == BootStep.waiting and (self.after is None or self.after.is_done)
+
+    def execute(self):
+        """
+        Runs the step's work on the current thread
+        """
+        start = default_timer()
+
+        with startup_profiler.measure('boot', self.name):
+            self.action()
+
+        self.duration = default_timer() - start
+
+    def start(self, worker_pool):
+        """
+        Starts the step, running it right away if it belongs on the main thread
+        :type worker_pool: PiMFD.WorkerPool.WorkerPool
+        """
+
+        self.state = BootStep.running
+
+        if self.background:
+            self.work_item = worker_pool.submit(self.execute)
+            return
+
+        try:
+            self.execute()
+            self.state = BootStep.ready
+        except Exception:
+            self.state = BootStep.failed
+            raise
+
+    def check(self):
+        """
+        Updates the state of a step running on the worker pool
+        :return: True if the step finished since the last check
+        """
+
+        if self.state != BootStep.running or not self.work_item or not self.work_item.is_done:
+            return False
+
+        self.state = BootStep.failed if self.work_item.error else BootStep.ready
+        return True
+
+
+class BootSequence(object):
+    """
+    Runs startup work that isn't needed for the first frame once that frame is on screen. Main thread steps run one per
+    frame in the order they were added so no single frame is held up for long. Background steps start together on the
+    worker pool after the first frame. Everything runs right away if staged boot is turned off.
+    :type worker_pool: PiMFD.WorkerPool.WorkerPool
+    """
+
+    first_frame_time = None
+    complete_time = None
+
+    def __init__(self, worker_pool):
+        super(BootSequence, self).__init__()
+
+        self.worker_pool = worker_pool
+        self.steps = list()
+
+    def add_step(self, name, action, background=False, after=None):
+        """
+        Adds work to do after the first frame
+        :param name: The name shown on the boot progress overlay
+        :param action: The function that does the work
+        :param background: Whether the work can run on the worker pool
+        :type after: BootStep A step that must finish before this one can start
+        :rtype: BootStep
+        """
+        step = BootStep(name, action, background, after)
+        self.steps.append(step)
+        return step
+
+    def is_complete(self):
+        """
+        :return: True if every step has finished
+        """
+        return self.complete_time is not None
+
+    def frame_shown(self):
+        """
+        Records that a frame made it to the screen. This should be called after each frame is flipped.
+        """
+        if self.first_frame_time is None:
+            self.first_frame_time = default_timer() - launch_time
+
+    def update(self):
+        """
+        Starts background steps and runs the next main thread step once the first frame has been shown. This should be
+        called once per frame.
+        :return: True if any step finished or failed
+        """
+
+        if self.first_frame_time is None or self.is_complete():
+            return False
+
+        return self.advance()
+
+    def advance(self):
+        """
+        Starts any background steps that are able to start, checks on running ones and runs the next main thread step
+        :return: True if any step finished or failed
+        """
+
+        changed = False
+
+        for step in self.steps:
+            if step.background:
+                if step.can_start():
+                    step.start(self.worker_pool)
+                changed = step.check() or changed
+
+        for step in self.steps:
+            if not step.background and step.can_start():
+                self.start_step(step)
+                changed = True
+                break
+
+        if all([step.is_done for step in self.steps]):
+            self.complete_time = default_timer() - launch_time
+
+        return changed
+
+    def start_step(self, step):
+        """
+        Runs a main thread step, reporting rather than raising any error so the rest of the boot can continue
+        :type step: BootStep
+        """
+        try:
+            step.start(self.worker_pool)
+        except Exception as ex:
+            print('Boot step {} failed: {}'.format(step.name, ex))
+            traceback.print_exc()
+
+    def finish(self):
+        """
+        Runs every remaining step and waits for background steps to finish. This is used when staged boot is off.
+        """
+
+        while not self.is_complete():
+            self.advance()
+
+            for step in self.steps:
+                if step.work_item:
+                    step.work_item.wait()
+
+    def get_stats(self):
+        """
+        Gets boot timing for the frame timing overlay
+        :return: A list of lines of text
+        """
+
+        times = list()
+
+        if self.first_frame_time is not None:
+            times.append('first frame {:.0f}ms'.format(self.first_frame_time * 1000))
+
+        if self.complete_time is not None:
+            times.append('ready {:.0f}ms'.format(self.complete_time * 1000))
+
+        if not times:
+            return []
+
+        return ['Boot: ' + ', '.join(times)]
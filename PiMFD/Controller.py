@@ -4,6 +4,7 @@
 Contains application control logic for Pi-MFD.
 """
 from datetime import datetime
+from timeit import default_timer
 
 import pygame
 
@@ -11,11 +12,16 @@ from PiMFD.Applications.ANI.ANIApplication import ANIApplication
 from PiMFD.Applications.Core.CoreApplication import CoreApplication
 from PiMFD.Applications.Navigation.NavigationApplication import NavigationApp
 from PiMFD.Applications.Scheduling.ScheduleApplication import ScheduleApp
+from PiMFD.Booting import BootSequence
 from PiMFD.CougarMFDHandling import CougarMFDInputHandler
 from PiMFD.Options import MFDAppOptions
+from PiMFD.ProviderScheduling import ProviderScheduler
+from PiMFD.Startup import startup_profiler
 from PiMFD.UI import Keycodes
-from PiMFD.UI.Button import MFDButton
+from PiMFD.UI.Button import ButtonRow
+from PiMFD.UI.Overlays import BootProgressOverlay
 from PiMFD.Applications.System.SystemApplication import SysApplication
+from PiMFD.WorkerPool import WorkerPool
 
 
 __author__ = 'Matt Eland'
@@ -40,6 +46,8 @@ class MFDController(object):
     # TODO: This will need to hold left / right edge buttons as well
     top_headers = list()
     bottom_headers = list()
+    top_row = None
+    bottom_row = None
 
     max_app_buttons = 5
     max_page_buttons = 5
@@ -49,6 +57,10 @@ class MFDController(object):
 
     mfd_joystick_controller = None
 
+    worker_pool = None
+    provider_scheduler = None
+    boot = None
+
     core_app = None
     sys_app = None
     sch_app = None
@@ -56,6 +68,7 @@ class MFDController(object):
 
     applications = []
     data_providers = []    
+    shown_page = None  # The page and scroll position rendered last frame
 
     def __init__(self, display, app_options):
 
@@ -64,43 +77,87 @@ class MFDController(object):
         :type display: PiMFD.UI.DisplayManager.DisplayManager
         """
         self.display = display
+        self.top_row = ButtonRow(is_top=True)
+        self.bottom_row = ButtonRow(is_top=False)
 
         if app_options is not None:
             self.options = app_options
         else:
             self.options = MFDAppOptions()
 
-        # Set up the provider collection
+        # Set up the provider collection. Expensive provider work happens on background threads.
         self.data_providers = []
+        self.worker_pool = WorkerPool(self.options.worker_threads, name='Data Provider')
+        self.provider_scheduler = ProviderScheduler(self.worker_pool)
 
         # Core App
-        self.core_app = CoreApplication(self)
+        with startup_profiler.measure('app', 'CORE'):
+            self.core_app = CoreApplication(self)
         
         # ANI App
-        self.ani_app = ANIApplication(self)
+        with startup_profiler.measure('app', 'ANI'):
+            self.ani_app = ANIApplication(self)
 
         # Navigation app
-        self.nav_app = NavigationApp(self)
+        with startup_profiler.measure('app', 'NAV'):
+            self.nav_app = NavigationApp(self)
 
         # Scheduling App
-        self.sch_app = ScheduleApp(self)
-
-        # Set up the sound effect for button presses
-        if self.options.button_sound:
-            self.button_sound = pygame.mixer.Sound(self.options.button_sound)
-        if self.options.key_sound:
-            self.keypress_sound = pygame.mixer.Sound(self.options.key_sound)
+        with startup_profiler.measure('app', 'SCH'):
+            self.sch_app = ScheduleApp(self)
 
         self.mfd_joystick_controller = CougarMFDInputHandler(self, self.options.mfd_controller_rotation)
 
-        self.sys_app = SysApplication(self)
+        with startup_profiler.measure('app', 'SYS'):
+            self.sys_app = SysApplication(self)
 
         self.applications = list([self.core_app, self.ani_app, self.sys_app, self.nav_app, self.sch_app])
         
         self.active_app = self.applications[0]
 
+        # Anything the first frame doesn't need waits until that frame is on screen
+        self.boot = BootSequence(self.worker_pool)
+
+        if self.options.staged_boot:
+            self.boot.add_step('INPUT', self.display.init_joysticks)
+            self.boot.add_step('FONTS', self.display.load_fonts)
+
+        self.boot.add_step('SOUNDS', self.load_sounds, background=True)
+
         for app in self.applications:
-            app.initialize()
+            app.add_boot_steps(self.boot)
+
+        if self.options.staged_boot:
+            self.display.overlays.append(BootProgressOverlay(self.options, self.boot))
+        else:
+            self.boot.finish()
+
+        self.display.register_stats_source(self.boot.get_stats)
+        self.display.register_stats_source(self.get_focus_stats)
+
+    def load_sounds(self):
+        """
+        Loads the sound effects for button presses
+        """
+        if self.options.button_sound:
+            self.button_sound = pygame.mixer.Sound(self.options.button_sound)
+        if self.options.key_sound:
+            self.keypress_sound = pygame.mixer.Sound(self.options.key_sound)
+
+    def get_focus_stats(self):
+        """
+        Gets statistics on the active page's focus registry for the frame timing overlay
+        :return: A list of lines of text
+        """
+
+        page = self.active_app.active_page if self.active_app else None
+        if page is None:
+            return []
+
+        focusables = page.focusables
+        return ['Focus: {} registered, {} live, {} pruned'.format(len(focusables),
+                                                                  focusables.get_live_count(),
+                                                                  focusables.pruned)]
         
     def process_events(self):
         """
@@ -111,6 +168,10 @@ class MFDController(object):
         events = pygame.event.get()
         for event in events:
 
+            # Input and window changes mean the user wants our attention
+            if event.type in self.display.frame_scheduler.wake_events:
+                self.display.frame_scheduler.wake()
+
             # Check for Window Close
             if event.type == pygame.QUIT:
                 self.requested_exit = True
@@ -130,7 +191,12 @@ class MFDController(object):
 
             elif event.type == pygame.KEYDOWN:
                 print("Key: {}".format(event.key))
-                self.handle_keyboard_event(event.key)
+
+                # Ctrl + T saves frame timing data
+                if event.key == Keycodes.KEY_t and event.mod & pygame.KMOD_CTRL:
+                    self.save_frame_timing()
+                else:
+                    self.handle_keyboard_event(event.key)
                 
             elif event.type == pygame.JOYBUTTONDOWN:
                 self.handle_joystick_button_down(event.button)
@@ -184,51 +250,28 @@ class MFDController(object):
         elif key == Keycodes.KEY_F12:  # Simulate Hardware Lower Button 5
             self.handle_button(4, False)
         elif active_page:
+            active_page.invalidate_cache()
             active_page.handle_key(key)
 
-    def render_button_row(self, headers, is_top):
-        """
-        Renders a row of buttons.
-        :type headers: list The buttons to render
-        :type is_top: bool True if this is the top row, False for the bottom row
-        """
-        # Do division up front
-        header_offset = self.display.bounds.width / float(self.max_app_buttons)
-
-        # Figure out where the buttons ought to be
-        x_offset = self.display.bounds.left
-        y = self.display.bounds.top + self.display.padding_y
-        if not is_top:
-            y = self.display.bounds.bottom - self.display.padding_y - self.display.fonts.normal.size - 2
-
-        # Render from left to right
-        for header in headers[0:self.max_app_buttons]:  # TODO: Support > max_app_buttons apps by allowing paging
-            x = x_offset
-            if header:
-                header.render(self.display, x, x + header_offset, y, is_top)
-            x_offset += header_offset
-
     def render_button_rows(self):
         """
         Renders the top and bottom rows of buttons
         """
-        self.render_button_row(self.top_headers, True)
-        self.render_button_row(self.bottom_headers, False)
+        self.top_row.render(self.display, self.top_headers)
+        self.bottom_row.render(self.display, self.bottom_headers)
 
     def update_application(self):
         """
-        Causes the applications to regenerate their list of buttons (as needed)
+        Collects the current buttons from the applications. Buttons live with their applications and pages so this just
+        updates their state.
         """
 
-        # TODO: This really should not be instantiating new button objects every render cycle. Those should live at the
-        # app-level
-
         always_render_background = self.active_app and self.active_app.always_render_background
 
-        # Render our applications
+        # Our applications
         self.top_headers = list()
         for app in self.applications:
-            button = MFDButton(app.get_button_text(), selected=(app is self.active_app and app is not None))
+            button = app.get_app_button()
             button.always_render_background = always_render_background
             self.top_headers.append(button)
 
@@ -250,8 +293,12 @@ class MFDController(object):
         coordinates with the graphics engine to maintain proper display frame rates.
         """
 
+        timer = self.display.frame_timer
+        timer.begin_frame()
+
         # Renders the background of the application
         self.display.render_background()
+        timer.mark('background')
 
         # Ensure an app is selected
         if self.active_app is None:
@@ -259,35 +306,66 @@ class MFDController(object):
 
         # Ensure a page is selected
         if self.active_app.active_page is None:
-            self.active_app.active_page = self.active_app.get_default_page()
+            self.active_app.active_page = self.active_app.get_page(self.active_app.get_default_page())
+
+        # Continue the staged boot
+        self.boot.update()
 
         # Update the headers
         self.update_application()
+        timer.mark('application')
 
         # Request each data provider update itself
         now = datetime.now()
         for provider in self.data_providers:
             provider.update(now)
 
+        # Kick off any background refreshes that are due
+        self.provider_scheduler.update()
+        timer.mark('providers')
+
         # Render the current page
         if self.active_app is not None and self.active_app.active_page:
 
-            # let the page speak for itself
             page = self.active_app.active_page
-            page.arrange()
-            page.render()
+            shown_page = page, page.page_y
+
+            # Right after switching pages or scrolling, show the page as it last looked if that's still current and
+            # render it live on the next frame
+            if shown_page != self.shown_page and self.active_app.render_cached_page(page):
+                self.display.frame_scheduler.request_frame()
+                timer.mark('render')
+
+            else:
+
+                # let the page speak for itself
+                start = default_timer()
+                page.arrange()
+                self.display.layout_stats.end_frame()
+                timer.mark('arrange')
+
+                page.render()
+                self.active_app.cache_page(page, default_timer() - start)
+                timer.mark('render')
+
+            self.shown_page = shown_page
 
         # Render the headers on top of everything else
         self.render_button_rows()
+        timer.mark('buttons')
 
         # Render the overlay layer
         self.display.render_overlays()
+        timer.mark('overlays')
 
         # Handle input, allow user to close window / exit / control the app
         self.process_events()
+        timer.mark('events')
 
         # Update the UI and give a bit of time before going again
         self.display.wait_for_next_frame()
+        timer.end_frame()
+        self.boot.frame_shown()
 
         pass
 
@@ -356,22 +434,20 @@ class MFDController(object):
         """
 
         # Check Top Buttons and respond to the first match
-        index = 0
-        for button in self.top_headers:
-            if button and button.enabled and button.contains_point(pos):
-                self.handle_button(index, True)
-                return True
-
-            index += 1
+        index = self.top_row.get_button_at(pos)
+        if index is not None:
+            self.handle_button(index, True)
+            return True
 
         # Check Bottom Buttons and respond to the first match
-        index = 0
-        for button in self.bottom_headers:
-            if button and button.enabled and button.contains_point(pos):
-                self.handle_button(index, False)
-                return True
+        index = self.bottom_row.get_button_at(pos)
+        if index is not None:
+            self.handle_button(index, False)
+            return True
 
-            index += 1
+        active_page = self.get_active_page()
+        if active_page:
+            active_page.invalidate_cache()
 
         if self.active_app and self.active_app.handle_mouse_left_click(pos):
             return True
@@ -390,9 +466,25 @@ class MFDController(object):
         elif self.keypress_sound:
             self.keypress_sound.play()
 
+    def save_frame_timing(self):
+        """
+        Saves recent frame timing data to the file specified in options
+        """
+        filename = self.options.frame_timing_file
+        self.display.frame_timer.save_csv(filename)
+        print('Saved frame timing to {}'.format(filename))
+
     def get_weather_data(self, zip, consumer=None):
         self.sch_app.weather_data_provider.get_weather_for_zip(zip, consumer)
 
     def register_data_provider(self, provider):
         if provider and provider not in self.data_providers:
+            provider.frame_scheduler = self.display.frame_scheduler
             self.data_providers.append(provider)
+            self.provider_scheduler.register(provider)
+
+    def shutdown(self):
+        """
+        Stops any background work in preparation for the application closing
+        """
+        self.worker_pool.shutdown()
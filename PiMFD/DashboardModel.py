@@ -0,0 +1,151 @@
+# coding=utf-8
+
+"""
+This file contains the observable model of tiles shown on the dashboard
+"""
+from bisect import bisect_left, bisect_right
+
+__author__ = 'Matt Eland'
+
+
+class DashboardModel(object):
+    """
+    The tiles shown on the dashboard. Data providers publish tiles being shown, hidden and changed as their data changes
+    and subscribers are notified of each event, so nothing needs to poll every provider each frame. Tiles are kept in
+    priority order as they are published with the most severe statuses first and ties in the order tiles were first
+    shown.
+    """
+
+    # Event types passed to subscribers
+    added = 'added'
+    removed = 'removed'
+    moved = 'moved'
+    changed = 'changed'
+
+    def __init__(self):
+        super(DashboardModel, self).__init__()
+
+        self.widgets = list()  # Tiles in priority order
+        self.sort_keys = list()  # The sort key of each tile in widgets, kept in the same order for bisecting
+        self.keys_by_id = dict()
+        self.subscribers = list()
+        self.sequence = 0
+        self.version = 0  # Incremented whenever the set or order of tiles changes
+
+    def subscribe(self, listener):
+        """
+        Registers a function to be called whenever something happens to a tile
+        :param listener: A function taking an event type and the tile the event applies to
+        """
+        self.subscribers.append(listener)
+
+    def unsubscribe(self, listener):
+        """
+        Stops notifying a function registered via subscribe
+        """
+        if listener in self.subscribers:
+            self.subscribers.remove(listener)
+
+    def notify(self, event, widget):
+        """
+        Notifies all subscribers of an event
+        :param event: The event type
+        :param widget: The tile the event applies to
+        """
+        for listener in self.subscribers:
+            listener(event, widget)
+
+    @staticmethod
+    def get_priority(widget):
+        """
+        Gets how important a tile is. Higher priorities are shown first.
+        :type widget: PiMFD.UI.Widgets.DashboardWidget.DashboardWidget
+        """
+        return widget.status
+
+    def get_sort_key(self, widget, sequence):
+        return -self.get_priority(widget), sequence
+
+    def contains(self, widget):
+        """
+        Determines whether a tile is currently shown
+        """
+        return id(widget) in self.keys_by_id
+
+    def get_widgets(self):
+        """
+        Gets the tiles currently shown in priority order. This list should not be modified.
+        :rtype: list
+        """
+        return self.widgets
+
+    def insert(self, widget, key):
+        index = bisect_right(self.sort_keys, key)
+        self.sort_keys.insert(index, key)
+        self.widgets.insert(index, widget)
+        self.keys_by_id[id(widget)] = key
+
+    def remove(self, widget):
+        key = self.keys_by_id.pop(id(widget))
+        index = bisect_left(self.sort_keys, key)
+        del self.sort_keys[index]
+        del self.widgets[index]
+        return key
+
+    def show(self, widget):
+        """
+        Shows a tile on the dashboard. Showing a tile that is already shown is the same as calling update.
+        :type widget: PiMFD.UI.Widgets.DashboardWidget.DashboardWidget
+        """
+
+        if self.contains(widget):
+            self.update(widget)
+            return
+
+        self.sequence += 1
+        self.insert(widget, self.get_sort_key(widget, self.sequence))
+        self.version += 1
+        self.notify(DashboardModel.added, widget)
+
+    def hide(self, widget):
+        """
+        Removes a tile from the dashboard if it is shown
+        :type widget: PiMFD.UI.Widgets.DashboardWidget.DashboardWidget
+        """
+
+        if not self.contains(widget):
+            return
+
+        self.remove(widget)
+        self.version += 1
+        self.notify(DashboardModel.removed, widget)
+
+    def set_visible(self, widget, visible):
+        """
+        Shows or hides a tile
+        :type widget: PiMFD.UI.Widgets.DashboardWidget.DashboardWidget
+        :param visible: Whether the tile should be shown
+        """
+        if visible:
+            self.show(widget)
+        else:
+            self.hide(widget)
+
+    def update(self, widget):
+        """
+        Publishes that a tile's data changed. The tile is moved if its priority changed.
+        :type widget: PiMFD.UI.Widgets.DashboardWidget.DashboardWidget
+        """
+
+        key = self.keys_by_id.get(id(widget))
+        if key is None:
+            return
+
+        new_key = self.get_sort_key(widget, key[1])
+        if new_key != key:
+            self.remove(widget)
+            self.insert(widget, new_key)
+            self.version += 1
+            self.notify(DashboardModel.moved, widget)
+
+        self.notify(DashboardModel.changed, widget)
@@ -8,6 +8,24 @@ __author__ = 'Matt Eland'
 
 
 class DataProvider(object):
+    """
+    Provides data to applications and the dashboard. Cheap work belongs in update, which is called every frame on the
+    rendering thread. Expensive work belongs in refresh, which is called on a background thread every refresh_interval
+    seconds when refresh_interval is set.
+    """
+
+    frame_scheduler = None
+
+    # The dashboard this provider publishes tiles to, once attached
+    dashboard = None
+    dashboard_display = None
+    dashboard_page = None
+
+    refresh_interval = None  # Seconds between background refreshes or None to not refresh in the background
+    refresh_timeout = 30  # Seconds before a background refresh is considered hung
+
+    data_version = 0  # Incremented each time the provider reports new data
+
     def __init__(self, name):
         super(DataProvider, self).__init__()
 
@@ -16,8 +34,44 @@ class DataProvider(object):
     def update(self, now):
         pass
 
-    def get_dashboard_widgets(self, display, page):
-        return None
+    def refresh(self, now):
+        """
+        Performs expensive data collection on a background thread. Implementations should not modify anything the
+        rendering thread reads in place, but instead build new objects and swap them in with a single assignment.
+        :type now: datetime.datetime The current time
+        """
+        pass
+
+    def notify_data_changed(self):
+        """
+        Lets the display know that new data has arrived so it can be rendered without waiting on the idle frame rate.
+        This is safe to call from background threads.
+        """
+        self.data_version += 1
+
+        if self.frame_scheduler:
+            self.frame_scheduler.request_frame()
+
+    def attach_dashboard(self, dashboard, display, page):
+        """
+        Connects the provider to the dashboard and publishes its tiles
+        :type dashboard: PiMFD.DashboardModel.DashboardModel
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        :type page: PiMFD.Applications.Core.DashboardPages.DashboardPage
+        """
+        self.dashboard = dashboard
+        self.dashboard_display = display
+        self.dashboard_page = page
+
+        self.update_dashboard()
+
+    def update_dashboard(self):
+        """
+        Creates, updates, shows and hides the provider's dashboard tiles to match its current data. Providers should
+        call this from update when their data has actually changed rather than every frame. This is only called once
+        the provider is attached to a dashboard.
+        """
+        pass
     
     def get_data_pages(self):
         return []
\ No newline at end of file
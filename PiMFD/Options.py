@@ -39,7 +39,25 @@ class MFDAppOptions(object):
     force_square_resolution = False
     mfd_controller_rotation = CougarMFDInputHandler.rotation_left
     save_map_to_disk = True
+    enable_map_cache = True
+    map_cache_dir = 'map_cache'
+    map_cache_ttl = 7 * 24 * 60 * 60  # Seconds before cached map areas are downloaded again
+    map_cache_size = 50 * 1024 * 1024  # Bytes
+    map_fetch_threads = 4  # The most map tiles downloaded at once
     profile = False
+    enable_dirty_rects = False
+    show_dirty_rects = False
+    enable_idle_frame_rate = True
+    worker_threads = 2
+    enable_frame_timing = False
+    frame_timing_file = 'frame_timing.csv'
+    text_cache_size = 4 * 1024 * 1024  # Bytes
+    widget_cache_size = 2 * 1024 * 1024  # Bytes. 0 turns off retained widget surfaces.
+    page_cache_screens = 4  # Full-screen page renderings kept for page flips. 0 turns off the page cache.
+    page_cache_min_render_ms = 4  # Pages that arrange and render faster than this aren't worth caching
+    cache_static_overlays = True
+    staged_boot = True  # Shows the first frame before sounds, extra fonts and data providers have loaded
+    startup_profile = False  # Prints a startup timeline at the first frame. --startup-profile does too.
 
     def load_from_settings(self, filename='settings.ini'):
         """
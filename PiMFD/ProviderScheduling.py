@@ -0,0 +1,152 @@
+# coding=utf-8
+
+"""
+Contains the scheduler responsible for refreshing data providers in the background
+"""
+from datetime import datetime
+import time
+
+__author__ = 'Matt Eland'
+
+
+class ProviderStats(object):
+    """
+    Timing statistics for a single data provider's background refreshes
+    """
+
+    def __init__(self, provider):
+        super(ProviderStats, self).__init__()
+
+        self.provider = provider
+        self.refreshes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.backoff = 0  # The number of consecutive failures or timeouts
+
+    @property
+    def average_duration(self):
+        """
+        :return: The average number of seconds a refresh takes
+        """
+        if self.refreshes <= 0:
+            return 0.0
+
+        return self.total_duration / self.refreshes
+
+    def record(self, duration, failed):
+        """
+        Records the outcome of a refresh
+        :param duration: The number of seconds the refresh took
+        :param failed: Whether the refresh raised an error
+        """
+        self.refreshes += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+        if failed:
+            self.failures += 1
+            self.backoff += 1
+        else:
+            self.backoff = 0
+
+    def __str__(self):
+        return '{}: {} runs, avg {:.0f}ms, max {:.0f}ms, err {}, t/o {}'.format(
+            self.provider.name,
+            self.refreshes,
+            self.average_duration * 1000,
+            self.max_duration * 1000,
+            self.failures,
+            self.timeouts)
+
+
+class ProviderScheduler(object):
+    """
+    Runs the refresh method of data providers on a WorkerPool at each provider's refresh_interval so that slow data
+    collection never blocks rendering. Providers that fail or time out are retried with exponential back-off.
+    """
+
+    max_backoff = 300  # Seconds
+
+    def __init__(self, pool):
+        """
+        :type pool: PiMFD.WorkerPool.WorkerPool
+        """
+        super(ProviderScheduler, self).__init__()
+
+        self.pool = pool
+        self.providers = []
+        self.stats = dict()
+        self.pending = dict()
+        self.next_refresh = dict()
+
+    def register(self, provider):
+        """
+        Starts refreshing the provider in the background if it supports background refreshes
+        :type provider: PiMFD.DataProvider.DataProvider
+        """
+        if provider.refresh_interval is None or provider in self.providers:
+            return
+
+        self.providers.append(provider)
+        self.stats[provider] = ProviderStats(provider)
+        self.next_refresh[provider] = 0
+
+    def get_delay(self, provider):
+        """
+        Determines how long to wait before the next refresh of a provider, taking back-off into account
+        :type provider: PiMFD.DataProvider.DataProvider
+        :return: The number of seconds to wait
+        """
+        backoff = self.stats[provider].backoff
+        if backoff <= 0:
+            return provider.refresh_interval
+
+        return min(self.max_backoff, max(provider.refresh_interval, 1) * (2 ** backoff))
+
+    def update(self):
+        """
+        Collects finished refreshes and starts any refreshes that are due. This is called from the rendering thread and
+        never blocks.
+        """
+
+        now = time.time()
+
+        for provider in self.providers:
+
+            item = self.pending.get(provider)
+            stats = self.stats[provider]
+
+            if item:
+
+                if item.is_done:
+                    del self.pending[provider]
+
+                    # Work that timed out already counted against the provider
+                    if not item.timed_out:
+                        stats.record(item.duration, item.error is not None)
+                        self.next_refresh[provider] = now + self.get_delay(provider)
+
+                elif not item.timed_out and item.started and now - item.started > provider.refresh_timeout:
+
+                    # Threads can't be killed, so leave it running but stop waiting on it. We won't queue up another
+                    # refresh behind it.
+                    item.timed_out = True
+                    stats.timeouts += 1
+                    stats.backoff += 1
+                    self.next_refresh[provider] = now + self.get_delay(provider)
+                    print('{} refresh timed out'.format(provider.name))
+
+                continue
+
+            if now >= self.next_refresh[provider]:
+                self.pending[provider] = self.pool.submit(provider.refresh, datetime.now())
+
+    def get_stats(self):
+        """
+        :return: Statistics for each provider, ordered by how expensive their refreshes are on average
+        """
+        return sorted(self.stats.values(), key=lambda s: s.average_duration, reverse=True)
@@ -0,0 +1,189 @@
+# coding=utf-8
+
+"""
+Contains helpers for keeping Pi-MFD's startup fast and for measuring where startup time goes
+"""
+import __builtin__
+import sys
+import threading
+from contextlib import contextmanager
+from importlib import import_module
+from timeit import default_timer
+
+__author__ = 'Matt Eland'
+
+
+# When Pi-MFD started loading. This module is imported by the PiMFD package before anything else of ours.
+launch_time = default_timer()
+
+# Names of optional modules that failed to import so we don't search for them again each time they're requested
+missing_modules = set()
+
+
+def import_optional(name):
+    """
+    Imports an optional dependency the first time it is needed instead of when the module using it is imported so that
+    heavy libraries don't slow down startup. Python keeps modules after their first import, so calling this repeatedly
+    is cheap.
+    :param name: The full name of the module
+    :return: The module or None if it isn't installed
+    """
+
+    if name in missing_modules:
+        return None
+
+    try:
+        return import_module(name)
+    except ImportError:
+        missing_modules.add(name)
+        return None
+
+
+class StartupProfiler(object):
+    """
+    Records a timeline of what happens while Pi-MFD starts up: how long each module takes to import, how long each
+    application and boot step takes and when the first frame appears. Nothing is recorded until the profiler is
+    started.
+    """
+
+    enabled = False
+    start_time = None
+    first_frame_time = None
+    original_import = None
+
+    min_import_ms = 1  # Imports faster than this are left out of the timeline
+
+    def __init__(self):
+        super(StartupProfiler, self).__init__()
+
+        self.events = list()  # (start, duration, category, name, depth) tuples with times in seconds
+        self.local = threading.local()  # Tracks how deeply timed work is nested on each thread
+
+    def start(self):
+        """
+        Starts recording. Imports are timed from this point on.
+        """
+
+        if self.enabled:
+            return
+
+        self.enabled = True
+        self.start_time = default_timer()
+        self.original_import = __builtin__.__import__
+        __builtin__.__import__ = self.timed_import
+
+    def stop(self):
+        """
+        Stops recording and stops timing imports
+        """
+
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        if __builtin__.__import__ == self.timed_import:
+            __builtin__.__import__ = self.original_import
+
+    @contextmanager
+    def measure(self, category, name):
+        """
+        Times a block of startup work. Work timed inside the block is shown nested beneath it.
+        :param category: The kind of work being done such as 'import' or 'app'
+        :param name: What the work is being done for
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        # Work done by background threads is labelled so it isn't mistaken for work holding up the first frame
+        thread = threading.current_thread()
+        if thread.name != 'MainThread':
+            name = '{} [{}]'.format(name, thread.name)
+
+        depth = getattr(self.local, 'depth', 0)
+        self.local.depth = depth + 1
+        start = default_timer()
+
+        try:
+            yield
+        finally:
+            self.local.depth = depth
+            self.events.append((start - self.start_time, default_timer() - start, category, name, depth))
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=None, level=-1):
+        """
+        Replaces the built in __import__ while recording so that the first import of each module is timed
+        """
+
+        # Modules that are already loaded don't cost anything worth reporting
+        if not self.enabled or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+
+        # Relative imports such as "from . import x" have no module name of their own
+        with self.measure('import', name or ', '.join(fromlist or [])):
+            return self.original_import(name, globals, locals, fromlist, level)
+
+    def mark(self, name):
+        """
+        Records a point in time on the startup timeline
+        :param name: What happened
+        :return: The seconds since recording started
+        """
+
+        elapsed = default_timer() - self.start_time
+        self.events.append((elapsed, 0, 'mark', name, 0))
+        return elapsed
+
+    def first_frame_shown(self):
+        """
+        Records that the first frame has been shown
+        """
+
+        if not self.enabled or self.first_frame_time is not None:
+            return
+
+        self.first_frame_time = self.mark('First frame shown')
+
+    def get_report(self):
+        """
+        Builds a report of the startup timeline
+        :return: A list of lines of text
+        """
+
+        lines = ['Startup Profile']
+
+        if self.first_frame_time is not None:
+            lines.append('Time to first frame: {:.1f}ms'.format(self.first_frame_time * 1000))
+
+        lines.append('{:>10} {:>10}'.format('Start', 'Duration'))
+
+        events = sorted(self.events, key=lambda e: e[0])
+        for start, duration, category, name, depth in events:
+
+            if category == 'import' and duration * 1000 < self.min_import_ms:
+                continue
+
+            lines.append('{:>8.1f}ms {:>8.1f}ms {}{} {}'.format(start * 1000,
+                                                              duration * 1000,
+                                                              '  ' * depth,
+                                                              category,
+                                                              name))
+
+        imports = [e for e in events if e[2] == 'import']
+        if imports:
+            lines.append('Slowest Imports')
+            for start, duration, category, name, depth in sorted(imports, key=lambda e: -e[1])[:10]:
+                lines.append('{:>8.1f}ms {}'.format(duration * 1000, name))
+
+        return lines
+
+    def print_report(self):
+        """
+        Prints the startup timeline report
+        """
+        print('\n'.join(self.get_report()))
+
+
+# The profiler shared by everything measuring startup
+startup_profiler = StartupProfiler()
@@ -3,6 +3,7 @@
 UI Button related functionality
 """
 
+import pygame
 from pygame.rect import Rect
 
 from PiMFD.UI.Rendering import draw_vertical_line, render_text_centered, render_rectangle
@@ -29,6 +30,13 @@ class MFDButton(object):
         self.enabled = enabled
         self.draw_border = False
 
+    def get_state(self):
+        """
+        Gets values describing how the button will look. If these haven't changed, the button doesn't need re-rendering.
+        :return: A hashable tuple of the button's visual state
+        """
+        return self.text, self.selected, self.enabled, self.always_render_background, self.draw_border
+
     def render(self, display, x_start, x_end, y, is_top):
         """
         Renders the button with its current state.
@@ -100,3 +108,117 @@ class MFDButton(object):
         :return: True if pos is inside the bounds of this button, otherwise False.
         """
         return self.bounds.collidepoint(pos)
+
+
+class ButtonRow(object):
+    """
+    A row of buttons along the top or bottom edge of the screen. The row is rendered to its own surface and that surface
+    is reused every frame until a button's state changes, so buttons don't get re-rendered every frame.
+    """
+
+    max_buttons = 5
+
+    def __init__(self, is_top):
+        """
+        :type is_top: bool True if this row is at the top of the screen, False for the bottom
+        """
+        super(ButtonRow, self).__init__()
+
+        self.is_top = is_top
+        self.buttons = list()
+        self.surface = None
+        self.state = None
+        self.rasterizations = 0
+
+    def get_bounds(self, display):
+        """
+        Gets the area of the screen the row occupies, including button tick marks
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        :rtype: Rect
+        """
+
+        y = self.get_text_top(display)
+        height = display.fonts.normal.height
+
+        if self.is_top:
+            return Rect(display.bounds.left, display.bounds.top, display.bounds.width, y + height - display.bounds.top)
+        else:
+            return Rect(display.bounds.left, y, display.bounds.width, display.bounds.bottom - y)
+
+    def get_text_top(self, display):
+        """
+        Gets the y coordinate of the top of the button labels in screen coordinates
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        """
+
+        if self.is_top:
+            return display.bounds.top + display.padding_y
+        else:
+            return display.bounds.bottom - display.padding_y - display.fonts.normal.size - 2
+
+    def render(self, display, buttons):
+        """
+        Renders the row, rebuilding its surface only if the buttons have changed since the last render
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        :param buttons: The buttons to display from left to right. None represents an empty slot.
+        :return: The area of the screen the row was rendered to
+        """
+
+        self.buttons = list(buttons[0:self.max_buttons])  # TODO: Support > max_buttons by allowing paging
+
+        bounds = self.get_bounds(display)
+
+        state = (tuple(bounds),
+                 display.color_scheme.name,
+                 display.fonts.normal.name,
+                 display.fonts.normal.size,
+                 tuple([(id(button), button.get_state()) if button else None for button in self.buttons]))
+
+        if state != self.state:
+            self.rasterize(display, bounds)
+            self.state = state
+
+        rect = display.surface.blit(self.surface, bounds)
+        return display.track_draw(display.surface, rect, 'button_row', self.is_top, state)
+
+    def rasterize(self, display, bounds):
+        """
+        Renders the buttons to the row's surface and updates their bounds for mouse collision detection
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        :type bounds: Rect The area of the screen the row occupies
+        """
+
+        if self.surface is None or self.surface.get_size() != bounds.size:
+            self.surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+
+        self.surface.fill((0, 0, 0, 0))
+        self.rasterizations += 1
+
+        header_offset = bounds.width / float(self.max_buttons)
+        y = self.get_text_top(display) - bounds.top
+
+        # Buttons render in row-relative coordinates then get their bounds moved back into screen coordinates
+        display.push_render_target(self.surface)
+        try:
+            x = 0
+            for button in self.buttons:
+                if button:
+                    button.render(display, x, x + header_offset, y, self.is_top)
+                    button.bounds.move_ip(bounds.left, bounds.top)
+
+                x += header_offset
+        finally:
+            display.pop_render_target()
+
+    def get_button_at(self, pos):
+        """
+        Gets the index of the enabled button containing the specified point
+        :param pos: The point to test
+        :return: The index of the button or None if no enabled button contains the point
+        """
+
+        for index, button in enumerate(self.buttons):
+            if button and button.enabled and button.contains_point(pos):
+                return index
+
+        return None
@@ -0,0 +1,119 @@
+# coding=utf-8
+
+"""
+Contains caches used to avoid repeating expensive rendering work
+"""
+from collections import OrderedDict
+
+__author__ = 'Matt Eland'
+
+
+class SurfaceCache(object):
+    """
+    A least-recently-used cache of pygame surfaces bounded by the number of bytes of pixel data it holds
+    """
+
+    def __init__(self, max_bytes, name='Cache'):
+        """
+        :param max_bytes: The maximum number of bytes of surface data to hold
+        :param name: The name to display in statistics
+        """
+        super(SurfaceCache, self).__init__()
+
+        self.name = name
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_size(surface):
+        """
+        Gets the number of bytes used by a surface's pixel data
+        :type surface: pygame.Surface
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key):
+        """
+        Gets a cached surface, marking it as recently used
+        :param key: The key the surface was stored under
+        :return: The surface or None if it is not cached
+        """
+
+        surface = self.entries.pop(key, None)
+
+        if surface is None:
+            self.misses += 1
+            return None
+
+        # Re-inserting moves the entry to the most recently used end
+        self.entries[key] = surface
+        self.hits += 1
+
+        return surface
+
+    def add(self, key, surface):
+        """
+        Adds a surface to the cache, evicting the least recently used surfaces as needed to stay within budget
+        :param key: A hashable key for the surface
+        :type surface: pygame.Surface
+        :return: The surface
+        """
+
+        size = self.get_size(surface)
+
+        # Don't let one enormous surface flush everything else out
+        if size > self.max_bytes:
+            return surface
+
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= self.get_size(old)
+
+        while self.entries and self.bytes + size > self.max_bytes:
+            evicted_key, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.get_size(evicted)
+            self.evictions += 1
+
+        self.entries[key] = surface
+        self.bytes += size
+
+        return surface
+
+    def contains(self, key):
+        """
+        Determines whether a surface is cached without marking it as used or counting it as a hit or miss
+        :param key: The key the surface was stored under
+        """
+        return key in self.entries
+
+    def peek(self, key):
+        """
+        Gets a cached surface without marking it as used or counting it as a hit or miss
+        :param key: The key the surface was stored under
+        :return: The surface or None if it is not cached
+        """
+        return self.entries.get(key)
+
+    def clear(self):
+        """
+        Removes everything from the cache. Statistics are kept.
+        """
+        self.entries.clear()
+        self.bytes = 0
+
+    def get_stats_text(self):
+        """
+        :return: A line of text describing the cache's effectiveness
+        """
+        total = self.hits + self.misses
+        hit_rate = (100.0 * self.hits / total) if total else 0
+
+        return '{}: {} items {}KB {:.1f}% hit, {} evicted'.format(self.name,
+                                                                  len(self.entries),
+                                                                  self.bytes / 1024,
+                                                                  hit_rate,
+                                                                  self.evictions)
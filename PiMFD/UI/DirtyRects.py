@@ -0,0 +1,133 @@
+# coding=utf-8
+
+"""
+Contains damage tracking logic used to only push changed regions of the screen to the display
+"""
+from pygame.rect import Rect
+
+__author__ = 'Matt Eland'
+
+
+class DirtyRectTracker(object):
+    """
+    Keeps track of everything drawn to the screen in the current and prior frame. Anything that was drawn in one frame
+    but not the other (or that moved, changed color, changed text, etc.) is considered damaged and must be pushed to the
+    display. Everything else is known to be pixel-identical to what is already on screen.
+    """
+
+    # If we get more rects than this or they cover too much of the screen, it's cheaper to just update everything
+    max_rects = 48
+    max_coverage = 0.6
+
+    def __init__(self):
+        super(DirtyRectTracker, self).__init__()
+
+        self.current = dict()
+        self.previous = dict()
+        self.invalidated = list()
+        self.debug_rects = list()
+        self.damaged = list()
+        self.full_redraw = True
+
+    def track(self, rect, signature):
+        """
+        Records that something was drawn this frame
+        :param rect: The bounds of what was drawn
+        :param signature: A hashable value uniquely describing what was drawn, including its position
+        """
+        self.current[signature] = rect
+
+    def invalidate(self, rect):
+        """
+        Flags a region as damaged, regardless of what was drawn to it
+        :param rect: The region to update
+        """
+        self.invalidated.append(Rect(rect))
+
+    def invalidate_all(self):
+        """
+        Forces the next frame to push the entire screen to the display
+        """
+        self.full_redraw = True
+
+    def add_debug_rect(self, rect):
+        """
+        Adds a region that should be pushed to the display this frame but not reported as damage. This is used by the
+        debug overlay so that outlining damage doesn't generate more damage.
+        :param rect: The region to update
+        """
+        self.debug_rects.append(Rect(rect))
+
+    def end_frame(self, bounds):
+        """
+        Completes the current frame and determines what needs to be pushed to the display.
+        :type bounds: pygame.Rect The bounds of the display surface
+        :return: A list of rects to update or None if the entire display should be updated
+        """
+
+        if self.full_redraw:
+            damaged = None
+        else:
+            damaged = list(self.invalidated)
+
+            # Things that appeared or changed this frame
+            for signature in self.current:
+                if signature not in self.previous:
+                    damaged.append(self.current[signature])
+
+            # Things that were on screen last frame but aren't any more
+            for signature in self.previous:
+                if signature not in self.current:
+                    damaged.append(self.previous[signature])
+
+            damaged = self.merge_rects([r.clip(bounds) for r in damaged if r.width > 0 and r.height > 0], bounds)
+
+        # Reset for the next frame
+        self.previous = self.current
+        self.current = dict()
+        self.invalidated = list()
+        self.full_redraw = False
+
+        if damaged is None:
+            self.damaged = [Rect(bounds)]
+            self.debug_rects = list()
+            return None
+
+        self.damaged = damaged
+
+        rects = damaged + self.debug_rects
+        self.debug_rects = list()
+
+        return rects
+
+    def merge_rects(self, rects, bounds):
+        """
+        Combines overlapping rectangles and determines if a full screen update is more practical
+        :param rects: The damaged rectangles
+        :type bounds: pygame.Rect The bounds of the display surface
+        :return: A list of merged rects or None if the entire display should be updated
+        """
+
+        merged = list()
+
+        for rect in rects:
+
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            # Keep absorbing neighbors until this rect doesn't touch anything already merged
+            index = rect.collidelist(merged)
+            while index >= 0:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        if len(merged) > self.max_rects:
+            return None
+
+        area = sum([r.width * r.height for r in merged])
+        if area > bounds.width * bounds.height * self.max_coverage:
+            return None
+
+        return merged
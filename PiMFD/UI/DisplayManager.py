@@ -6,9 +6,15 @@ import pygame
 from pygame.rect import Rect
 
 from PiMFD import start_mfd
+from PiMFD.UI.Caching import SurfaceCache
 from PiMFD.UI.ColorScheme import ColorSchemes
+from PiMFD.UI.DirtyRects import DirtyRectTracker
 from PiMFD.UI.Fonts import FontManager
-from PiMFD.UI.Overlays import ScanlineOverlay, InterlaceOverlay, FPSOverlay, ShadowEffectOverlay
+from PiMFD.UI.FrameScheduling import FrameScheduler
+from PiMFD.UI.FrameTiming import FrameTimer
+from PiMFD.UI.Overlays import ScanlineOverlay, InterlaceOverlay, FPSOverlay, ShadowEffectOverlay, DirtyRectOverlay, \
+    FrameTimingOverlay
+from PiMFD.UI.WidgetBase import LayoutStats
 
 
 __author__ = 'Matt Eland'
@@ -37,12 +43,27 @@ class DisplayManager(object):
 
     surface = None
     overlay_surface = None
+    static_overlay_key = None
 
     is_fullscreen = False
     allow_resize = True
 
     frames_per_second = 60
 
+    color_depth = 0  # Bits per pixel or 0 to let pygame pick the best depth
+
+    use_dirty_rects = False
+    dirty_rects = None
+    frame_scheduler = None
+    frame_timer = None
+    stats_sources = None
+    text_cache = None
+    widget_cache = None
+    page_cache = None
+    render_targets = None
+    layout_stats = None
+    layout_version = 0
+
     color_scheme = None
     color_schemes = []
 
@@ -58,6 +79,15 @@ class DisplayManager(object):
         self.overlays = list()
         self.color_schemes = ColorSchemes.get_color_schemes()
         self.color_scheme = self.color_schemes[0]
+        self.dirty_rects = DirtyRectTracker()
+        self.frame_scheduler = FrameScheduler(self)
+        self.frame_timer = FrameTimer()
+        self.stats_sources = list()
+        self.text_cache = SurfaceCache(0, name='Text')
+        self.widget_cache = SurfaceCache(0, name='Widgets')
+        self.page_cache = SurfaceCache(0, name='Pages')
+        self.render_targets = list()
+        self.layout_stats = LayoutStats()
 
     def start_mfd(self, app_options):
         """
@@ -75,6 +105,8 @@ class DisplayManager(object):
         pygame.display.update()
         self.overlay_surface = pygame.Surface((self.desktop_x, self.desktop_y), pygame.SRCALPHA)
         self.overlay_surface.convert_alpha()
+        self.static_overlay_key = None
+        self.invalidate_all()
 
     def set_fullscreen(self, is_fullscreen):
         """
@@ -85,10 +117,80 @@ class DisplayManager(object):
 
     def wait_for_next_frame(self):
         """
-        Updates the display and waits until it's time to render the next frame (prevent us from going too fast)
+        Updates the display and waits until it's time to render the next frame (prevent us from going too fast). This
+        will be at a reduced frame rate if nothing has happened in a while.
         """
-        pygame.display.update()
-        self.clock.tick(self.frames_per_second)
+        if self.use_dirty_rects:
+            rects = self.dirty_rects.end_frame(self.surface.get_rect())
+            if rects is None:
+                pygame.display.update()
+            elif rects:
+                pygame.display.update(rects)
+        else:
+            pygame.display.update()
+
+        self.frame_timer.mark('flip')
+
+        self.frame_scheduler.wait_for_next_frame()
+
+        self.frame_timer.mark('wait')
+
+    def track_draw(self, surface, rect, *signature):
+        """
+        Records that something was drawn so that dirty rect rendering can tell what changed since the last frame.
+        Anything drawn to a surface other than the display surface is ignored.
+        :param surface: The surface that was drawn to
+        :type rect: pygame.Rect The bounds of what was drawn
+        :param signature: Hashable values describing what was drawn. Identical drawings should have identical values.
+        :return: The rect that was passed in
+        """
+
+        if self.use_dirty_rects and surface is self.surface and not self.render_targets:
+            self.dirty_rects.track(rect, signature)
+
+        return rect
+
+    def push_render_target(self, surface):
+        """
+        Redirects rendering to an offscreen surface until pop_render_target is called. Drawing to an offscreen surface
+        isn't tracked as a change to the screen.
+        :type surface: pygame.Surface The surface to render to
+        """
+        self.render_targets.append(self.surface)
+        self.surface = surface
+
+    def pop_render_target(self):
+        """
+        Restores the surface that was being rendered to before the last call to push_render_target
+        """
+        self.surface = self.render_targets.pop()
+
+    def register_stats_source(self, source):
+        """
+        Registers a function that provides lines of text for the frame timing overlay
+        :param source: A function taking no arguments and returning a list of strings
+        """
+        self.stats_sources.append(source)
+
+    def invalidate(self, rect):
+        """
+        Flags a region of the screen as needing to be pushed to the display on the next update
+        :param rect: The region to update
+        """
+        self.dirty_rects.invalidate(rect)
+
+    def invalidate_all(self):
+        """
+        Flags the entire screen as needing to be pushed to the display on the next update
+        """
+        self.dirty_rects.invalidate_all()
+
+    def invalidate_layout(self):
+        """
+        Forces every widget to be arranged again. This should be called when anything widgets use for arrangement, such
+        as fonts or the content area, changes.
+        """
+        self.layout_version += 1
 
     def render_background(self):
         """
@@ -97,21 +199,40 @@ class DisplayManager(object):
 
         # Fill the background with a solid color
         self.surface.fill(self.color_scheme.background)
+        self.track_draw(self.surface, self.surface.get_rect(), 'background', self.color_scheme.background)
 
     def render_overlays(self):
         """
         Renders overlays on top of the application's normal graphics layer
         """
 
-        # Start fully transparent
-        self.overlay_surface.fill((0, 0, 0, 0))
+        static_overlays = [overlay for overlay in self.overlays if overlay.is_static]
 
-        # Render all overlays onto the surface
-        for overlay in self.overlays:
-            overlay.render(self, self.overlay_surface)
+        # Static overlays are rendered to the overlay surface once and only rebuilt when something they depend on changes
+        key = (self.overlay_surface.get_size(),
+               tuple(self.bounds),
+               self.color_scheme.name,
+               tuple([overlay.is_enabled() for overlay in static_overlays]))
+
+        if key != self.static_overlay_key or not self.options.cache_static_overlays:
+
+            # Start fully transparent
+            self.overlay_surface.fill((0, 0, 0, 0))
+
+            for overlay in static_overlays:
+                overlay.render(self, self.overlay_surface)
+
+            self.static_overlay_key = key
+
+        # Pass the cached layer on to the primary surface in one blit, skipping it if there's nothing on it
+        if any(key[-1]):
+            rect = self.surface.blit(self.overlay_surface, (0, 0))
+            self.track_draw(self.surface, rect, 'static_overlays', key)
 
-        # Pass the contents on to the primary surface
-        self.surface.blit(self.overlay_surface, (0, 0))
+        # Animated overlays are cheap enough to draw directly each frame
+        for overlay in self.overlays:
+            if not overlay.is_static:
+                overlay.render(self, self.surface)
 
     def get_content_start_x(self):
         """
@@ -170,6 +291,16 @@ class DisplayManager(object):
 
         return (self.padding_y * 2) + font_size
 
+    def get_window_icon(self):
+        """
+        Builds a small icon for the window in the current color scheme
+        :rtype: pygame.Surface
+        """
+        icon = pygame.Surface((32, 32))
+        icon.fill(self.color_scheme.background)
+        pygame.draw.rect(icon, self.color_scheme.foreground, icon.get_rect(), 2)
+        return icon
+
     def prepare_display_surface(self):
 
         # Quit / Init can help window transitions
@@ -178,16 +309,19 @@ class DisplayManager(object):
 
         res = (self._res_x, self._res_y)
 
+        # Without an icon of our own, pygame loads its default icon through pkg_resources, which is slow to import
+        pygame.display.set_icon(self.get_window_icon())
+
         # Prepare the Display
         if self.is_fullscreen:
             print('setting to fullscreen {}, {}'.format(res[0], res[1]))
-            display = pygame.display.set_mode(res, pygame.FULLSCREEN)
+            display = pygame.display.set_mode(res, pygame.FULLSCREEN, self.color_depth)
         elif self.allow_resize:
             print('setting to resizable window {}, {}'.format(res[0], res[1]))
-            display = pygame.display.set_mode(res, pygame.RESIZABLE)
+            display = pygame.display.set_mode(res, pygame.RESIZABLE, self.color_depth)
         else:
             print('setting to window {}, {}'.format(res[0], res[1]))
-            display = pygame.display.set_mode(res, 0)
+            display = pygame.display.set_mode(res, 0, self.color_depth)
 
         # Customize the Window
         pygame.display.set_caption(self.options.app_name)
@@ -196,7 +330,13 @@ class DisplayManager(object):
         self.surface = display
         self.surface.convert()
         self.overlay_surface = pygame.Surface(res, pygame.SRCALPHA)
+
+        # The page cache is budgeted in whole screens and anything in it is the wrong size now
+        self.page_cache.max_bytes = self.options.page_cache_screens * SurfaceCache.get_size(self.surface)
+        self.page_cache.clear()
         self.overlay_surface.convert_alpha()
+        self.static_overlay_key = None
+        self.invalidate_all()
 
         pygame.display.update()
 
@@ -210,20 +350,28 @@ class DisplayManager(object):
         if options.color_scheme and options.color_scheme != self.color_scheme.name:
             for cs in self.color_schemes:
                 if cs.name == options.color_scheme:
-                    self.color_scheme = cs
+                    self.set_color_scheme(cs)
                     break
 
+        self.text_cache.max_bytes = options.text_cache_size
+        self.widget_cache.max_bytes = options.widget_cache_size
+        self.register_stats_source(lambda: [self.text_cache.get_stats_text()])
+        self.register_stats_source(lambda: [self.widget_cache.get_stats_text()])
+        self.register_stats_source(lambda: [self.page_cache.get_stats_text()])
+        self.register_stats_source(lambda: [self.layout_stats.get_stats_text()])
+
+        self.use_dirty_rects = options.enable_dirty_rects
+        self.frame_scheduler.enabled = options.enable_idle_frame_rate
+
         # Initialize the pygame engine
         pygame.init()
         
         # Hide the cursor as necessary
         pygame.mouse.set_visible(self.show_mouse)
         
-        # Initialize Joystick Input
-        pygame.joystick.init()
-        joysticks = [pygame.joystick.Joystick(x) for x in range(pygame.joystick.get_count())]
-        for stick in joysticks:
-            stick.init()
+        # Initialize Joystick Input. A staged boot does this after the first frame instead.
+        if not options.staged_boot:
+            self.init_joysticks()
             
         self.clock = pygame.time.Clock()
 
@@ -241,15 +389,62 @@ class DisplayManager(object):
         # Initialize the display resolution
         self.prepare_display_surface()
 
-        # Set up Fonts
-        self.fonts = FontManager(options)
-        self.fonts.load_fonts()
+        # Set up Fonts. A staged boot starts with just the normal font and loads the rest after the first frame.
+        if options.staged_boot:
+            self.load_default_font()
+        else:
+            self.load_fonts()
 
         # Initialize our overlays
         self.init_overlays(options)
 
+    def init_joysticks(self):
+        """
+        Initializes joystick input so MFD controllers can send button presses
+        """
+        pygame.joystick.init()
+        joysticks = [pygame.joystick.Joystick(x) for x in range(pygame.joystick.get_count())]
+        for stick in joysticks:
+            stick.init()
+
+    def load_default_font(self):
+        """
+        Loads only the normal font and uses it in place of the others until load_fonts is called
+        """
+        self.fonts = FontManager(self.options)
+        self.fonts.load_default_font()
+
+    def load_fonts(self):
+        """
+        Loads fonts based on the current options. This should be called again if font options change.
+        """
+        self.fonts = FontManager(self.options)
+        self.fonts.load_fonts()
+
+        # Anything rendered or measured with the old fonts is no longer valid
+        self.text_cache.clear()
+        self.widget_cache.clear()
+        self.page_cache.clear()
+        self.invalidate_layout()
+
+    def set_color_scheme(self, color_scheme):
+        """
+        Changes the active color scheme
+        :type color_scheme: PiMFD.UI.ColorScheme.ColorScheme
+        """
+        self.color_scheme = color_scheme
+
+        # Text, widgets and pages rendered in the old scheme's colors won't be used again
+        self.text_cache.clear()
+        self.widget_cache.clear()
+        self.page_cache.clear()
+        self.invalidate_all()
+
     def refresh_bounds(self):
-        
+
+        self.invalidate_all()
+        self.invalidate_layout()
+
         if self.options and self.options.force_square_resolution:
             min_dim = min(self._res_x, self._res_y)
             self.bounds = Rect(self.start_offset[0],
@@ -285,6 +480,8 @@ class DisplayManager(object):
         self.overlays.append(ScanlineOverlay(options))
         self.overlays.append(InterlaceOverlay(options))
         self.overlays.append(FPSOverlay(options))
+        self.overlays.append(FrameTimingOverlay(options))
+        self.overlays.append(DirtyRectOverlay(options))
 
     def get_content_size(self):
 
@@ -2,7 +2,10 @@
 """
 Code for UI Widget focusability / navigation
 """
+import weakref
+
 from PiMFD.UI.Panels import UIWidget
+from PiMFD.UI.WidgetBase import layout_property
 
 __author__ = 'Matt Eland'
 
@@ -12,7 +15,7 @@ class FocusableWidget(UIWidget):
     A UIWidget that can receieve and manage focus
     """
 
-    is_enabled = True
+    is_enabled = layout_property('_is_enabled', True)
 
     def __init__(self, display, page):
         super(FocusableWidget, self).__init__(display, page)
@@ -61,4 +64,166 @@ class FocusableWidget(UIWidget):
         """
 
         if self.page:
-            self.page.controller.play_button_sound()
\ No newline at end of file
+            self.page.controller.play_button_sound()
+
+
+class FocusRegistry(object):
+    """
+    Keeps track of the focusable widgets on a page in the order they were registered. Widgets are held by weak
+    reference so widgets a page has thrown away can be garbage collected, and their entries are periodically pruned.
+    Widgets that are only detached from the panel tree are kept since they can be attached again and only register
+    once. Finding the next or previous focusable widget doesn't require a search.
+    """
+
+    min_prune_size = 16
+
+    def __init__(self):
+        super(FocusRegistry, self).__init__()
+
+        self.entries = list()
+        self.positions = dict()
+        self.prune_size = self.min_prune_size
+        self.pruned = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        for entry in self.entries:
+            widget = entry()
+            if widget is not None:
+                yield widget
+
+    def register(self, widget):
+        """
+        Adds a widget to the end of the focus order
+        :type widget: FocusableWidget
+        """
+
+        if self.index_of(widget) is not None:
+            return
+
+        self.positions[id(widget)] = len(self.entries)
+        self.entries.append(weakref.ref(widget))
+
+        # Clean up as we go so pages that rebuild their widgets don't grow without limit
+        if len(self.entries) > self.prune_size:
+            self.prune()
+
+    def unregister(self, widget):
+        """
+        Removes a widget from the focus order
+        :type widget: FocusableWidget
+        """
+
+        index = self.index_of(widget)
+        if index is not None:
+            del self.entries[index]
+            self.reindex()
+
+    def clear(self):
+        """
+        Removes all widgets
+        """
+        self.entries = list()
+        self.positions = dict()
+
+    def reindex(self):
+        """
+        Rebuilds the lookup of positions within the focus order
+        """
+        self.positions = dict()
+        for index, entry in enumerate(self.entries):
+            widget = entry()
+            if widget is not None:
+                self.positions[id(widget)] = index
+
+    def index_of(self, widget):
+        """
+        Gets the position of a widget in the focus order
+        :type widget: FocusableWidget
+        :return: The index of the widget or None if it isn't registered
+        """
+
+        index = self.positions.get(id(widget))
+
+        # IDs can be reused by new objects once old ones are collected, so make sure we found the right widget
+        if index is not None and index < len(self.entries) and self.entries[index]() is widget:
+            return index
+
+        return None
+
+    def prune(self):
+        """
+        Removes widgets that have been garbage collected
+        """
+
+        entries = [entry for entry in self.entries if entry() is not None]
+
+        self.pruned += len(self.entries) - len(entries)
+        self.entries = entries
+        self.reindex()
+
+        # Wait until we've doubled in size before pruning again so pruning is cheap on average
+        self.prune_size = max(self.min_prune_size, len(self.entries) * 2)
+
+    def get_live_count(self):
+        """
+        Gets the number of registered widgets that haven't been garbage collected
+        """
+        return len([entry for entry in self.entries if entry() is not None])
+
+    def first(self):
+        """
+        Gets the first widget in the focus order
+        :return: The widget or None if there are no widgets
+        """
+        return self.find_from(0, 1)
+
+    def last(self):
+        """
+        Gets the last widget in the focus order
+        :return: The widget or None if there are no widgets
+        """
+        return self.find_from(len(self.entries) - 1, -1)
+
+    def get_next(self, widget):
+        """
+        Gets the widget after the specified widget, wrapping around to the first widget at the end
+        :type widget: FocusableWidget
+        :return: The next widget or None if there are no widgets
+        """
+
+        index = self.index_of(widget)
+        if index is None:
+            return self.first()
+
+        return self.find_from(index + 1, 1) or self.first()
+
+    def get_previous(self, widget):
+        """
+        Gets the widget before the specified widget, wrapping around to the last widget at the start
+        :type widget: FocusableWidget
+        :return: The previous widget or None if there are no widgets
+        """
+
+        index = self.index_of(widget)
+        if index is None:
+            return self.first()
+
+        return self.find_from(index - 1, -1) or self.last()
+
+    def find_from(self, index, step):
+        """
+        Finds the first live widget starting at index and moving by step
+        :return: The widget or None if none was found
+        """
+
+        while 0 <= index < len(self.entries):
+            widget = self.entries[index]()
+            if widget is not None:
+                return widget
+
+            index += step
+
+        return None
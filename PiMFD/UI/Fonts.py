@@ -3,10 +3,15 @@
 """
 A class for managing multiple fonts
 """
+import re
+
 import pygame
 
 __author__ = 'Matt Eland'
 
+# Matches anything other than printable ASCII characters
+non_printable_ascii = re.compile(u'[^\x20-\x7e]')
+
 
 class FontInfo(object):
     """
@@ -17,12 +22,40 @@ class FontInfo(object):
     size = None
     name = None
 
+    measure_cache_size = 2048
+
     def __init__(self, font_name, size):
         super(FontInfo, self).__init__()
 
         self.font = pygame.font.Font(font_name, size)
         self.name = font_name
         self.size = size
+        self.height = self.font.get_height()
+        self.measure_cache = dict()
+
+        # Populated for fixed-width fonts so we can measure without asking pygame
+        self.advance = None
+        self.char_widths = None
+        self.detect_fixed_width()
+
+    def detect_fixed_width(self):
+        """
+        Determines if every printable ASCII character in the font advances by the same amount. If so, the width of a
+        string is the number of characters times that advance, adjusted for how far the last character extends past it.
+        """
+
+        base = self.font.size('i')[0]
+        advances = set()
+        widths = dict()
+
+        for code in range(0x20, 0x7f):
+            char = chr(code)
+            advances.add(self.font.size(char + 'i')[0] - base)
+            widths[char] = self.font.size(char)[0]
+
+        if len(advances) == 1:
+            self.advance = advances.pop()
+            self.char_widths = widths
 
     def render(self, text, antialias, color, background=None):
         """
@@ -35,7 +68,39 @@ class FontInfo(object):
             return self.font.render(text, antialias, color)
 
     def measure(self, text):
-        return self.font.size(text)
+        """
+        Measures the size of the text as it would be rendered in this font
+        :type text: str The text to measure
+        :return: A tuple of width and height
+        """
+
+        size = self.measure_cache.get(text)
+
+        if size is None:
+
+            if not text:
+                size = 0, self.height
+            elif self.advance is not None and not non_printable_ascii.search(text):
+                size = (len(text) - 1) * self.advance + self.char_widths[text[-1]], self.height
+            else:
+                size = self.font.size(text)
+
+            # Keep things bounded. Anything still in use will be re-measured quickly.
+            if len(self.measure_cache) >= self.measure_cache_size:
+                self.measure_cache.clear()
+
+            self.measure_cache[text] = size
+
+        return size
+
+    def measure_many(self, texts):
+        """
+        Measures multiple strings at once
+        :param texts: The strings to measure
+        :return: A list of width and height tuples in the same order as texts
+        """
+        measure = self.measure
+        return [measure(text) for text in texts]
 
 
 class FontManager(object):
@@ -59,6 +124,17 @@ class FontManager(object):
 
         self.options = options
 
+    def load_default_font(self):
+        """
+        Loads just the normal font and uses it for everything until load_fonts is called. One font is enough to draw
+        the first frame.
+        """
+
+        self.normal = FontInfo(self.options.font_name, self.options.font_scaling * 3)
+        self.small = self.normal
+        self.list = self.normal
+        self.weather = self.normal
+
     def load_fonts(self):
         """
         Loads fonts into the object
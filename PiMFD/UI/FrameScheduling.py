@@ -0,0 +1,125 @@
+# coding=utf-8
+
+"""
+Contains the frame scheduler responsible for deciding how quickly frames should be rendered
+"""
+from threading import Event
+import time
+
+import pygame
+
+__author__ = 'Matt Eland'
+
+
+class FrameScheduler(object):
+    """
+    Renders frames at the display's full frame rate while something is going on and drops down to a low idle frame
+    rate once the user, data providers, and overlays have been quiet for a while. Input arriving during an idle wait
+    ends the wait immediately so the next frame responds at full speed.
+    """
+
+    idle_frames_per_second = 4
+    idle_delay = 2.0  # Seconds of inactivity before idling
+    poll_interval = 0.01  # Seconds between input checks while idling
+
+    # Events that should interrupt an idle wait
+    wake_events = (pygame.QUIT,
+                   pygame.KEYDOWN,
+                   pygame.KEYUP,
+                   pygame.MOUSEBUTTONDOWN,
+                   pygame.MOUSEBUTTONUP,
+                   pygame.JOYBUTTONDOWN,
+                   pygame.JOYBUTTONUP,
+                   pygame.JOYHATMOTION,
+                   pygame.VIDEORESIZE,
+                   pygame.VIDEOEXPOSE,
+                   pygame.ACTIVEEVENT)
+
+    def __init__(self, display):
+        """
+        :type display: PiMFD.UI.DisplayManager.DisplayManager
+        """
+        super(FrameScheduler, self).__init__()
+
+        self.display = display
+        self.enabled = True
+        self.is_idle = False
+        self.last_activity = time.time()
+        self.woken = Event()
+
+    def wake(self):
+        """
+        Signals that the user is interacting with the application and frames should be rendered at full speed for a
+        while. This is safe to call from background threads.
+        """
+        self.last_activity = time.time()
+        self.woken.set()
+
+    def request_frame(self):
+        """
+        Signals that new data has arrived and the next frame should be rendered immediately. Unlike wake, this does not
+        keep the full frame rate going afterwards. This is safe to call from background threads.
+        """
+        self.woken.set()
+
+    def needs_frames(self):
+        """
+        Determines whether anything on screen is animating and requires frames at full speed
+        :return: True if full speed rendering is required
+        """
+        for overlay in self.display.overlays:
+            if overlay.needs_frames(self.display):
+                return True
+
+        return False
+
+    def is_active(self):
+        """
+        Determines whether frames should currently be rendered at full speed
+        :return: True for full speed, False for the idle rate
+        """
+
+        if not self.enabled or self.woken.is_set():
+            return True
+
+        return time.time() - self.last_activity < self.idle_delay or self.needs_frames()
+
+    @property
+    def target_frames_per_second(self):
+        """
+        The frame rate currently being targeted. 0 indicates an unlimited frame rate.
+        :rtype: int
+        """
+        if self.is_idle:
+            return self.idle_frames_per_second
+
+        return self.display.frames_per_second
+
+    def wait_for_next_frame(self):
+        """
+        Waits until it is time to render the next frame
+        """
+
+        if self.is_active():
+            self.woken.clear()
+            self.is_idle = False
+            self.display.clock.tick(self.display.frames_per_second)
+            return
+
+        self.is_idle = True
+
+        # Keep the clock's statistics meaningful. The sleep below is what governs our frame rate
+        self.display.clock.tick()
+
+        deadline = time.time() + (1.0 / self.idle_frames_per_second)
+        while time.time() < deadline:
+
+            pygame.event.pump()
+            if self.woken.is_set():
+                break
+
+            if pygame.event.peek(self.wake_events):
+                self.wake()
+                break
+
+            time.sleep(self.poll_interval)
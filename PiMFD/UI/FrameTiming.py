@@ -0,0 +1,117 @@
+# coding=utf-8
+
+"""
+Contains instrumentation used to measure where time goes in each frame
+"""
+import csv
+from timeit import default_timer
+
+__author__ = 'Matt Eland'
+
+
+class FrameTimer(object):
+    """
+    Records how long each phase of the main loop takes. The most recent frames are kept in a fixed-size ring buffer so
+    the cost of instrumentation stays constant no matter how long the application runs.
+    """
+
+    # The phases of the main loop, in the order they occur
+    phases = ('background', 'application', 'providers', 'arrange', 'render', 'buttons', 'overlays', 'events', 'flip',
+              'wait')
+
+    # Phases that represent waiting rather than work
+    idle_phases = ('wait',)
+
+    def __init__(self, capacity=300):
+        super(FrameTimer, self).__init__()
+
+        self.capacity = capacity
+        self.frames = [None] * capacity
+        self.index = 0
+        self.count = 0
+        self.current = None
+        self.last_mark = None
+        self.phase_indexes = dict([(phase, i) for i, phase in enumerate(self.phases)])
+
+    def begin_frame(self):
+        """
+        Starts timing a new frame
+        """
+        self.current = [0.0] * len(self.phases)
+        self.last_mark = default_timer()
+
+    def mark(self, phase):
+        """
+        Records that a phase of the frame has completed. Time since the last mark is attributed to the phase.
+        :param phase: The name of the phase, which should be in phases
+        """
+
+        if self.current is None:
+            return
+
+        now = default_timer()
+        self.current[self.phase_indexes[phase]] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """
+        Completes the current frame and stores it in the history
+        """
+
+        if self.current is None:
+            return
+
+        self.frames[self.index] = tuple(self.current)
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.current = None
+
+    def get_frames(self):
+        """
+        Gets recorded frames from oldest to newest. Each frame is a tuple of seconds in the same order as phases.
+        :rtype: list
+        """
+        if self.count < self.capacity:
+            return self.frames[:self.count]
+
+        return self.frames[self.index:] + self.frames[:self.index]
+
+    def get_work_times(self):
+        """
+        Gets the amount of time each recorded frame spent working (as opposed to waiting for the next frame) from oldest
+        to newest
+        :rtype: list
+        """
+        idle = [self.phase_indexes[phase] for phase in self.idle_phases]
+
+        return [sum(frame) - sum([frame[i] for i in idle]) for frame in self.get_frames()]
+
+    def get_percentiles(self, percentiles=(50, 95, 99)):
+        """
+        Calculates percentiles of frame work time
+        :param percentiles: The percentiles to calculate
+        :return: A list of times in seconds, one per requested percentile, or None if no frames have been recorded
+        """
+
+        times = sorted(self.get_work_times())
+        if not times:
+            return None
+
+        return [times[min(len(times) - 1, int(len(times) * p / 100.0))] for p in percentiles]
+
+    def save_csv(self, filename):
+        """
+        Writes the recorded frames to a CSV file with one row per frame and times in milliseconds
+        :param filename: The file to write
+        """
+
+        with open(filename, 'wb') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame'] + list(self.phases) + ['work', 'total'])
+
+            frame_number = 0
+            for frame, work in zip(self.get_frames(), self.get_work_times()):
+                frame_number += 1
+                row = [frame_number] + ['{:.3f}'.format(t * 1000) for t in frame]
+                row += ['{:.3f}'.format(work * 1000), '{:.3f}'.format(sum(frame) * 1000)]
+                writer.writerow(row)
@@ -5,11 +5,11 @@ Contains code useful for rendering images to the screen
 from StringIO import StringIO
 from datetime import datetime
 from threading import Thread
-import urllib2
 
 import pygame
 from pygame.rect import Rect
 
+from PiMFD.Startup import import_optional
 from PiMFD.UI.Panels import UIWidget
 
 
@@ -95,6 +95,7 @@ class ImageRenderer(UIWidget):
 
         if self.surface:
             self.display.surface.blit(self.surface, self.rect)
+            self.display.track_draw(self.display.surface, self.rect, 'image', id(self.surface), tuple(self.rect))
 
         return self.rect
 
@@ -121,7 +122,8 @@ class WebImageRenderer(ImageRenderer):
 
     def get_image_surface(self):
 
-        # Grab the image data from the interwebs
+        # Grab the image data from the interwebs. urllib2 pulls in the SSL stack, so it isn't imported at startup.
+        urllib2 = import_optional('urllib2')
         data = StringIO(urllib2.urlopen(self.url).read())
 
         self.last_fetch = datetime.now()
@@ -160,6 +162,7 @@ class ImageLoadingThread(Thread):
         super(ImageLoadingThread, self).run()
 
         # Grab the image data from the interwebs
+        urllib2 = import_optional('urllib2')
         data = StringIO(urllib2.urlopen(self.url).read())
 
         self.image.last_fetch = datetime.now()
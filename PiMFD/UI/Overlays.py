@@ -3,9 +3,12 @@
 """
 Contains classes capable of performing various graphical overlay functions on the transparency layer
 """
+import time
+
+import pygame
 from pygame.rect import Rect
 
-from PiMFD.UI.Rendering import draw_horizontal_line, render_text, to_rgba, render_rectangle
+from PiMFD.UI.Rendering import draw_horizontal_line, render_text, to_rgba, render_rectangle, color_key
 
 
 __author__ = 'Matt Eland'
@@ -16,6 +19,9 @@ class Overlay(object):
     An abstract class that contains common methods for overlays
     """
 
+    # Static overlays look the same every frame and are rendered once into a cached layer instead of every frame
+    is_static = False
+
     def __init__(self, options):
         super(Overlay, self).__init__()
         self.options = options
@@ -29,6 +35,21 @@ class Overlay(object):
         """
         pass
 
+    def needs_frames(self, display):
+        """
+        Determines whether this overlay is animating and needs frames rendered at full speed
+        :param display: The DisplayManager
+        :return: True if the overlay is animating
+        """
+        return False
+
+    def is_enabled(self):
+        """
+        Determines whether the overlay is turned on. Static overlays are only rebuilt when this changes.
+        :return: True if the overlay should render
+        """
+        return True
+
 
 class ScanlineOverlay(Overlay):
     """
@@ -39,7 +60,52 @@ class ScanlineOverlay(Overlay):
     speed = 3
     height = 20
     intensity = 1.25
-    delay = 240
+    delay = 4.0  # Seconds between the line leaving the screen and coming back around
+
+    def __init__(self, options):
+        super(ScanlineOverlay, self).__init__(options)
+        self.strip = None
+        self.strip_key = None
+        self.left_screen_at = None  # When the line last went off the bottom of the screen
+
+    def is_enabled(self):
+        """
+        Determines whether the overlay is turned on
+        :return: True if the overlay should render
+        """
+        return self.options.enable_scan_line
+
+    def get_strip(self, display):
+        """
+        Gets the gradient strip that makes up the scanline, building it if the width or color has changed
+        :param display: The DisplayManager
+        :rtype: pygame.Surface
+        """
+
+        width = max(1, display.bounds.right)
+        c = display.color_scheme.highlight
+        key = width, color_key(c)
+
+        if self.strip is None or key != self.strip_key:
+            self.strip = pygame.Surface((width, self.height), pygame.SRCALPHA)
+            for i in range(0, self.height):
+                self.strip.fill(to_rgba(c, int(i * self.intensity)), Rect(0, i, width, 1))
+
+            self.strip_key = key
+
+        return self.strip
+
+    def needs_frames(self, display):
+        """
+        Determines whether this overlay is animating and needs frames rendered at full speed. The line only needs them
+        while it's on screen. The wait before it comes back around is timed in seconds so it can pass at the idle rate.
+        :param display: The DisplayManager
+        :return: True if the overlay is animating
+        """
+        if not self.options.enable_scan_line:
+            return False
+
+        return self.left_screen_at is None or time.time() - self.left_screen_at >= self.delay
 
     def render(self, display, surface):
         """
@@ -51,20 +117,29 @@ class ScanlineOverlay(Overlay):
         if not self.options.enable_scan_line:
             return
 
-        max_x = display.bounds.right - 1
+        # Wait off screen before starting the next pass
+        if self.left_screen_at is not None:
+            if time.time() - self.left_screen_at < self.delay:
+                return
 
-        # Draw our line
-        c = display.color_scheme.highlight
-        for i in range(0, self.height):
-            alpha = (i * self.intensity)
-            draw_horizontal_line(display, to_rgba(c, alpha), 0, max_x, self.y + i, surface=surface)
+            self.left_screen_at = None
+            self.y = -self.height
+
+        # Draw our line as a single blit of the pre-rendered gradient
+        y = int(self.y)
+        rect = surface.blit(self.get_strip(display), (0, y))
+        display.track_draw(surface, rect, 'scanline', y, self.strip_key)
 
         # Animate downwards - try to keep a constant perceived pace, regardless of FPS setting
-        effective_speed = self.speed * (60.0 / display.frames_per_second)
-        if self.y < display.bounds.bottom + self.height + (self.delay * effective_speed):
-            self.y += effective_speed
+        fps = display.frame_scheduler.target_frames_per_second
+        if fps > 0:
+            effective_speed = self.speed * (60.0 / fps)
         else:
-            self.y = -self.height
+            effective_speed = self.speed
+
+        self.y += effective_speed
+        if self.y >= display.bounds.bottom:
+            self.left_screen_at = time.time()
 
 
 class InterlaceOverlay(Overlay):
@@ -73,6 +148,14 @@ class InterlaceOverlay(Overlay):
     """
 
     alpha = 80
+    is_static = True
+
+    def is_enabled(self):
+        """
+        Determines whether the overlay is turned on
+        :return: True if the overlay should render
+        """
+        return self.options.enable_interlacing
 
     def render(self, display, surface):
         """
@@ -99,6 +182,14 @@ class ShadowEffectOverlay(Overlay):
 
     alpha = 60
     size = 5
+    is_static = True
+
+    def is_enabled(self):
+        """
+        Determines whether the overlay is turned on
+        :return: True if the overlay should render
+        """
+        return self.options.enable_shadow_effect
 
     def render(self, display, surface):
         """
@@ -143,4 +234,138 @@ class FPSOverlay(Overlay):
         text = "{:.2f}".format(fps)
         color = display.color_scheme.highlight
 
-        render_text(display, display.fonts.small, text, self.x, self.y, color, surface=surface)
\ No newline at end of file
+        render_text(display, display.fonts.small, text, self.x, self.y, color, surface=surface)
+
+
+class FrameTimingOverlay(Overlay):
+    """
+    Renders frame time percentiles, a frame time sparkline, and any other registered statistics to the screen
+    """
+
+    x = 4
+    y = 30
+    graph_width = 120
+    graph_height = 24
+
+    def render(self, display, surface):
+        """
+        Renders the overlay
+        :param display: The DisplayManager
+        :param surface: The overlay graphical surface to render to
+        """
+
+        if not self.options.enable_frame_timing:
+            return
+
+        font = display.fonts.small
+        color = display.color_scheme.highlight
+        line_height = font.size + 2
+        y = self.y
+
+        # Percentiles of the time spent working each frame
+        percentiles = display.frame_timer.get_percentiles()
+        if percentiles:
+            text = "p50 {:.1f} p95 {:.1f} p99 {:.1f} ms".format(*[p * 1000 for p in percentiles])
+            render_text(display, font, text, self.x, y, color, surface=surface)
+            y += line_height
+
+        # Sparkline of recent frame times relative to the time we have for each frame
+        times = display.frame_timer.get_work_times()[-self.graph_width:]
+        if len(times) > 1:
+            fps = display.frame_scheduler.target_frames_per_second or 60
+            budget = 1.0 / fps
+            bottom = y + self.graph_height
+
+            # Budget line is at half height so we can see how far over budget slow frames go
+            draw_horizontal_line(display, to_rgba(color, 128), self.x, self.x + self.graph_width,
+                                 bottom - (self.graph_height / 2), surface=surface)
+
+            points = []
+            for i, t in enumerate(times):
+                height = min(self.graph_height, int(t / budget * (self.graph_height / 2)))
+                points.append((self.x + i, bottom - height))
+
+            rect = pygame.draw.lines(surface, color, False, points, 1)
+            display.track_draw(surface, rect, 'frame_times', tuple(points))
+            y = bottom + 4
+
+        # Additional statistics from other systems
+        for source in display.stats_sources:
+            for line in source():
+                render_text(display, font, line, self.x, y, color, surface=surface)
+                y += line_height
+
+
+class BootProgressOverlay(Overlay):
+    """
+    Lists the steps of a staged boot and how far along each one is until the boot completes
+    :type boot: PiMFD.Booting.BootSequence
+    """
+
+    def __init__(self, options, boot):
+        super(BootProgressOverlay, self).__init__(options)
+        self.boot = boot
+
+    def needs_frames(self, display):
+        """
+        Keeps frames coming while booting so steps that run between frames aren't held up by idle throttling
+        :param display: The DisplayManager
+        :return: True if the boot isn't complete
+        """
+        return not self.boot.is_complete()
+
+    def render(self, display, surface):
+        """
+        Renders each step's name and state in the lower right of the content area
+        :param display: The DisplayManager
+        :param surface: The overlay graphical surface to render to
+        """
+
+        if self.boot.is_complete():
+            return
+
+        font = display.fonts.small
+        color = display.color_scheme.highlight
+        line_height = font.size + 2
+
+        lines = ['{} {}'.format(step.name, step.state) for step in self.boot.steps]
+        right = display.get_content_end_x()
+        y = display.get_content_end_y() - (line_height * len(lines))
+
+        for line in lines:
+            render_text(display, font, line, right - font.measure(line)[0], y, color, surface=surface)
+            y += line_height
+
+
+class DirtyRectOverlay(Overlay):
+    """
+    A debugging overlay that outlines the regions of the screen that were pushed to the display last frame
+    """
+
+    def __init__(self, options):
+        super(DirtyRectOverlay, self).__init__(options)
+        self.last_outlines = list()
+
+    def render(self, display, surface):
+        """
+        Renders the overlay
+        :param display: The DisplayManager
+        :param surface: The overlay graphical surface to render to
+        """
+
+        # Make sure outlines from the last frame get erased
+        for rect in self.last_outlines:
+            display.dirty_rects.add_debug_rect(rect)
+
+        self.last_outlines = list()
+
+        if not self.options.show_dirty_rects or not display.use_dirty_rects:
+            return
+
+        color = to_rgba(display.color_scheme.highlight, 200)
+
+        # Draw without tracking the outlines or we'd be outlining our own outlines next frame
+        for rect in display.dirty_rects.damaged:
+            outline = pygame.draw.rect(surface, color, rect, 1)
+            display.dirty_rects.add_debug_rect(outline)
+            self.last_outlines.append(outline)
@@ -3,7 +3,7 @@
 """
 Contains logic on pages for rendering controls and handling input
 """
-from PiMFD.UI.Focus import FocusableWidget
+from PiMFD.UI.Focus import FocusableWidget, FocusRegistry
 from PiMFD.UI.Keycodes import is_up_key, is_down_key
 
 from PiMFD.UI.Panels import StackPanel
@@ -17,7 +17,7 @@ class UIPage(UIObject):
     Represents a user interface page.
     """
 
-    focusables = list()
+    focusables = None
 
     panel = None
     focus = None
@@ -28,7 +28,7 @@ class UIPage(UIObject):
         """
         super(UIPage, self).__init__(display)
         self.panel = self.get_panel()
-        self.focusables = list()
+        self.focusables = FocusRegistry()
         
     def get_panel(self):
         """
@@ -54,12 +54,15 @@ class UIPage(UIObject):
         # Tell the old focus it's old news
         if self.focus:
             self.focus.lost_focus()
+            self.focus.invalidate_layout()
 
         self.focus = widget
 
         # Tell the new focus it's getting some TLC
         if widget:
 
+            widget.invalidate_layout()
+
             print('focusing {}'.format(str(widget)))
             widget.got_focus()
             
@@ -71,6 +74,14 @@ class UIPage(UIObject):
 
         return self.focus
 
+    # noinspection PyMethodMayBeStatic
+    def scroll_to(self, y):
+        """
+        Scrolls so that content at the specified y coordinate is visible. Pages that don't scroll ignore this.
+        :param y: The y coordinate
+        """
+        pass
+
     def clear_focus(self):
         """
         Clears the currently focused control (if any was present)
@@ -96,8 +107,9 @@ class UIPage(UIObject):
         Focuses the first eligible input element
         :return: the first eligible input element
         """
-        if len(self.focusables) > 0:
-            return self.set_focus(self.focusables[0])
+        widget = self.focusables.first()
+        if widget:
+            return self.set_focus(widget)
         else:
             return None
 
@@ -120,13 +132,7 @@ class UIPage(UIObject):
 
         if is_up_key(key):
             if self.focus:
-                index = self.focusables.index(self.focus)
-                if index == 0:
-                    self.set_focus(self.focusables[-1])
-                elif index < 0:
-                    self.focus_first_eligibile()
-                else:
-                    self.set_focus(self.focusables[index - 1])
+                self.set_focus(self.focusables.get_previous(self.focus))
             else:
                 self.focus_first_eligibile()
 
@@ -134,13 +140,7 @@ class UIPage(UIObject):
 
         if is_down_key(key):
             if self.focus:
-
-                index = self.focusables.index(self.focus)
-                if 0 <= index < (len(self.focusables) - 1):
-                    self.set_focus(self.focusables[index + 1])
-                else:
-                    self.focus_first_eligibile()
-
+                self.set_focus(self.focusables.get_next(self.focus))
             else:
                 self.focus_first_eligibile()
 
@@ -179,18 +179,18 @@ class UIPage(UIObject):
         :param focusable: The control that can receive focus
         """
         if focusable is not None:
-            self.focusables.append(focusable)
+            self.focusables.register(focusable)
 
     def unregister_focusable(self, focusable):
         """
         Deregisters a control as a focusable input element.
         :param focusable: The control that can no longer receive focus
         """
-        if focusable is not None and focusable in self.focusables:
-            self.focusables.remove(focusable)
+        if focusable is not None:
+            self.focusables.unregister(focusable)
 
     def clear_focusables(self):
         """
         Clears the list of focusable controls.
         """
-        self.focusables = []
\ No newline at end of file
+        self.focusables.clear()
\ No newline at end of file
@@ -13,22 +13,107 @@ class UIPanel(UIWidget):
 
     children = list()
     keep_together = False
+    incremental_layout = True
+    arranged_pos = None
+    arranged_children = None
+
+    widgets_created = 0
+    widgets_reused = 0
+    widgets_destroyed = 0
 
     def __init__(self, display, page, keep_together=False):
         super(UIPanel, self).__init__(display, page)
         self.children = list()
         self.keep_together = keep_together
+        self.keyed_children = dict()
 
     def arrange(self):
+
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         # Not a correct implementation for most usages, but we do want to ensure things get arranged
         for child in self.children:
             child.parent = self
             child.arrange()
 
+        self.arranged()
         return super(UIPanel, self).arrange()
+
+    def needs_arrange(self):
+        """
+        Determines whether the panel needs to be arranged. This is the case if the panel moved, its children changed, or
+        any of its children need to be arranged.
+        :return: True if the panel needs to be arranged
+        """
+
+        if super(UIPanel, self).needs_arrange():
+            return True
+
+        if self.pos != self.arranged_pos or list(self.children) != self.arranged_children:
+            return True
+
+        for child in self.children:
+            if child.needs_arrange():
+                return True
+
+        return False
+
+    def arranged(self):
+        """
+        Records that the panel has been arranged along with the position and children it was arranged with
+        """
+        self.arranged_pos = self.pos
+        self.arranged_children = list(self.children)
+
+        super(UIPanel, self).arranged()
     
     def child_focused(self, widget):
         pass
+
+    def reconcile(self, rows, create, update=None):
+        """
+        Updates the panel's children to match a list of rows, reusing the widgets from the last reconcile wherever the
+        row keys match. Only rows with new keys get new widgets and only widgets whose keys have gone away are dropped.
+        :param rows: A sequence of (key, data) tuples in the order the children should appear. Keys should be unique.
+        :param create: A function taking a key and data and returning a new widget for the row
+        :param update: A function taking a widget and data that updates the widget for the row's current data. This
+                       is called for new widgets as well as reused ones.
+        :return: The panel's new children
+        """
+
+        stats = self.display.layout_stats
+        old_children = self.keyed_children
+        self.keyed_children = dict()
+
+        children = list()
+        for key, data in rows:
+
+            widget = old_children.pop(key, None)
+            if widget is None:
+                widget = create(key, data)
+                self.widgets_created += 1
+                stats.widgets_created += 1
+            else:
+                self.widgets_reused += 1
+                stats.widgets_reused += 1
+
+            if update:
+                update(widget, data)
+
+            self.keyed_children[key] = widget
+            children.append(widget)
+
+        # Anything left over is no longer needed. Make sure focus navigation forgets it.
+        for widget in old_children.values():
+            if self.page:
+                self.page.unregister_focusable(widget)
+
+        self.widgets_destroyed += len(old_children)
+        stats.widgets_destroyed += len(old_children)
+
+        self.children = children
+        return children
     
 
 class StackPanel(UIPanel):
@@ -50,6 +135,9 @@ class StackPanel(UIPanel):
 
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         x, y = self.pos
 
         width = 0
@@ -144,6 +232,7 @@ class StackPanel(UIPanel):
 
         # Update size and return
         self.desired_size = width, height
+        self.arranged()
         return self.desired_size
 
     def render(self):
@@ -165,11 +254,14 @@ class StackPanel(UIPanel):
         min_y = self.display.get_content_start_y()
         max_y = self.display.get_content_end_y()
 
+        # Offscreen surfaces have their own coordinates, so the content area doesn't apply to them
+        is_offscreen = bool(self.display.render_targets)
+
         # Render children where arrange told us to
         for child in self.children:
 
             # Only render nodes that will be visible
-            if child.pos[1] < max_y and (child.pos[1] + child.desired_size[1]) > min_y:
+            if is_offscreen or (child.pos[1] < max_y and (child.pos[1] + child.desired_size[1]) > min_y):
                 child.render()
 
         # Update and return our bounds
@@ -191,6 +283,9 @@ class DoubleWideStackPanel(UIPanel):
 
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         x, y = self.pos
 
         start_x = x
@@ -234,6 +329,7 @@ class DoubleWideStackPanel(UIPanel):
 
         # Update size and return
         self.desired_size = width, height
+        self.arranged()
         return self.desired_size
 
     def render(self):
@@ -250,11 +346,14 @@ class DoubleWideStackPanel(UIPanel):
         min_y = self.display.get_content_start_y()
         max_y = self.display.get_content_end_y()
 
+        # Offscreen surfaces have their own coordinates, so the content area doesn't apply to them
+        is_offscreen = bool(self.display.render_targets)
+
         # Render children where arrange told us to
         for child in self.children:
 
             # Only render nodes that will be visible
-            if child.pos[1] < max_y and (child.pos[1] + child.desired_size[1]) > min_y:
+            if is_offscreen or (child.pos[1] < max_y and (child.pos[1] + child.desired_size[1]) > min_y):
                 child.render()
 
         # Update and return our bounds
@@ -277,6 +376,9 @@ class WrapPanel(UIPanel):
 
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         x, y = self.pos
 
         start_x = x
@@ -326,6 +428,7 @@ class WrapPanel(UIPanel):
 
         # Update size and return
         self.desired_size = width, height
+        self.arranged()
         return self.desired_size
 
     def render(self):
@@ -342,11 +445,14 @@ class WrapPanel(UIPanel):
         min_y = self.display.get_content_start_y()
         max_y = self.display.get_content_end_y()
 
+        # Offscreen surfaces have their own coordinates, so the content area doesn't apply to them
+        is_offscreen = bool(self.display.render_targets)
+
         # Render children where arrange told us to
         for child in self.children:
 
             # Only render nodes that will be visible
-            if child.pos[1] < max_y and (child.pos[1] + child.desired_size[1]) > min_y:
+            if is_offscreen or (child.pos[1] < max_y and (child.pos[1] + child.desired_size[1]) > min_y):
                 child.render()
 
         # Update and return our bounds
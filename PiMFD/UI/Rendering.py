@@ -23,7 +23,8 @@ def draw_horizontal_line(display_manager, color, x1, x2, y, surface=None):
     if surface is None:
         surface = display_manager.surface
 
-    pygame.draw.line(surface, color, (x1, y), (x2, y))
+    rect = pygame.draw.line(surface, color, (x1, y), (x2, y))
+    display_manager.track_draw(surface, rect, 'hline', color_key(color), x1, x2, y)
 
 
 def draw_vertical_line(display_manager, color, x, y1, y2, surface=None):
@@ -39,7 +40,8 @@ def draw_vertical_line(display_manager, color, x, y1, y2, surface=None):
     if surface is None:
         surface = display_manager.surface
 
-    pygame.draw.line(surface, color, (x, y1), (x, y2))
+    rect = pygame.draw.line(surface, color, (x, y1), (x, y2))
+    display_manager.track_draw(surface, rect, 'vline', color_key(color), x, y1, y2)
 
 
 def render_rectangle(display_manager, color, rect, width=1, surface=None):
@@ -54,7 +56,8 @@ def render_rectangle(display_manager, color, rect, width=1, surface=None):
     if surface is None:
         surface = display_manager.surface
 
-    pygame.draw.rect(surface, color, rect, width)
+    bounds = pygame.draw.rect(surface, color, rect, width)
+    display_manager.track_draw(surface, bounds, 'rect', color_key(color), tuple(bounds), width)
 
 
 def render_circle(display_manager, color, center_pos, radius, width=1):
@@ -67,7 +70,9 @@ def render_circle(display_manager, color, center_pos, radius, width=1):
     :param width: The thickness of the circle's edge or 0 for fill
     :return: A Rect indicating the bounds of the drawn areas
     """
-    return pygame.draw.circle(display_manager.surface, color, center_pos, int(radius), width)
+    rect = pygame.draw.circle(display_manager.surface, color, center_pos, int(radius), width)
+    return display_manager.track_draw(display_manager.surface, rect, 'circle', color_key(color), tuple(center_pos),
+                                      int(radius), width)
 
 
 def render_diamond(display_manager, color, center_pos, radius, width=1):
@@ -86,7 +91,7 @@ def render_diamond(display_manager, color, center_pos, radius, width=1):
 
     points = ((x - radius, y), (x, y - radius), (x + radius, y), (x, y + radius))
 
-    return pygame.draw.polygon(display_manager.surface, color, points, width)
+    return render_polygon(display_manager, color, points, width)
 
 
 def render_triangle_right(display_manager, color, center_pos, radius, width=1):
@@ -105,7 +110,7 @@ def render_triangle_right(display_manager, color, center_pos, radius, width=1):
 
     points = ((x, y - radius), (x + radius, y), (x, y + radius))
 
-    return pygame.draw.polygon(display_manager.surface, color, points, width)
+    return render_polygon(display_manager, color, points, width)
 
 
 def render_triangle_left(display_manager, color, center_pos, radius, width=1):
@@ -124,7 +129,7 @@ def render_triangle_left(display_manager, color, center_pos, radius, width=1):
 
     points = ((x, y - radius), (x - radius, y), (x, y + radius))
 
-    return pygame.draw.polygon(display_manager.surface, color, points, width)
+    return render_polygon(display_manager, color, points, width)
 
 
 def render_triangle_up(display_manager, color, center_pos, radius, width=1):
@@ -143,7 +148,7 @@ def render_triangle_up(display_manager, color, center_pos, radius, width=1):
 
     points = ((x, y - radius), (x - radius, y), (x + radius, y))
 
-    return pygame.draw.polygon(display_manager.surface, color, points, width)
+    return render_polygon(display_manager, color, points, width)
 
 
 def render_triangle_down(display_manager, color, center_pos, radius, width=1):
@@ -162,7 +167,32 @@ def render_triangle_down(display_manager, color, center_pos, radius, width=1):
 
     points = ((x, y + radius), (x - radius, y), (x + radius, y))
 
-    return pygame.draw.polygon(display_manager.surface, color, points, width)
+    return render_polygon(display_manager, color, points, width)
+
+
+def render_polygon(display_manager, color, points, width=1):
+    """
+    Renders a closed polygon
+    :param display_manager: The display manager
+    :param color: The color to use for the shape
+    :param points: The points making up the polygon
+    :param width: The thickness of the shape or 0 for fill
+    :return: A Rect indicating the bounds of the drawn areas
+    """
+    rect = pygame.draw.polygon(display_manager.surface, color, points, width)
+    return display_manager.track_draw(display_manager.surface, rect, 'polygon', color_key(color), tuple(points), width)
+
+
+def color_key(color):
+    """
+    Gets a hashable representation of a color for use in dirty rect tracking
+    :param color: The color. This may be None, a tuple, a list, or a pygame.Color
+    :return: A hashable representation of the color
+    """
+    if color is None or isinstance(color, tuple):
+        return color
+
+    return tuple(color)
 
 
 def degrees_to_radians(deg):
@@ -177,7 +207,10 @@ def draw_arc(display_manager, rect, color, start_degree, end_degree, surface=Non
     if not surface:
         surface = display_manager.surface
 
-    pygame.draw.arc(surface, color, rect, degrees_to_radians(start_degree), degrees_to_radians(end_degree), width)
+    bounds = pygame.draw.arc(surface, color, rect, degrees_to_radians(start_degree), degrees_to_radians(end_degree),
+                             width)
+    display_manager.track_draw(surface, bounds, 'arc', color_key(color), tuple(Rect(rect)), start_degree, end_degree,
+                               width)
 
 
 def draw_full_arc(display_manager, rect, color, surface=None, width=1):
@@ -205,6 +238,28 @@ def draw_left_arc(display_manager, rect, color, surface=None, width=1):
     draw_arc(display_manager, rect, color, 90, 270, surface, width)
 
 
+def get_text_surface(display_manager, font, text, color, background=None, antialias=True):
+    """
+    Gets a surface containing the rendered text, reusing a previously rendered surface if one is available
+    :param display_manager: The DisplayManager
+    :type font: PiMFD.UI.Fonts.FontInfo The font used to render the text
+    :type text: str The text to render
+    :type color: tuple The RGB color to render the text using
+    :type background: unknown or tuple The RGB color to render the background or None (default) for transparent
+    :type antialias: bool Whether or not to antialias the text
+    :return: The surface containing the text. This surface may be shared and should not be modified.
+    """
+
+    key = (font.name, font.size, text, color_key(color), color_key(background), antialias)
+
+    text_surface = display_manager.text_cache.get(key)
+
+    if text_surface is None:
+        text_surface = display_manager.text_cache.add(key, font.render(text, antialias, color, background))
+
+    return text_surface
+
+
 def render_text(display_manager, font, text, left, top, color, background=None, surface=None):
     """
     Renders text to the screen at the specified coordinates with the specified display parameters
@@ -218,17 +273,15 @@ def render_text(display_manager, font, text, left, top, color, background=None,
     :param surface: The surface to render to. Defaults to the primary surface.
     :return: A Rect representing the rendered area for the text
     """
-    text_surface = font.render(text, True, color)
+    text_surface = get_text_surface(display_manager, font, text, color, background)
     rect = text_surface.get_rect(top=top, left=left)
 
     if surface is None:
         surface = display_manager.surface
 
-    if background:
-        surface.fill(background, rect=rect)
-
     surface.blit(text_surface, rect)
-    return rect
+    return display_manager.track_draw(surface, rect, 'text', text, id(font), color_key(color), color_key(background),
+                                      tuple(rect))
 
 
 def render_text_centered(display_manager, font, text, left, top, color, background=None, surface=None):
@@ -244,17 +297,15 @@ def render_text_centered(display_manager, font, text, left, top, color, backgrou
     :param surface: The surface to render to. Defaults to the primary surface.
     :return: A Rect representing the rendered area for the text
     """
-    text_surface = font.font.render(text, True, color)
-    rect = text_surface.get_rect(center=(left, top + (font.measure(text)[1] / 2)))
+    text_surface = get_text_surface(display_manager, font, text, color, background)
+    rect = text_surface.get_rect(center=(left, top + (text_surface.get_height() / 2)))
 
     if surface is None:
         surface = display_manager.surface
 
-    if background:
-        surface.fill(background, rect=rect)
-
     surface.blit(text_surface, rect)
-    return rect
+    return display_manager.track_draw(surface, rect, 'text', text, id(font), color_key(color), color_key(background),
+                                      tuple(rect))
 
 
 def to_rgba(color, alpha=255):
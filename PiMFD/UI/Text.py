@@ -5,6 +5,7 @@ Contains code useful for rendering lines of text
 from pygame.rect import Rect
 
 from PiMFD.UI.Panels import UIWidget
+from PiMFD.UI.WidgetBase import layout_property
 from PiMFD.UI.Rendering import render_text
 
 
@@ -16,9 +17,15 @@ class SpacerLine(UIWidget):
     A simple construct for a blank line
     """
 
+    incremental_layout = True
+
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         self.desired_size = self.display.fonts.normal.size, self.display.fonts.normal.size
+        self.arranged()
 
         return super(SpacerLine, self).arrange()
 
@@ -35,12 +42,13 @@ class TextBlock(UIWidget):
     Represents a segment of text
     """
 
-    font = None
-    text = None
-    text_data = None
-    is_highlighted = False
+    font = layout_property('_font')
+    text = layout_property('_text')
+    text_data = layout_property('_text_data')
     is_enabled = True
     color = None
+    incremental_layout = True
+    effective_text = None
 
     def __init__(self, display, page, text, is_highlighted=False):
         super(TextBlock, self).__init__(display, page)
@@ -73,9 +81,14 @@ class TextBlock(UIWidget):
 
     def arrange(self):
 
-        effective_text = self.get_effective_text()
+        if not self.needs_arrange():
+            return self.skip_arrange()
 
-        self.desired_size = self.font.measure(effective_text)
+        # Keep the formatted text around so rendering doesn't need to format it again
+        self.effective_text = self.get_effective_text()
+
+        self.desired_size = self.font.measure(self.effective_text)
+        self.arranged()
 
         return super(TextBlock, self).arrange()
 
@@ -109,11 +122,15 @@ class TextBlock(UIWidget):
         self.left = self.pos[0]
         self.top = self.pos[1]
 
-        effective_text = self.get_effective_text()
+        if self.layout_dirty or self.effective_text is None:
+            effective_text = self.get_effective_text()
+        else:
+            effective_text = self.effective_text
 
-        if self.font is not None and effective_text is not None:
+        font = self.font
+        if font is not None and effective_text is not None:
             color = self.get_foreground()
-            self.rect = render_text(self.display, self.font, effective_text, self.pos[0], self.pos[1], color)
+            self.rect = render_text(self.display, font, effective_text, self.pos[0], self.pos[1], color)
         else:
             self.rect = Rect(self.left, self.top, 0, 0)
 
@@ -4,11 +4,72 @@
 Contains the base UIWidget definition
 """
 
+import pygame
 from pygame.rect import Rect
 
 __author__ = 'Matt Eland'
 
 
+def layout_property(name, default=None):
+    """
+    Builds a property for a widget attribute that affects arrangement. Setting it to a different value flags the widget
+    as needing to be arranged again.
+    :param name: The name of the attribute used to store the value
+    :param default: The value of the property before it is set
+    :rtype: property
+    """
+
+    def get_value(self):
+        return self.__dict__.get(name, default)
+
+    def set_value(self, value):
+        old = self.__dict__.get(name, default)
+
+        # Check the type as well since values like 1 and True are equal but format differently
+        if type(value) is not type(old) or value != old:
+            self.__dict__[name] = value
+            self.layout_dirty = True
+
+    return property(get_value, set_value)
+
+
+class LayoutStats(object):
+    """
+    Counts how many widgets were arranged and how many were able to skip arrangement because nothing changed, as well as
+    how many widgets panels have had to create, reuse and throw away when reconciling their children
+    """
+
+    def __init__(self):
+        super(LayoutStats, self).__init__()
+
+        self.arranged = 0
+        self.skipped = 0
+        self.last_arranged = 0
+        self.last_skipped = 0
+
+        # These are running totals rather than per frame
+        self.widgets_created = 0
+        self.widgets_reused = 0
+        self.widgets_destroyed = 0
+
+    def end_frame(self):
+        """
+        Completes counting for the current frame
+        """
+        self.last_arranged, self.last_skipped = self.arranged, self.skipped
+        self.arranged = 0
+        self.skipped = 0
+
+    def get_stats_text(self):
+        """
+        :return: A line of text describing the last frame's arrangement work
+        """
+        return 'Layout: {} arranged, {} skipped, {} created, {} destroyed'.format(self.last_arranged,
+                                                                                 self.last_skipped,
+                                                                                 self.widgets_created,
+                                                                                 self.widgets_destroyed)
+
+
 class UIObject(object):
     """
     A base representation of a UI element that will need a reference to a display manager at some point
@@ -61,9 +122,20 @@ class UIWidget(UIObject):
     rect = Rect(0, 0, 0, 0)
     page = None
     data_context = None
-    is_highlighted = None
+    is_highlighted = layout_property('_is_highlighted')
     parent = None
 
+    # Widgets that flag layout_dirty whenever something affecting their size changes can opt in to skipping arrangement
+    # when nothing has changed since they were last arranged
+    incremental_layout = False
+    layout_dirty = True
+    layout_version = None
+
+    # Widgets that can describe everything affecting their appearance in get_render_key can opt in to being drawn once
+    # to an offscreen surface that later frames blit until something in the key changes
+    retained = False
+    render_version = 0
+
     def __init__(self, display, page):
         """
         :type page: PiMFD.UI.Pages.UIPage
@@ -72,6 +144,97 @@ class UIWidget(UIObject):
         super(UIWidget, self).__init__(display)
         self.page = page
 
+    def invalidate_layout(self):
+        """
+        Flags the widget as needing to be arranged again
+        """
+        self.layout_dirty = True
+
+    def needs_arrange(self):
+        """
+        Determines whether anything affecting the widget's arrangement has changed since it was last arranged
+        :return: True if the widget needs to be arranged
+        """
+        return not self.incremental_layout or self.layout_dirty or self.layout_version != self.display.layout_version
+
+    def arranged(self):
+        """
+        Records that the widget has been arranged and is up to date
+        """
+        self.layout_dirty = False
+        self.layout_version = self.display.layout_version
+        self.display.layout_stats.arranged += 1
+
+    def skip_arrange(self):
+        """
+        Records that arrangement was skipped since nothing changed
+        :return: The size from the last arrangement
+        """
+        self.display.layout_stats.skipped += 1
+        return self.desired_size
+
+    def get_render_key(self):
+        """
+        Gets hashable values describing everything that affects how a retained widget looks, aside from its position,
+        size and the color scheme. Any change to these values causes the widget to be drawn again.
+        :return: A tuple or None if the widget can't be drawn from a cached surface right now
+        """
+        return None
+
+    def get_render_size(self):
+        """
+        Gets the size of the area a retained widget draws in, relative to its position
+        :return: A (width, height) tuple
+        """
+        return self.desired_size
+
+    def invalidate_render(self):
+        """
+        Flags a retained widget as needing to be drawn again even though its render key hasn't changed
+        """
+        self.render_version += 1
+
+    def render_retained(self, render):
+        """
+        Draws the widget via the display's widget surface cache if the widget is retained. On a cache miss the widget is
+        drawn to a new offscreen surface positioned at the origin; otherwise the surface from a previous frame is
+        blitted at the widget's position.
+        :param render: A function that draws the widget at its current position and returns the rect it drew
+        :return: The rect of the widget as it was rendered
+        """
+
+        cache = self.display.widget_cache
+        key = self.get_render_key() if self.retained and cache.max_bytes > 0 else None
+        if key is None:
+            return render()
+
+        size = self.get_render_size()
+        key = (self.__class__, self.render_version, self.display.color_scheme.name, tuple(size)) + key
+
+        surface = cache.get(key)
+        pos = self.pos
+
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+
+            # Arrange relative to the origin so that children land inside the surface, then put everything back
+            self.pos = 0, 0
+            self.display.push_render_target(surface)
+            try:
+                self.arrange()
+                render()
+            finally:
+                self.display.pop_render_target()
+                self.pos = pos
+                self.arrange()
+
+            cache.add(key, surface)
+
+        self.display.surface.blit(surface, pos)
+        self.display.track_draw(self.display.surface, Rect(pos, size), 'widget', key)
+
+        return self.set_dimensions_from_rect(Rect(pos, self.desired_size))
+
     def render_at(self, pos):
         """
         A convenience method to position and render the control in one statement
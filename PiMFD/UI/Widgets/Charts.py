@@ -5,7 +5,7 @@ Contains chart-related widgets
 """
 from pygame.rect import Rect
 
-from PiMFD.UI.Rendering import draw_horizontal_line, draw_vertical_line, render_rectangle
+from PiMFD.UI.Rendering import draw_horizontal_line, draw_vertical_line, render_rectangle, color_key
 from PiMFD.UI.WidgetBase import UIWidget
 
 
@@ -32,6 +32,7 @@ class BoxChart(UIWidget):
     box_width = 0
 
     ticks = None
+    retained = True
 
     def __init__(self, display, page):
         super(BoxChart, self).__init__(display, page)
@@ -49,12 +50,28 @@ class BoxChart(UIWidget):
             return self.color
 
         return self.display.color_scheme.foreground
-    
+
+    def get_render_key(self):
+        return (color_key(self.get_color()), self.is_highlighted, self.width, self.height, self.range_low,
+                self.range_high, self.value_low, self.value_high, self.value_current, self.box_width, tuple(self.ticks))
+
+    def get_render_size(self):
+
+        # The edges and tick marks are drawn inclusive of the right and bottom
+        return self.width + 1, self.height + 1
+
     def render(self):
         """
         Renders the widget to the screen
         :return: The rect of the control as it was rendered
         """
+        return self.render_retained(self.render_content)
+
+    def render_content(self):
+        """
+        Draws the chart at its current position
+        :return: The rect of the control as it was rendered
+        """
 
         # Standardize our dimensions
         self.rect = Rect(self.pos[0], self.pos[1], self.width, self.height)
@@ -110,6 +127,7 @@ class BarChart(UIWidget):
     height = 8
 
     color = None
+    retained = True
 
     def __init__(self, display, page, value=0, range_low=0, range_high=100, width=100, height=8):
         super(BarChart, self).__init__(display, page)
@@ -135,13 +153,22 @@ class BarChart(UIWidget):
             return self.display.color_scheme.highlight
         else:
             return self.display.color_scheme.foreground
-        
+
+    def get_render_key(self):
+        return color_key(self.get_color()), self.width, self.height, self.range_low, self.range_high, self.value
 
     def render(self):
         """
         Renders the widget to the screen
         :return: The rect of the control as it was rendered
         """
+        return self.render_retained(self.render_content)
+
+    def render_content(self):
+        """
+        Draws the chart at its current position
+        :return: The rect of the control as it was rendered
+        """
 
         # Standardize our dimensions
         self.rect = Rect(self.pos[0], self.pos[1], self.width, self.height)
@@ -27,6 +27,13 @@ class DashboardStatus(object):
 class DashboardWidget(UIWidget):
     padding = 8
 
+    # Dashboard values change every second or so at most, so tiles are redrawn only when their render key changes
+    retained = True
+
+    # Tiles are arranged again when they move or when the dashboard is told their data changed
+    incremental_layout = True
+    arranged_pos = None
+
     def __init__(self, display, page, status=DashboardStatus.Passive):
         super(DashboardWidget, self).__init__(display, page)
 
@@ -62,6 +69,28 @@ class DashboardWidget(UIWidget):
         
         return self.get_status_color(self.status)
 
+    def needs_arrange(self):
+        return super(DashboardWidget, self).needs_arrange() or self.pos != self.arranged_pos
+
+    def arranged(self):
+        self.arranged_pos = self.pos
+        super(DashboardWidget, self).arranged()
+
+    def render(self):
+        """
+        Renders the widget to the screen
+        :return: The rect of the widget as it was rendered
+        """
+        return self.render_retained(self.render_content)
+
+    def render_content(self):
+        """
+        Draws the widget at its current position
+        :return: The rect of the widget as it was rendered
+        """
+        return self.rect
+
+
 class BarChartDashboardWidget(DashboardWidget):
     def __init__(self, display, page, title, value=0, range_low=0, range_high=100, status=DashboardStatus.Passive):
         super(BarChartDashboardWidget, self).__init__(display, page, status)
@@ -84,14 +113,22 @@ class BarChartDashboardWidget(DashboardWidget):
 
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         self.lbl_title.text = self.title
         self.chart.value = self.value
+        self.panel.pos = self.pos[0] + self.padding, self.pos[1] + self.padding
         self.panel.arrange()
         self.desired_size = 150 + (self.padding * 2), self.panel.desired_size[1] + (self.padding * 2)
 
+        self.arranged()
         return self.desired_size
 
-    def render(self):
+    def get_render_key(self):
+        return self.status, self.title, self.value
+
+    def render_content(self):
 
         # Colorize as needed
         color = self.get_color()
@@ -145,7 +182,10 @@ class TextDashboardWidget(DashboardWidget):
         self.lbl_value.font = display.fonts.list
         self.panel.children.append(self.lbl_value)
 
-    def render(self):
+    def get_render_key(self):
+        return self.status, self.title, self.value, self.value_font.name, self.value_font.size
+
+    def render_content(self):
 
         # Colorize as needed
         color = self.get_color()        
@@ -172,10 +212,17 @@ class TextDashboardWidget(DashboardWidget):
         return self.set_dimensions_from_rect(rect) 
 
     def arrange(self):
+
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         self.lbl_title.text = self.title
         self.lbl_value.text = self.value
         self.lbl_value.font = self.value_font
 
+        self.panel.pos = self.pos[0] + self.padding, self.pos[1] + self.padding
         self.panel.arrange()
         self.desired_size = 150 + (self.padding * 2), self.panel.desired_size[1] + (self.padding * 2)
+
+        self.arranged()
         return self.desired_size
\ No newline at end of file
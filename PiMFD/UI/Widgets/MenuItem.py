@@ -11,10 +11,12 @@ from PiMFD.UI import Keycodes
 from PiMFD.UI.Focus import FocusableWidget
 from PiMFD.UI.Keycodes import is_right_key, is_enter_key
 from PiMFD.UI.Text import TextBlock
+from PiMFD.UI.WidgetBase import layout_property
 
 
 class MenuItem(FocusableWidget):
     last_click = None
+    incremental_layout = True
 
     def __init__(self, display, page, content=None):
         super(MenuItem, self).__init__(display, page)
@@ -32,13 +34,24 @@ class MenuItem(FocusableWidget):
         else:
             return self.rect
 
+    def needs_arrange(self):
+        """
+        Determines whether the item or its content need to be arranged
+        :return: True if the menu item needs to be arranged
+        """
+        return super(MenuItem, self).needs_arrange() or (self.content is not None and self.content.needs_arrange())
+
     def arrange(self):
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         if self.content:
             self.content.arrange()
             self.content.is_highlighted = self.is_focused()
             self.desired_size = self.content.desired_size
 
+        self.arranged()
         return super(MenuItem, self).arrange()
 
     def handle_key(self, key):
@@ -77,10 +90,10 @@ class TextMenuItem(MenuItem):
     Represents a segment of text
     """
 
-    text = None
-    text_data = None
+    text = layout_property('_text')
+    text_data = layout_property('_text_data')
     label = None
-    font = None
+    font = layout_property('_font')
 
     def __init__(self, display, page, text):
 
@@ -98,6 +111,9 @@ class TextMenuItem(MenuItem):
         :return: The desired size of the control
         """
 
+        if not self.needs_arrange():
+            return self.skip_arrange()
+
         # Pass on data to the control
         self.label.text = self.text
         self.label.text_data = self.text_data
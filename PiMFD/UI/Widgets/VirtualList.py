@@ -0,0 +1,203 @@
+# coding=utf-8
+
+"""
+Contains a list widget that only creates widgets for the rows that are on screen
+"""
+from datetime import datetime
+
+from pygame.rect import Rect
+
+from PiMFD.UI import Keycodes
+from PiMFD.UI.Focus import FocusableWidget
+from PiMFD.UI.Keycodes import is_up_key, is_down_key, is_enter_key, is_right_key
+from PiMFD.UI.Text import TextBlock
+
+__author__ = 'Matt Eland'
+
+
+class VirtualListPanel(FocusableWidget):
+    """
+    A focusable list of single-line rows of text. The list takes up as much room as all of its rows would, but labels
+    are only created for the rows inside the visible page window and are recycled as the window moves. Up / down and
+    page up / page down move the selected row without needing labels for rows that aren't visible.
+    :type display: PiMFD.UI.DisplayManager.DisplayManager
+    :type page: PiMFD.Applications.MFDPage.MFDPage
+    :param source: A sequence of rows or a function returning a sequence of rows
+    :param get_text: A function that takes a row and returns the text to display for it
+    :param font: The font for rows. Defaults to the list font.
+    """
+
+    selected_index = 0
+    row_count = 0
+    last_click = None
+
+    def __init__(self, display, page, source, get_text=str, font=None):
+        super(VirtualListPanel, self).__init__(display, page)
+
+        self.source = source
+        self.get_text = get_text
+        self.font = font or display.fonts.list
+        self.padding = display.padding_x, display.padding_y
+        self.rows = list()
+        self.children = list()
+        self.labels = list()  # Every label we've created, including ones not currently in use
+
+    def get_rows(self):
+        """
+        Gets the current rows from the data source
+        :return: A sequence of rows
+        """
+        if callable(self.source):
+            return self.source() or list()
+
+        return self.source or list()
+
+    def get_row_height(self):
+        """
+        Gets the vertical distance between the tops of consecutive rows
+        """
+        return self.font.height + self.padding[1]
+
+    def get_row_top(self, index):
+        """
+        Gets the y coordinate of the top of a row as of the last arrange
+        :param index: The index of the row
+        """
+        return self.pos[1] + (index * self.get_row_height())
+
+    def get_rows_per_page(self):
+        """
+        Gets the number of rows that fit in the content area
+        """
+        return max(1, self.display.get_content_size()[1] / self.get_row_height())
+
+    @property
+    def data_context(self):
+        """
+        The selected row, so state change handlers can treat the list like the menu item that was clicked
+        """
+        if 0 <= self.selected_index < len(self.rows):
+            return self.rows[self.selected_index]
+
+        return None
+
+    def get_label(self, index):
+        """
+        Gets a label to recycle for a row in the visible window, creating one if we don't have enough
+        :param index: The index within the visible window
+        :rtype: TextBlock
+        """
+
+        while len(self.labels) <= index:
+            label = TextBlock(self.display, self.page, None)
+            label.font = self.font
+            label.parent = self
+            self.labels.append(label)
+
+        return self.labels[index]
+
+    def arrange(self):
+
+        self.rows = self.get_rows()
+        self.row_count = len(self.rows)
+        self.selected_index = max(0, min(self.selected_index, self.row_count - 1))
+
+        row_height = self.get_row_height()
+        x, top = self.pos
+
+        # Figure out which rows are inside the content area
+        first = max(0, int((self.display.get_content_start_y() - top) // row_height))
+        last = min(self.row_count, int((self.display.get_content_end_y() - top) // row_height) + 1)
+
+        # Recycle labels for the visible rows
+        self.children = list()
+        is_focused = self.is_focused()
+
+        for index in range(first, max(first, last)):
+            row = self.rows[index]
+
+            label = self.get_label(index - first)
+            label.text = self.get_text(row)
+            label.data_context = row
+            label.is_highlighted = is_focused and index == self.selected_index
+            label.pos = x, top + (index * row_height)
+            label.arrange()
+
+            self.children.append(label)
+
+        self.desired_size = self.display.get_content_size()[0], self.row_count * row_height
+
+        return super(VirtualListPanel, self).arrange()
+
+    def render(self):
+        """
+        Renders the visible rows
+        :return: A rect indicating the dimensions of the entire list
+        """
+
+        for label in self.children:
+            label.render()
+
+        self.rect = Rect(self.pos[0], self.pos[1], self.desired_size[0], self.desired_size[1])
+        return self.set_dimensions_from_rect(self.rect)
+
+    def select(self, index):
+        """
+        Selects a row and pages so that it is visible
+        :param index: The index of the row to select
+        """
+
+        self.selected_index = max(0, min(index, self.row_count - 1))
+        self.page.scroll_to(self.get_row_top(self.selected_index))
+
+    def got_focus(self):
+        """
+        Occurs when the control gets focus
+        """
+        self.page.scroll_to(self.get_row_top(self.selected_index))
+
+    def handle_key(self, key):
+        """
+        Handles a keypress
+        :type key: int
+        :param key: The key pressed
+        :return: True if handled; otherwise False
+        """
+
+        if is_up_key(key):
+
+            # At the top, we'll let the page move focus out of the list
+            if self.selected_index > 0:
+                self.select(self.selected_index - 1)
+                return True
+
+        elif is_down_key(key):
+
+            if self.selected_index < self.row_count - 1:
+                self.select(self.selected_index + 1)
+                return True
+
+        elif key in (Keycodes.KEY_PAGEUP, Keycodes.KEY_KP9):
+
+            if self.selected_index > 0:
+                self.select(self.selected_index - self.get_rows_per_page())
+                return True
+
+        elif key in (Keycodes.KEY_PAGEDOWN, Keycodes.KEY_KP3):
+
+            if self.selected_index < self.row_count - 1:
+                self.select(self.selected_index + self.get_rows_per_page())
+                return True
+
+        elif self.row_count > 0 and (is_enter_key(key) or key == Keycodes.KEY_SPACE or is_right_key(key)):
+
+            # Ensure we're not clicking too closely to a prior click event
+            now = datetime.now()
+            if not self.last_click or (now - self.last_click).microseconds >= 300000:
+                self.last_click = now
+                self.play_button_sound()
+                self.state_changed()
+
+            return True
+
+        return super(VirtualListPanel, self).handle_key(key)
@@ -0,0 +1,132 @@
+# coding=utf-8
+
+"""
+Contains a small pool of background threads used to keep slow work off of the rendering thread
+"""
+from Queue import Queue
+from threading import Thread, Event
+import time
+import traceback
+
+__author__ = 'Matt Eland'
+
+
+class WorkItem(object):
+    """
+    A unit of work submitted to a WorkerPool. The UI thread can poll is_done without blocking.
+    """
+
+    def __init__(self, func, args):
+        super(WorkItem, self).__init__()
+
+        self.func = func
+        self.args = args
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.timed_out = False
+        self.completed = Event()
+
+    def execute(self):
+        """
+        Runs the work item on the current thread, capturing its result or error
+        """
+        self.started = time.time()
+
+        try:
+            self.result = self.func(*self.args)
+        except Exception as ex:
+            print('Background work failed: ' + str(ex))
+            traceback.print_exc()
+            self.error = ex
+
+        self.finished = time.time()
+        self.completed.set()
+
+    @property
+    def is_done(self):
+        """
+        :return: True if the work item has finished executing, successfully or not
+        """
+        return self.completed.is_set()
+
+    @property
+    def duration(self):
+        """
+        :return: The number of seconds the work item took to execute or None if it hasn't finished
+        """
+        if self.finished is None:
+            return None
+
+        return self.finished - self.started
+
+    def wait(self, timeout=None):
+        """
+        Blocks until the work item finishes or the timeout elapses
+        :param timeout: The number of seconds to wait or None to wait forever
+        :return: True if the work item completed
+        """
+        return self.completed.wait(timeout)
+
+
+class WorkerThread(Thread):
+    """
+    A thread that executes work items from a shared queue until it receives None
+    """
+
+    def __init__(self, queue, name=None):
+        super(WorkerThread, self).__init__(name=name)
+
+        self.queue = queue
+        self.daemon = True  # Never keep the app alive because of background work
+
+    def run(self):
+        super(WorkerThread, self).run()
+
+        while True:
+            item = self.queue.get()
+
+            if item is None:
+                break
+
+            item.execute()
+
+
+class WorkerPool(object):
+    """
+    A fixed-size pool of worker threads
+    """
+
+    def __init__(self, size=2, name='Worker'):
+        super(WorkerPool, self).__init__()
+
+        self.queue = Queue()
+        self.threads = []
+
+        for index in range(0, size):
+            thread = WorkerThread(self.queue, name='{} {}'.format(name, index + 1))
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, func, *args):
+        """
+        Queues up a function to be called on a background thread
+        :param func: The function to call
+        :param args: Arguments to pass to the function
+        :rtype: WorkItem
+        :return: A WorkItem that can be polled for completion
+        """
+        item = WorkItem(func, args)
+        self.queue.put(item)
+        return item
+
+    def shutdown(self):
+        """
+        Tells all worker threads to stop once they have finished their current work
+        """
+        for thread in self.threads:
+            self.queue.put(None)
+
+        self.threads = []
@@ -1,13 +1,19 @@
 # coding=utf-8
+import sys
+
 import pygame
 
-from PiMFD.Applications.System.SystemApplication import SysApplication
-from PiMFD.Controller import MFDController
+from PiMFD.Startup import startup_profiler
 
 
 __author__ = 'Matt Eland'
 
 
+# Start timing as early as possible so the launcher's own imports are part of the startup profile
+if '--startup-profile' in sys.argv:
+    startup_profiler.start()
+
+
 def start_mfd(display, app_options):
     """
     Initializes Pi-MFD and starts the main execution loop.
@@ -15,16 +21,34 @@ def start_mfd(display, app_options):
     :type app_options: PiMFD.MFDAppOptions Options for the application
     """
 
+    if app_options.startup_profile:
+        startup_profiler.start()
+
+    # The controller pulls in every application, so it isn't imported until we need it
+    from PiMFD.Controller import MFDController
+
     # Start up the graphics engine
-    display.init_graphics(app_options)
-    pygame.key.set_repeat(200, 50)  # Enable repeated keyboard events
+    with startup_profiler.measure('init', 'Graphics'):
+        display.init_graphics(app_options)
+        pygame.key.set_repeat(200, 50)  # Enable repeated keyboard events
 
     # Initialize the controller
-    controller = MFDController(display, app_options)
+    with startup_profiler.measure('init', 'Controller'):
+        controller = MFDController(display, app_options)
 
     # Main Processing Loop
     while not controller.requested_exit:
         controller.execute_main_loop()
 
+        # The startup profile covers the staged boot as well as the first frame
+        if startup_profiler.enabled:
+            startup_profiler.first_frame_shown()
+
+            if controller.boot.is_complete():
+                startup_profiler.mark('Boot complete')
+                startup_profiler.print_report()
+                startup_profiler.stop()
+
     # Shutdown things that require it
-    pygame.quit()
\ No newline at end of file
+    controller.shutdown()
+    pygame.quit()